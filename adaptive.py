@@ -0,0 +1,233 @@
+import math
+
+import numpy as np
+
+# Strategie wyboru operatora przez wielorękiego bandytę
+BANDIT_POLICIES = ("ucb", "epsilon_greedy")
+
+# Domyślne operatory, spośród których wybiera sterowanie adaptacyjne (nazwy metod `GeneticAlgorithm`)
+DEFAULT_SELECTIONS = ("selection_roulette_wheel", "selection_rank", "selection_tournament")
+DEFAULT_CROSSOVERS = ("crossover_one_point", "crossover_two_point")
+
+
+class OperatorBandit:
+    """
+    Wieloręki bandyta wybierający jeden z operatorów (ramion) przed każdym pokoleniem.
+    Nagrody są dyskontowane (`discount` < 1), więc liczy się głównie niedawna skuteczność
+    operatora - w trakcie ewolucji najlepszy operator może się zmieniać.
+
+    Strategie (`BANDIT_POLICIES`):
+    - "ucb": średnia nagroda + premia za rzadko próbowane ramiona (Discounted UCB),
+    - "epsilon_greedy": z prawdopodobieństwem `epsilon` losowe ramię, w przeciwnym razie najlepsze.
+    """
+    def __init__(self, arms, policy="ucb", exploration=0.5, epsilon=0.1, discount=0.95):
+        if policy not in BANDIT_POLICIES:
+            raise ValueError(f"Nieznana strategia bandyty: {policy}. Dostępne: {', '.join(BANDIT_POLICIES)}")
+        if not arms:
+            raise ValueError("Bandyta potrzebuje co najmniej jednego ramienia.")
+        if not 0.0 < discount <= 1.0:
+            raise ValueError("Współczynnik dyskontowania musi być z zakresu (0, 1].")
+        self.arms = list(arms)
+        self.policy = policy
+        self.exploration = exploration
+        self.epsilon = epsilon
+        self.discount = discount
+        self.counts = [0.0] * len(self.arms)   # Zdyskontowana liczba wyborów ramienia
+        self.rewards = [0.0] * len(self.arms)  # Zdyskontowana suma nagród ramienia
+        self.pulls = [0] * len(self.arms)      # Zwykła liczba wyborów (do raportu)
+
+    def select(self, rng):
+        """Wybiera ramię generatorem `rng` (np. `random.Random`). Zwraca jego indeks."""
+        # Każde ramię próbujemy przynajmniej raz
+        for index, count in enumerate(self.counts):
+            if count == 0.0:
+                return index
+
+        if self.policy == "epsilon_greedy":
+            if rng.random() < self.epsilon:
+                return rng.randrange(len(self.arms))
+            return max(range(len(self.arms)), key=lambda index: self.rewards[index] / self.counts[index])
+
+        log_total = math.log(sum(self.counts))
+        return max(range(len(self.arms)), key=lambda index: self.rewards[index] / self.counts[index]
+                   + self.exploration * math.sqrt(2 * max(log_total, 0.0) / self.counts[index]))
+
+    def update(self, index, reward):
+        """Zapisuje nagrodę wybranego ramienia (starsze nagrody wszystkich ramion tracą na wadze)."""
+        discount = self.discount
+        self.counts = [count * discount for count in self.counts]
+        self.rewards = [total * discount for total in self.rewards]
+        self.counts[index] += 1.0
+        self.rewards[index] += reward
+        self.pulls[index] += 1
+
+    def state(self):
+        """Stan bandyty jako słownik zgodny z JSON (do punktów kontrolnych)."""
+        return {"counts": self.counts, "rewards": self.rewards, "pulls": self.pulls}
+
+    def load_state(self, state):
+        """Przywraca stan zapisany przez `state`."""
+        self.counts = list(state["counts"])
+        self.rewards = list(state["rewards"])
+        self.pulls = list(state["pulls"])
+
+
+class AdaptiveControl:
+    """
+    Sterowanie adaptacyjne w trakcie jednej ewolucji (zamiast osobnych uruchomień dla każdej
+    wartości parametru):
+    - przed każdym pokoleniem dwóch bandytów (`OperatorBandit`) wybiera metodę selekcji
+      i krzyżowania; nagrodą jest odsetek dzieci lepszych od mediany poprzedniej populacji,
+    - po każdym pokoleniu prawdopodobieństwa mutacji i krzyżowania są zwiększane, gdy
+      różnorodność spadła poniżej `target_diversity` i jednocześnie najlepszy wynik nie poprawił się
+      od `stall_generations` pokoleń (populacja utknęła), a w przeciwnym razie zmniejszane.
+      Prawdopodobieństwo mutacji nie wychodzi poza granice `mutation_bounds`; domyślnie są to
+      krotności `mutation_range` prawdopodobieństwa ustawionego w algorytmie na starcie
+      (0.25x do 4x, ale nie więcej niż 1), więc skonfigurowana wartość zawsze leży w granicach.
+      Jawne `mutation_bounds` obowiązują od pierwszego pokolenia: wartość startowa spoza nich
+      zostanie przycięta do najbliższej granicy.
+    Wybory z każdego pokolenia trafiają do `schedule` (patrz też `summary`).
+    """
+    def __init__(self, selections=DEFAULT_SELECTIONS, crossovers=DEFAULT_CROSSOVERS, policy="ucb",
+                 exploration=0.5, epsilon=0.1, discount=0.95, adapt_rates=True, target_diversity=0.05,
+                 stall_generations=10, mutation_bounds=None, mutation_range=(0.25, 4.0),
+                 crossover_bounds=(0.5, 1.0), mutation_factor=1.2, crossover_step=0.02):
+        if mutation_bounds is not None and not 0.0 <= mutation_bounds[0] <= mutation_bounds[1] <= 0.1:
+            raise ValueError("Granice prawdopodobieństwa mutacji muszą leżeć w zakresie [0, 0.1].")
+        if not 0.0 < mutation_range[0] <= 1.0 <= mutation_range[1]:
+            raise ValueError("Zakres mutacji to krotności (dolna w (0, 1], górna co najmniej 1).")
+        if not 0.5 <= crossover_bounds[0] <= crossover_bounds[1] <= 1.0:
+            raise ValueError("Granice prawdopodobieństwa krzyżowania muszą leżeć w zakresie [0.5, 1].")
+        self.settings = {
+            "selections": list(selections), "crossovers": list(crossovers), "policy": policy,
+            "exploration": exploration, "epsilon": epsilon, "discount": discount,
+            "adapt_rates": adapt_rates, "target_diversity": target_diversity,
+            "stall_generations": stall_generations, "crossover_bounds": list(crossover_bounds),
+            "mutation_bounds": list(mutation_bounds) if mutation_bounds is not None else None,
+            "mutation_range": list(mutation_range),
+            "mutation_factor": mutation_factor,
+            "crossover_step": crossover_step,
+        }
+        self.selection_bandit = OperatorBandit(selections, policy, exploration, epsilon, discount)
+        self.crossover_bandit = OperatorBandit(crossovers, policy, exploration, epsilon, discount)
+        self.adapt_rates = adapt_rates
+        self.target_diversity = target_diversity
+        self.stall_generations = stall_generations
+        self.mutation_bounds = mutation_bounds
+        self.mutation_range = mutation_range
+        self.crossover_bounds = crossover_bounds
+        self.mutation_factor = mutation_factor
+        self.crossover_step = crossover_step
+        self.start()
+
+    def start(self):
+        """Zeruje stan przed nową ewolucją (statystyki bandytów, harmonogram, ostatnia poprawa)."""
+        for bandit in (self.selection_bandit, self.crossover_bandit):
+            bandit.load_state({"counts": [0.0] * len(bandit.arms), "rewards": [0.0] * len(bandit.arms),
+                               "pulls": [0] * len(bandit.arms)})
+        self.best_fitness = None
+        self.last_improvement = 0
+        self.choice = None
+        self.schedule = []
+
+    def choose(self, rng):
+        """Wybiera operatory na bieżące pokolenie. Zwraca parę nazw (selekcja, krzyżowanie)."""
+        self.choice = (self.selection_bandit.select(rng), self.crossover_bandit.select(rng))
+        return self.selection_bandit.arms[self.choice[0]], self.crossover_bandit.arms[self.choice[1]]
+
+    def reward(self, previous_fitness, offspring_fitness):
+        """Nagroda pokolenia: odsetek dzieci z fitnessem wyższym niż mediana poprzedniej populacji."""
+        if len(offspring_fitness) == 0:
+            return 0.0
+        return float(np.mean(np.asarray(offspring_fitness) > np.median(previous_fitness)))
+
+    def record(self, ga, generation, previous_fitness, offspring_fitness):
+        """
+        Po pokoleniu `generation`: nagradza wybrane operatory, dopasowuje prawdopodobieństwa
+        mutacji i krzyżowania algorytmu `ga` i dopisuje wpis do harmonogramu.
+        """
+        reward = self.reward(previous_fitness, offspring_fitness)
+        selection_index, crossover_index = self.choice
+        self.selection_bandit.update(selection_index, reward)
+        self.crossover_bandit.update(crossover_index, reward)
+
+        entry = {
+            "generation": generation,
+            "selection": self.selection_bandit.arms[selection_index],
+            "crossover": self.crossover_bandit.arms[crossover_index],
+            "mutation_prob": ga.mutation_prob,
+            "crossover_prob": ga.crossover_prob,
+            "reward": reward,
+        }
+
+        if self.adapt_rates:
+            best_fitness = float(np.max(ga.fitness_array()))
+            if self.best_fitness is None or best_fitness > self.best_fitness:
+                self.best_fitness = best_fitness
+                self.last_improvement = generation
+            diversity = float(ga.diversity())
+            stalled = generation - self.last_improvement >= self.stall_generations
+            explore = diversity < self.target_diversity and stalled
+            entry["diversity"] = diversity
+
+            # Populacja utknęła: więcej mutacji i krzyżowania; w przeciwnym razie mniej
+            # Prawdopodobieństwo startowe to wartość z pierwszego wpisu harmonogramu (także po wznowieniu)
+            base_prob = self.schedule[0]["mutation_prob"] if self.schedule else entry["mutation_prob"]
+            low, high = self.mutation_bounds or self.default_mutation_bounds(base_prob, ga.chromosome_length)
+            factor = self.mutation_factor if explore else 1 / self.mutation_factor
+            ga.mutation_prob = min(high, max(low, ga.mutation_prob * factor))
+            low, high = self.crossover_bounds
+            step = self.crossover_step if explore else -self.crossover_step
+            ga.crossover_prob = min(high, max(low, ga.crossover_prob + step))
+
+        self.schedule.append(entry)
+
+    def default_mutation_bounds(self, base_prob, length):
+        """
+        Domyślne granice prawdopodobieństwa mutacji wokół prawdopodobieństwa startowego `base_prob`
+        (krotności `mutation_range`). Przy `base_prob` równym 0 granice zależą od długości chromosomu
+        `length`: od 0.25 do 4 odwróconych genów na osobnika.
+        """
+        if base_prob <= 0:
+            return 0.25 / length, min(0.1, 4 / length)
+        low, high = self.mutation_range
+        return base_prob * low, min(1.0, base_prob * high)
+
+    def summary(self):
+        """
+        Podsumowanie harmonogramu: ile razy wybrano każdy operator oraz średnie
+        i końcowe prawdopodobieństwa mutacji i krzyżowania.
+        """
+        schedule = self.schedule
+        result = {
+            "generations": len(schedule),
+            "selection": dict(zip(self.selection_bandit.arms, self.selection_bandit.pulls)),
+            "crossover": dict(zip(self.crossover_bandit.arms, self.crossover_bandit.pulls)),
+        }
+        if schedule:
+            for key in ("mutation_prob", "crossover_prob"):
+                result[f"mean_{key}"] = sum(entry[key] for entry in schedule) / len(schedule)
+                result[f"final_{key}"] = schedule[-1][key]
+        return result
+
+    def state(self):
+        """Pełny stan (ustawienia, bandyci, harmonogram) zgodny z JSON (do punktów kontrolnych)."""
+        return {
+            "settings": self.settings,
+            "selection_bandit": self.selection_bandit.state(),
+            "crossover_bandit": self.crossover_bandit.state(),
+            "best_fitness": self.best_fitness,
+            "last_improvement": self.last_improvement,
+            "schedule": self.schedule,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Tworzy sterowanie ze stanu zapisanego przez `state`."""
+        control = cls(**state["settings"])
+        control.selection_bandit.load_state(state["selection_bandit"])
+        control.crossover_bandit.load_state(state["crossover_bandit"])
+        control.best_fitness = state["best_fitness"]
+        control.last_improvement = state["last_improvement"]
+        control.schedule = list(state["schedule"])
+        return control
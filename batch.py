@@ -0,0 +1,209 @@
+import argparse
+import glob
+import json
+import os
+import random
+
+from experiments import (DEFAULT_CROSSOVER_RATES, DEFAULT_MUTATION_RATES, ENGINES, EXPERIMENTS,
+                         STANDARD_EXPERIMENTS, build_standard_experiments, check_engine_options,
+                         record_experiments)
+from genotypes import REPRESENTATIONS
+from go_knapsack import REPAIR_MODES, REPLACEMENT_MODES, load_optimum
+from history_store import HistoryStore
+from main import default_parameters, detect_file_type
+
+# Klucze pliku konfiguracyjnego (JSON) odpowiadają nazwom argumentów z linii poleceń,
+# np. {"instances": ["large_scale/*"], "experiments": ["selection"], "population_size": 150}.
+
+
+def build_parser():
+    """Tworzy parser argumentów linii poleceń."""
+    parser = argparse.ArgumentParser(
+        description="Wsadowe (bez okien i pytań) uruchamianie eksperymentów algorytmu genetycznego.")
+    parser.add_argument("instances", nargs="*", help="Ścieżki lub wzorce glob plików z danymi.")
+    parser.add_argument("--config", help="Plik JSON z wartościami argumentów (argumenty z linii poleceń mają pierwszeństwo).")
+    parser.add_argument("--experiments", nargs="+", default=list(STANDARD_EXPERIMENTS), choices=EXPERIMENTS)
+    parser.add_argument("--population-size", type=int, help="Domyślnie z `get_recommendations` dla typu pliku.")
+    parser.add_argument("--iterations", type=int, help="Domyślnie z `get_recommendations` dla typu pliku.")
+    parser.add_argument("--mutation-prob", type=float, help="Bazowe prawdopodobieństwo mutacji.")
+    parser.add_argument("--crossover-prob", type=float, help="Bazowe prawdopodobieństwo krzyżowania.")
+    parser.add_argument("--mutation-rates", nargs="+", type=float, default=DEFAULT_MUTATION_RATES)
+    parser.add_argument("--crossover-rates", nargs="+", type=float, default=DEFAULT_CROSSOVER_RATES)
+    parser.add_argument("--engine", default="python", choices=list(ENGINES))
+    parser.add_argument("--representation", choices=list(REPRESENTATIONS),
+                        help="Reprezentacja genotypu (tylko silnik python; domyślnie lista).")
+    parser.add_argument("--repair-mode", choices=REPAIR_MODES,
+                        help="Naprawa niepoprawnych osobników (tylko silnik python; domyślnie bez naprawy).")
+    parser.add_argument("--elitism", type=int, default=0, help="Liczba najlepszych osobników przenoszonych bez zmian.")
+    parser.add_argument("--replacement", default="generational", choices=REPLACEMENT_MODES)
+    parser.add_argument("--steady-state-size", type=int, help="Liczba dzieci na pokolenie w trybie steady_state.")
+    parser.add_argument("--local-search", type=float, metavar="FRACTION",
+                        help="Odsetek najlepszych osobników ulepszanych przeszukiwaniem lokalnym.")
+    parser.add_argument("--local-search-budget", type=int, help="Liczba sprawdzanych ruchów na pokolenie.")
+    parser.add_argument("--adaptive-mutation-bounds", nargs=2, type=float, metavar=("LOW", "HIGH"),
+                        help="Granice mutacji w eksperymencie adaptive (domyślnie 0.25x-4x bazowego "
+                             "prawdopodobieństwa mutacji).")
+    parser.add_argument("--reduce", action="store_true",
+                        help="Przed ewolucją ustal zmienne ograniczeniem LP i ewoluuj tylko rdzeń instancji.")
+    parser.add_argument("--binary-cache", action="store_true",
+                        help="Wczytuj instancje z binarnych kopii .npy (tworzonych przy pierwszym wczytaniu).")
+    parser.add_argument("--seed", type=int, help="Ziarno bazowe (domyślnie losowe).")
+    parser.add_argument("--workers", type=int, help="Liczba procesów (domyślnie liczba rdzeni).")
+    parser.add_argument("--output-dir", default="results", help="Katalog na wyniki (JSON) i wykresy.")
+    parser.add_argument("--plot", action="store_true", help="Zapisz wykresy PNG (matplotlib, backend Agg).")
+    parser.add_argument("--checkpoint-dir", help="Katalog punktów kontrolnych (wznawianie przerwanych serii).")
+    parser.add_argument("--checkpoint-interval", type=int, default=50)
+    parser.add_argument("--history-store",
+                        help="Katalog magazynu historii (statystyki pokoleń w kolumnach .npy); "
+                             "domyślnie <output-dir>/histories.")
+    return parser
+
+
+def parse_arguments(argv=None):
+    """
+    Parsuje argumenty; jeśli podano `--config`, wartości z pliku stają się domyślnymi,
+    a argumenty z linii poleceń je nadpisują.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.config:
+        with open(args.config, 'r') as f:
+            config = json.load(f)
+        unknown = [key for key in config if not hasattr(args, key)]
+        if unknown:
+            parser.error(f"Nieznane klucze w pliku konfiguracyjnym: {', '.join(unknown)}")
+        parser.set_defaults(**config)
+        args = parser.parse_args(argv)
+        if not args.instances:
+            args.instances = config.get("instances", [])
+    if not args.instances:
+        parser.error("Nie podano żadnych plików z danymi.")
+    try:
+        check_engine_options(args.engine, representation=args.representation, repair_mode=args.repair_mode)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def expand_instances(patterns):
+    """Zamienia ścieżki i wzorce glob na posortowaną listę istniejących plików (bez duplikatów)."""
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern)
+        if not matches:
+            print(f"OSTRZEŻENIE: Brak plików pasujących do: {pattern}")
+        paths.update(path for path in matches if os.path.isfile(path))
+    return sorted(paths)
+
+
+def instance_parameters(data_file, args):
+    """Parametry bazowe dla pliku: jawnie podane w argumentach albo zalecane dla typu pliku."""
+    defaults = default_parameters(detect_file_type(data_file))
+    return {
+        "population_size": args.population_size or defaults["pop_size"],
+        "iterations": args.iterations or defaults["iterations"],
+        "mutation_prob": args.mutation_prob if args.mutation_prob is not None else defaults["mutation_prob"],
+        "crossover_prob": args.crossover_prob if args.crossover_prob is not None else defaults["crossover_prob"],
+    }
+
+
+def find_optimum(data_file):
+    """Wartość optymalna z pliku `*-optimum` lub None, jeśli go nie ma."""
+    try:
+        return load_optimum(data_file)
+    except FileNotFoundError:
+        print(f"OSTRZEŻENIE: Nie znaleziono pliku optimum dla {data_file}. Wykresy będą bez linii optimum.")
+        return None
+
+
+def save_results(path, data_file, parameters, base_seed, optimum, experiments, store, run_keys):
+    """
+    Zapisuje historie wszystkich uruchomień jednego pliku do JSON. Historie i powody zakończenia
+    pochodzą z indeksu magazynu `store` (`run_keys`: id konfiguracji -> klucz uruchomienia).
+    """
+    runs = []
+    for name, _, configs in experiments:
+        for config in configs:
+            entry = store.find(run_keys[id(config)])
+            runs.append({
+                "experiment": name,
+                "label": config.label,
+                "selection": config.selection,
+                "crossover": config.crossover,
+                "mutation_prob": config.mutation_prob,
+                "crossover_prob": config.crossover_prob,
+                "seed": config.seed,
+                "stop_reason": entry["stop_reason"],
+                "history": store.values(entry),
+                # Harmonogram operatorów i parametrów (tylko przy sterowaniu adaptacyjnym)
+                "schedule": entry.get("schedule"),
+            })
+    with open(path, 'w') as f:
+        json.dump({"instance": data_file, "parameters": parameters, "base_seed": base_seed,
+                   "optimum": optimum, "runs": runs}, f)
+
+
+# --- Uruchomienie z linii poleceń ---
+if __name__ == "__main__":
+    args = parse_arguments()
+    data_files = expand_instances(args.instances)
+    os.makedirs(args.output_dir, exist_ok=True)
+    if args.checkpoint_dir:
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+    local_search = None
+    if args.local_search is not None:
+        local_search = {"fraction": args.local_search, "budget": args.local_search_budget}
+    adaptive_options = None
+    if args.adaptive_mutation_bounds is not None:
+        adaptive_options = {"mutation_bounds": args.adaptive_mutation_bounds}
+
+    plot_results = None
+    if args.plot:
+        # Backend bez okien musi być wybrany przed pierwszym importem matplotlib.pyplot
+        import matplotlib
+        matplotlib.use("Agg")
+        from main import plot_results
+
+    base_seed = args.seed if args.seed is not None else random.randrange(2**32)
+    print(f"Ziarno bazowe eksperymentów: {base_seed}")
+
+    # Konfiguracje wszystkich plików uruchamiane są w jednej puli procesów
+    plan = []
+    all_configs = []
+    for data_file in data_files:
+        parameters = instance_parameters(data_file, args)
+        experiments = build_standard_experiments(
+            data_file, parameters["population_size"], parameters["iterations"],
+            parameters["mutation_prob"], parameters["crossover_prob"], base_seed + len(all_configs),
+            engine=args.engine, experiments=args.experiments,
+            mutation_rates=args.mutation_rates, crossover_rates=args.crossover_rates,
+            checkpoint_dir=args.checkpoint_dir, checkpoint_interval=args.checkpoint_interval,
+            replacement_options={"elitism": args.elitism, "replacement": args.replacement,
+                                 "steady_state_size": args.steady_state_size},
+            local_search=local_search, reduce=args.reduce, binary_cache=args.binary_cache,
+            adaptive_options=adaptive_options, representation=args.representation,
+            repair_mode=args.repair_mode
+        )
+        plan.append((data_file, parameters, base_seed + len(all_configs), experiments))
+        all_configs.extend(config for _, _, configs in experiments for config in configs)
+
+    print(f"--- Uruchamianie {len(all_configs)} ewolucji dla {len(data_files)} plików ---")
+    # Każda historia trafia do magazynu zaraz po zakończeniu uruchomienia; wyniki i wykresy czytają ją z dysku
+    history_store = args.history_store or os.path.join(args.output_dir, "histories")
+    with HistoryStore(history_store) as store:
+        run_keys = {id(config): key for config, key in record_experiments(all_configs, store, max_workers=args.workers)}
+        print(f"Historie zapisano w magazynie: {history_store}")
+
+        for data_file, parameters, file_seed, experiments in plan:
+            optimum = find_optimum(data_file)
+            name = os.path.basename(data_file)
+            results_path = os.path.join(args.output_dir, f"{name}.json")
+            save_results(results_path, data_file, parameters, file_seed, optimum, experiments, store, run_keys)
+
+            print(f"\n{data_file} (optimum: {optimum}) -> {results_path}")
+            for experiment, title, configs in experiments:
+                for config in configs:
+                    print(f"  {config.label}: najlepszy fitness = {max(store.values(run_keys[id(config)]))}")
+                if plot_results is not None:
+                    plot_results({config.label: store.load(run_keys[id(config)]) for config in configs}, title,
+                                 optimum, output_path=os.path.join(args.output_dir, f"{name}_{experiment}.png"))
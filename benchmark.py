@@ -0,0 +1,224 @@
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from genotypes import BitsetRepresentation, ListRepresentation
+from go_knapsack import GeneticAlgorithm, load_instance, load_optimum
+from main import default_parameters, detect_file_type
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+# Katalogi z instancjami, dla których istnieją pliki optimum
+DEFAULT_INSTANCE_PATTERNS = ["low-dimensional/*", "large_scale/*"]
+
+# Porównywane silniki: nazwa -> funkcja tworząca algorytm (instancja, parametry, ziarno)
+BENCHMARK_ENGINES = {
+    "python-list": lambda instance, params, seed: GeneticAlgorithm(
+        instance, params["pop_size"], params["crossover_prob"], params["mutation_prob"], params["iterations"],
+        representation=ListRepresentation(), seed=seed),
+    "python-bitset": lambda instance, params, seed: GeneticAlgorithm(
+        instance, params["pop_size"], params["crossover_prob"], params["mutation_prob"], params["iterations"],
+        representation=BitsetRepresentation(), seed=seed),
+    "numpy": lambda instance, params, seed: VectorizedGeneticAlgorithm(
+        instance, params["pop_size"], params["crossover_prob"], params["mutation_prob"], params["iterations"],
+        seed=seed),
+}
+
+DEFAULT_SELECTIONS = ["selection_roulette_wheel", "selection_rank"]
+DEFAULT_CROSSOVERS = ["crossover_one_point"]
+
+# Metryki porównywane z bazą: nazwa -> czy większa wartość jest lepsza
+COMPARED_METRICS = {
+    "generations_per_s": True,
+    "evaluations_per_s": True,
+    "peak_memory_kb": False,
+    "final_gap": False,
+}
+
+
+def run_once(instance, engine, selection, crossover, params, seed, measure_memory=False, target_fitness=None):
+    """
+    Jedno uruchomienie ewolucji. Zwraca (historia, czas w sekundach, liczba ocen, szczyt pamięci w KB).
+    Pamięć mierzona jest przez tracemalloc tylko na życzenie, bo spowalnia obliczenia.
+    Z `target_fitness` ewolucja kończy się po osiągnięciu tego fitnessu (`history.stop_reason`
+    == "target_fitness"), więc zmierzony czas jest wtedy rzeczywistym czasem dojścia do celu.
+    """
+    if measure_memory:
+        tracemalloc.start()
+
+    # Komunikaty o postępie ewolucji nie są potrzebne w benchmarku
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        ga = BENCHMARK_ENGINES[engine](instance, params, seed)
+        if target_fitness is not None:
+            ga.set_stopping_criteria(target_fitness=target_fitness)
+        history = ga.run_evolution(getattr(ga, selection), getattr(ga, crossover))
+        elapsed = time.perf_counter() - start
+
+    peak_memory_kb = None
+    if measure_memory:
+        peak_memory_kb = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return history, elapsed, ga.evaluations, peak_memory_kb
+
+
+def benchmark_configuration(data_file, engine, selection, crossover, seeds, binary_cache=False):
+    """
+    Uruchamia jedną konfigurację dla wszystkich ziaren i zwraca listę rekordów z metrykami.
+    `binary_cache` wczytuje instancję z binarnej kopii .npy (patrz `go_knapsack.load_instance`).
+    """
+    instance = load_instance(data_file, binary_cache)
+    optimum = load_optimum(data_file)
+    params = default_parameters(detect_file_type(data_file))
+
+    # Szczyt pamięci mierzymy w osobnym przebiegu (pierwsze ziarno), żeby nie zaburzać pomiaru czasu
+    _, _, _, peak_memory_kb = run_once(instance, engine, selection, crossover, params, seeds[0],
+                                       measure_memory=True, target_fitness=optimum)
+
+    records = []
+    for seed in seeds:
+        # Ewolucja kończy się po osiągnięciu optimum, więc czas do optimum jest mierzony, a nie szacowany
+        history, elapsed, evaluations, _ = run_once(instance, engine, selection, crossover, params, seed,
+                                                    target_fitness=optimum)
+        generations = len(history)
+        final_best = history[-1]
+
+        generation_to_optimum = None
+        time_to_optimum = None
+        if history.stop_reason == "target_fitness":
+            generation_to_optimum = generations - 1
+            time_to_optimum = elapsed
+
+        records.append({
+            "instance": data_file,
+            "engine": engine,
+            "selection": selection,
+            "crossover": crossover,
+            "seed": seed,
+            "generations": generations,
+            "elapsed_s": elapsed,
+            "generations_per_s": generations / elapsed,
+            "evaluations": evaluations,
+            "evaluations_per_s": evaluations / elapsed,
+            "peak_memory_kb": peak_memory_kb,
+            "optimum": optimum,
+            "final_best": final_best,
+            # Niepoprawne rozwiązanie (fitness < 1) liczymy jako pełną lukę
+            "final_gap": (optimum - final_best) / optimum if final_best >= 1 else 1.0,
+            "generation_to_optimum": generation_to_optimum,
+            "time_to_optimum_s": time_to_optimum,
+        })
+    return records
+
+
+def summarize(records):
+    """Agreguje rekordy po konfiguracji (średnie po ziarnach). Zwraca słownik klucz -> metryki."""
+    groups = {}
+    for record in records:
+        key = f"{record['instance']}|{record['engine']}|{record['selection']}|{record['crossover']}"
+        groups.setdefault(key, []).append(record)
+
+    summary = {}
+    for key, group in groups.items():
+        reached = [r["time_to_optimum_s"] for r in group if r["time_to_optimum_s"] is not None]
+        summary[key] = {
+            "runs": len(group),
+            "generations_per_s": sum(r["generations_per_s"] for r in group) / len(group),
+            "evaluations_per_s": sum(r["evaluations_per_s"] for r in group) / len(group),
+            "peak_memory_kb": group[0]["peak_memory_kb"],
+            "final_gap": sum(r["final_gap"] for r in group) / len(group),
+            "optimum_rate": len(reached) / len(group),
+            "mean_time_to_optimum_s": sum(reached) / len(reached) if reached else None,
+        }
+    return summary
+
+
+def compare_with_baseline(summary, baseline, tolerance):
+    """
+    Porównuje bieżące wyniki z zapisaną bazą. Zwraca listę opisów regresji:
+    spadek przepustowości lub wzrost pamięci o więcej niż `tolerance` (względnie)
+    albo wzrost średniej luki do optimum o więcej niż `tolerance` (bezwzględnie).
+    """
+    regressions = []
+    for key, current in summary.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = reference.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            if metric == "final_gap":
+                worse = new - old > tolerance
+            elif higher_is_better:
+                worse = new < old * (1 - tolerance)
+            else:
+                worse = new > old * (1 + tolerance)
+            if worse:
+                regressions.append(f"{key}: {metric} {old:.4g} -> {new:.4g}")
+    return regressions
+
+
+def write_csv(records, path):
+    """Zapisuje wszystkie rekordy (po jednym na uruchomienie) do pliku CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0].keys()))
+        writer.writeheader()
+        writer.writerows(records)
+
+
+# --- Uruchomienie z linii poleceń ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark wydajności i jakości algorytmu genetycznego.")
+    parser.add_argument("--instances", nargs="+", default=DEFAULT_INSTANCE_PATTERNS,
+                        help="Ścieżki lub wzorce glob plików z danymi (muszą mieć pliki optimum).")
+    parser.add_argument("--engines", nargs="+", default=list(BENCHMARK_ENGINES), choices=list(BENCHMARK_ENGINES))
+    parser.add_argument("--selections", nargs="+", default=DEFAULT_SELECTIONS)
+    parser.add_argument("--crossovers", nargs="+", default=DEFAULT_CROSSOVERS)
+    parser.add_argument("--seeds", type=int, default=3, help="Liczba ziaren (uruchomień) na konfigurację.")
+    parser.add_argument("--binary-cache", action="store_true",
+                        help="Wczytuj instancje z binarnych kopii .npy (tworzonych przy pierwszym wczytaniu).")
+    parser.add_argument("--output-json", default="benchmark_results.json")
+    parser.add_argument("--output-csv", default="benchmark_results.csv")
+    parser.add_argument("--baseline", help="Plik JSON z wcześniejszymi wynikami do porównania.")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Dopuszczalne pogorszenie metryk względem bazy (domyślnie 0.1 = 10%%).")
+    args = parser.parse_args()
+
+    data_files = sorted(path for pattern in args.instances for path in glob.glob(pattern) if os.path.isfile(path))
+    seeds = list(range(args.seeds))
+
+    all_records = []
+    for data_file in data_files:
+        for engine in args.engines:
+            for selection in args.selections:
+                for crossover in args.crossovers:
+                    records = benchmark_configuration(data_file, engine, selection, crossover, seeds,
+                                                      args.binary_cache)
+                    all_records.extend(records)
+                    print(f"{data_file} | {engine} | {selection} | {crossover}: "
+                          f"{sum(r['generations_per_s'] for r in records) / len(records):.1f} gen/s, "
+                          f"luka {sum(r['final_gap'] for r in records) / len(records):.2%}")
+
+    summary = summarize(all_records)
+    with open(args.output_json, 'w') as f:
+        json.dump({"records": all_records, "summary": summary}, f, indent=2)
+    write_csv(all_records, args.output_csv)
+    print(f"Zapisano wyniki: {args.output_json}, {args.output_csv}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)["summary"]
+        regressions = compare_with_baseline(summary, baseline, args.tolerance)
+        if regressions:
+            print("REGRESJE względem bazy:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("Brak regresji względem bazy.")
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# Wersja formatu pliku punktu kontrolnego (zmieniana przy niekompatybilnych zmianach)
+CHECKPOINT_VERSION = 1
+
+
+def encode_numbers(numbers):
+    """
+    Zamienia listę liczb (int dla poprawnych rozwiązań, float dla niepoprawnych)
+    na tablicę float64 i maskę "czy int", aby po odczycie odtworzyć dokładnie te same typy.
+    """
+    values = np.array(numbers, dtype=np.float64)
+    is_int = np.array([isinstance(x, (int, np.integer)) for x in numbers], dtype=bool)
+    return values, is_int
+
+
+def decode_numbers(values, is_int):
+    """Odwrotność `encode_numbers`: zwraca listę int-ów i float-ów Pythona."""
+    return [int(x) if flag else float(x) for x, flag in zip(values.tolist(), is_int.tolist())]
+
+
+def pack_random_state(state):
+    """
+    Rozkłada stan generatora `random.getstate()` (wersja, 625 słów Mersenne Twistera,
+    zapamiętana wartość gauss) na tablicę uint32 i słownik z pozostałymi polami.
+    """
+    version, internal_state, gauss_next = state
+    return np.array(internal_state, dtype=np.uint32), {"version": version, "gauss_next": gauss_next}
+
+
+def unpack_random_state(words, meta):
+    """Odtwarza krotkę dla `random.setstate` z wyniku `pack_random_state`."""
+    return meta["version"], tuple(int(word) for word in words), meta["gauss_next"]
+
+
+def instance_digest(instance):
+    """Skrót SHA-1 danych instancji; pozwala sprawdzić, że wznawiamy na tym samym problemie."""
+    digest = hashlib.sha1()
+    digest.update(str(instance.capacity).encode())
+    digest.update(instance.values.tobytes())
+    digest.update(instance.weights.tobytes())
+    return digest.hexdigest()
+
+
+def save_checkpoint(path, arrays, meta):
+    """
+    Zapisuje punkt kontrolny jako nieskompresowany plik .npz: tablice NumPy
+    oraz metadane w postaci JSON. Zapis odbywa się do pliku tymczasowego,
+    który następnie atomowo zastępuje poprzedni, więc przerwanie procesu
+    w trakcie zapisu nie niszczy ostatniego poprawnego punktu kontrolnego.
+    """
+    meta = dict(meta, version=CHECKPOINT_VERSION)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path):
+    """Wczytuje punkt kontrolny zapisany przez `save_checkpoint`. Zwraca krotkę (tablice, metadane)."""
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files if name != "meta"}
+        meta = json.loads(str(data["meta"]))
+    if meta.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Nieobsługiwana wersja punktu kontrolnego: {meta.get('version')} (plik {path}).")
+    return arrays, meta
@@ -0,0 +1,183 @@
+import argparse
+import os
+
+import numpy as np
+
+from go_knapsack import load_instance, optimum_file_path
+
+# Maksymalny rozmiar tablicy DP (n * capacity), powyżej którego `solve` wybiera branch-and-bound
+DP_SIZE_LIMIT = 50_000_000
+
+
+def solve_dp(capacity, values, weights, return_solution=False):
+    """
+    Dokładne rozwiązanie problemu plecakowego 0/1 programowaniem dynamicznym po pojemności.
+    Używa jednej "tocznej" tablicy `best[c]` (najlepsza wartość dla pojemności c),
+    aktualizowanej wektorowo dla każdego przedmiotu, więc pamięć to O(capacity), a nie O(n * capacity).
+
+    :param return_solution: Jeśli True, zapamiętuje też decyzje (1 bit na przedmiot i pojemność),
+                            aby odtworzyć genotyp optymalnego rozwiązania.
+    :return: Krotka (wartość optymalna, genotyp jako lista 0/1 lub None).
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    n = len(values)
+
+    best = np.zeros(capacity + 1, dtype=np.int64)
+    # Decyzje "weź przedmiot i przy pojemności c" upakowane po 8 na bajt
+    decisions = np.zeros((n, (capacity + 8) // 8), dtype=np.uint8) if return_solution else None
+
+    for i in range(n):
+        value, weight = int(values[i]), int(weights[i])
+        if weight > capacity or value <= 0:
+            continue
+        # Kandydat: weź przedmiot i (wartości dla pojemności c - weight sprzed tej iteracji)
+        candidate = best[:capacity + 1 - weight] + value
+        improved = candidate > best[weight:]
+        if return_solution:
+            taken = np.zeros(capacity + 1, dtype=bool)
+            taken[weight:] = improved
+            decisions[i] = np.packbits(taken, bitorder='little')
+        best[weight:] = np.where(improved, candidate, best[weight:])
+
+    optimum = int(best[capacity])
+    if not return_solution:
+        return optimum, None
+
+    # Odtworzenie rozwiązania: od ostatniego przedmiotu wstecz
+    genotype = [0] * n
+    remaining = capacity
+    for i in range(n - 1, -1, -1):
+        if (decisions[i][remaining >> 3] >> (remaining & 7)) & 1:
+            genotype[i] = 1
+            remaining -= int(weights[i])
+    return optimum, genotype
+
+
+def dantzig_bound(capacity, values, weights, order, start, current_value):
+    """
+    Górne ograniczenie LP (Dantzig) dla przedmiotów `order[start:]` posortowanych malejąco
+    według stosunku wartość/waga: bierzemy przedmioty w całości, dopóki się mieszczą,
+    a z pierwszego niemieszczącego się ("break item") bierzemy ułamek.
+    """
+    for position in range(start, len(order)):
+        i = order[position]
+        if weights[i] > capacity:
+            return current_value + capacity * values[i] // weights[i]
+        capacity -= weights[i]
+        current_value += values[i]
+    return current_value
+
+
+def solve_branch_and_bound(capacity, values, weights, max_nodes=None):
+    """
+    Dokładne rozwiązanie metodą podziału i ograniczeń w stylu Martello-Toth (schemat Horowitza-Sahniego):
+    przeszukiwanie w głąb przedmiotów posortowanych według stosunku wartość/waga,
+    z odcinaniem gałęzi, których ograniczenie Dantziga nie przekracza najlepszego rozwiązania.
+    Nie zależy od wielkości pojemności, więc nadaje się tam, gdzie tablica DP byłaby za duża.
+
+    :param max_nodes: (Opcjonalnie) Limit odwiedzonych węzłów; po jego przekroczeniu
+                      zwracane jest najlepsze dotąd znalezione rozwiązanie.
+    :return: Krotka (wartość, genotyp jako lista 0/1, czy_optymalne).
+    """
+    values = [int(v) for v in values]
+    weights = [int(w) for w in weights]
+    n = len(values)
+
+    # Przedmioty o zerowej wadze zawsze opłaca się wziąć
+    free = [i for i in range(n) if weights[i] == 0 and values[i] > 0]
+    order = sorted((i for i in range(n) if 0 < weights[i] <= capacity and values[i] > 0),
+                   key=lambda i: values[i] / weights[i], reverse=True)
+    m = len(order)
+
+    chosen = [0] * m  # Bieżące decyzje dla kolejnych pozycji w `order`
+    best_value = 0
+    best_chosen = [0] * m
+    current_weight = 0
+    current_value = 0
+    position = 0
+    nodes = 0
+    optimal = True
+
+    while True:
+        nodes += 1
+        if max_nodes is not None and nodes > max_nodes:
+            optimal = False
+            break
+
+        bound = dantzig_bound(capacity - current_weight, values, weights, order, position, current_value)
+        if bound > best_value:
+            # Krok w przód: dokładaj kolejne przedmioty, dopóki się mieszczą
+            while position < m and current_weight + weights[order[position]] <= capacity:
+                i = order[position]
+                current_weight += weights[i]
+                current_value += values[i]
+                chosen[position] = 1
+                position += 1
+
+            if position < m:
+                # Przedmiot się nie mieści -> gałąź "bez niego", ograniczenie zostanie przeliczone
+                chosen[position] = 0
+                position += 1
+                continue
+
+            # Doszliśmy do liścia: nowe najlepsze rozwiązanie
+            if current_value > best_value:
+                best_value = current_value
+                best_chosen = chosen[:]
+
+        # Powrót: cofnij ostatnio wzięty przedmiot i spróbuj gałęzi bez niego
+        last = position - 1
+        while last >= 0 and chosen[last] == 0:
+            last -= 1
+        if last < 0:
+            break
+        chosen[last] = 0
+        current_weight -= weights[order[last]]
+        current_value -= values[order[last]]
+        position = last + 1
+
+    genotype = [0] * n
+    for position in range(m):
+        if best_chosen[position]:
+            genotype[order[position]] = 1
+    for i in free:
+        genotype[i] = 1
+    return best_value + sum(values[i] for i in free), genotype, optimal
+
+
+def solve(capacity, values, weights):
+    """
+    Wybiera metodę dokładną: DP, gdy tablica n * capacity jest rozsądnie mała,
+    w przeciwnym razie branch-and-bound. Zwraca krotkę (wartość optymalna, genotyp).
+    """
+    if len(values) * (capacity + 1) <= DP_SIZE_LIMIT:
+        return solve_dp(capacity, values, weights, return_solution=True)
+    value, genotype, _ = solve_branch_and_bound(capacity, values, weights)
+    return value, genotype
+
+
+def solve_file(data_file):
+    """Wczytuje instancję w formacie `GeneticAlgorithm.load_data` i zwraca (wartość optymalna, genotyp)."""
+    instance = load_instance(data_file)
+    if instance.dimensions > 1:
+        raise ValueError(f"Metody dokładne obsługują tylko jedno ograniczenie (plik {data_file} ma {instance.dimensions}).")
+    return solve(instance.capacity, instance.values, instance.weights)
+
+
+# --- Uruchomienie z linii poleceń: liczenie optimum dla nowych instancji ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dokładne rozwiązanie problemu plecakowego (DP / branch-and-bound).")
+    parser.add_argument("data_files", nargs="+", help="Pliki z danymi w formacie 'n capacity' + 'value weight'.")
+    parser.add_argument("--write", action="store_true",
+                        help="Zapisz wynik do pliku optimum (katalog z dopiskiem '-optimum').")
+    args = parser.parse_args()
+
+    for data_file in args.data_files:
+        optimum, _ = solve_file(data_file)
+        print(f"{data_file}: optimum = {optimum}")
+        if args.write:
+            path = optimum_file_path(data_file)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(str(optimum))
@@ -0,0 +1,281 @@
+import contextlib
+import io
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from genotypes import REPRESENTATIONS
+from go_knapsack import REPAIR_MODES, GeneticAlgorithm, load_instance
+from reduction import reduce_instance
+from telemetry import JsonLinesWriter
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+# Dostępne silniki algorytmu (nazwa -> klasa)
+ENGINES = {
+    "python": GeneticAlgorithm,
+    "numpy": VectorizedGeneticAlgorithm,
+}
+
+# Standardowe eksperymenty porównawcze (w kolejności z main.py)
+STANDARD_EXPERIMENTS = ("selection", "crossover", "mutation_rate", "crossover_rate")
+# Wszystkie dostępne eksperymenty: "adaptive" porównuje jedno uruchomienie ze sterowaniem adaptacyjnym
+# (zastępujące przegląd współczynników) z uruchomieniem o stałych parametrach bazowych
+EXPERIMENTS = STANDARD_EXPERIMENTS + ("adaptive",)
+DEFAULT_MUTATION_RATES = [0.0, 0.01, 0.02, 0.05, 0.1]
+DEFAULT_CROSSOVER_RATES = [0.5, 0.7, 0.8, 0.9, 1.0]
+# Opcje przyjmowane tylko przez silnik "python" (konstruktor `GeneticAlgorithm`)
+PYTHON_ENGINE_OPTIONS = ("representation", "repair_mode")
+
+
+def check_engine_options(engine, **options):
+    """
+    Sprawdza, czy podane opcje (z wartością inną niż None) są obsługiwane przez silnik `engine`.
+    Rzuca ValueError, np. dla reprezentacji genotypu z silnikiem "numpy".
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Nieznany silnik: {engine}. Dostępne: {', '.join(ENGINES)}")
+    if engine != "python":
+        unsupported = [name for name in PYTHON_ENGINE_OPTIONS if options.get(name) is not None]
+        if unsupported:
+            raise ValueError(f"Silnik {engine} nie obsługuje opcji: {', '.join(unsupported)} "
+                             f"(dostępne tylko w silniku python).")
+
+
+class ExperimentConfig:
+    """
+    Opis pojedynczego uruchomienia algorytmu genetycznego.
+    Metody selekcji i krzyżowania podawane są jako nazwy metod `GeneticAlgorithm`
+    (np. "selection_rank", "crossover_one_point"), dzięki czemu konfigurację
+    można bez problemu przesłać do innego procesu.
+    """
+    def __init__(self, data_file, selection, crossover, mutation_prob, crossover_prob, seed,
+                 population_size, iterations, engine="python", label=None, stopping_criteria=None,
+                 checkpoint_path=None, checkpoint_interval=None, telemetry_path=None,
+                 elitism=0, replacement="generational", steady_state_size=None, adaptive_control=None,
+                 local_search=None, reduce=False, binary_cache=False, representation=None, repair_mode=None):
+        if representation is not None and representation not in REPRESENTATIONS:
+            raise ValueError(f"Nieznana reprezentacja: {representation}. Dostępne: {', '.join(REPRESENTATIONS)}")
+        if repair_mode is not None and repair_mode not in REPAIR_MODES:
+            raise ValueError(f"Nieznany tryb naprawy: {repair_mode}. Dostępne: {', '.join(REPAIR_MODES)}")
+        check_engine_options(engine, representation=representation, repair_mode=repair_mode)
+        self.data_file = data_file
+        self.selection = selection
+        self.crossover = crossover
+        self.mutation_prob = mutation_prob
+        self.crossover_prob = crossover_prob
+        self.seed = seed
+        self.population_size = population_size
+        self.iterations = iterations
+        self.engine = engine
+        self.label = label  # Nazwa serii na wykresie (opcjonalnie)
+        # Argumenty dla `GeneticAlgorithm.set_stopping_criteria` (opcjonalnie), np. {"stall_generations": 100}
+        self.stopping_criteria = stopping_criteria
+        # Plik punktu kontrolnego (opcjonalnie); jeśli istnieje, ewolucja jest wznawiana
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        # Plik JSON Lines ze statystykami każdego pokolenia (opcjonalnie, patrz `GeneticAlgorithm.add_hook`)
+        self.telemetry_path = telemetry_path
+        # Elitaryzm i sposób zastępowania populacji (patrz `go_knapsack.REPLACEMENT_MODES`)
+        self.elitism = elitism
+        self.replacement = replacement
+        self.steady_state_size = steady_state_size
+        # Opcje dla `GeneticAlgorithm.set_adaptive_control` (opcjonalnie; {} = ustawienia domyślne)
+        self.adaptive_control = adaptive_control
+        # Opcje dla `GeneticAlgorithm.set_local_search` (opcjonalnie)
+        self.local_search = local_search
+        # Ewolucja tylko na rdzeniu instancji (`reduction.reduce_instance`), historia w wartościach pełnego problemu
+        self.reduce = reduce
+        # Wczytywanie instancji z binarnej kopii .npy (`go_knapsack.load_instance`); nie wpływa na wynik
+        self.binary_cache = binary_cache
+        # Nazwa reprezentacji genotypu z `genotypes.REPRESENTATIONS` (tylko silnik "python"; None = lista)
+        self.representation = representation
+        # Naprawa niepoprawnych osobników (`go_knapsack.REPAIR_MODES`; tylko silnik "python"; None = bez naprawy)
+        self.repair_mode = repair_mode
+
+    def __repr__(self):
+        """Reprezentacja tekstowa konfiguracji."""
+        return (f"ExperimentConfig({self.data_file}, {self.selection}, {self.crossover}, "
+                f"p_mut={self.mutation_prob}, p_cx={self.crossover_prob}, seed={self.seed})")
+
+
+def build_grid(data_files, selections, crossovers, mutation_probs, crossover_probs, seeds,
+               population_size, iterations, engine="python", stopping_criteria=None, binary_cache=False,
+               representation=None, repair_mode=None):
+    """Tworzy listę konfiguracji dla wszystkich kombinacji podanych parametrów."""
+    return [
+        ExperimentConfig(data_file, selection, crossover, p_mut, p_cx, seed,
+                         population_size, iterations, engine, stopping_criteria=stopping_criteria,
+                         binary_cache=binary_cache, representation=representation, repair_mode=repair_mode)
+        for data_file, selection, crossover, p_mut, p_cx, seed in itertools.product(
+            data_files, selections, crossovers, mutation_probs, crossover_probs, seeds)
+    ]
+
+
+def build_standard_experiments(data_file, population_size, iterations, mutation_prob, crossover_prob, base_seed,
+                               engine="python", experiments=STANDARD_EXPERIMENTS,
+                               mutation_rates=DEFAULT_MUTATION_RATES, crossover_rates=DEFAULT_CROSSOVER_RATES,
+                               checkpoint_dir=None, checkpoint_interval=None, replacement_options=None,
+                               local_search=None, reduce=False, binary_cache=False, adaptive_options=None,
+                               representation=None, repair_mode=None):
+    """
+    Tworzy konfiguracje standardowych eksperymentów porównawczych dla jednego pliku:
+    "selection" (ruletka vs ranking), "crossover" (jedno- vs dwupunktowe),
+    "mutation_rate" i "crossover_rate" (kolejne współczynniki przy bazowych pozostałych),
+    a także (tylko na żądanie) "adaptive" (sterowanie adaptacyjne vs stałe parametry bazowe).
+    Każde uruchomienie dostaje kolejne ziarno, licząc od `base_seed`.
+
+    :param checkpoint_dir: (Opcjonalnie) Katalog punktów kontrolnych.
+    :param replacement_options: (Opcjonalnie) Słownik z `elitism`, `replacement`, `steady_state_size`.
+    :param local_search: (Opcjonalnie) Opcje przeszukiwania lokalnego wszystkich uruchomień.
+    :param reduce: Czy przed ewolucją zmniejszyć problem do rdzenia (`reduction.reduce_instance`).
+    :param binary_cache: Czy wczytywać instancję z binarnej kopii .npy (`go_knapsack.load_instance`).
+    :param adaptive_options: (Opcjonalnie) Opcje sterowania adaptacyjnego w eksperymencie "adaptive"
+                             (`adaptive.AdaptiveControl`, np. {"mutation_bounds": [0.001, 0.05]}).
+    :param representation: (Opcjonalnie) Nazwa reprezentacji genotypu (`genotypes.REPRESENTATIONS`).
+    :param repair_mode: (Opcjonalnie) Tryb naprawy niepoprawnych osobników (`go_knapsack.REPAIR_MODES`).
+    :return: Lista krotek (nazwa eksperymentu, tytuł wykresu, lista konfiguracji).
+    """
+    unknown = [name for name in experiments if name not in EXPERIMENTS]
+    if unknown:
+        raise ValueError(f"Nieznane eksperymenty: {', '.join(unknown)}. Dostępne: {', '.join(EXPERIMENTS)}")
+
+    run_index = itertools.count()
+
+    def make_config(label, selection, crossover, p_mut, p_cx, adaptive_control=None):
+        """Tworzy konfigurację jednego uruchomienia z kolejnym ziarnem (i plikiem punktu kontrolnego)."""
+        index = next(run_index)
+        checkpoint_path = None
+        if checkpoint_dir:
+            checkpoint_path = os.path.join(checkpoint_dir, f"{os.path.basename(data_file)}_run_{index:02d}.npz")
+        return ExperimentConfig(data_file, selection, crossover, p_mut, p_cx, base_seed + index,
+                                population_size, iterations, engine, label=label,
+                                checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval,
+                                adaptive_control=adaptive_control, local_search=local_search, reduce=reduce,
+                                binary_cache=binary_cache, representation=representation,
+                                repair_mode=repair_mode, **(replacement_options or {}))
+
+    result = []
+    if "selection" in experiments:
+        configs = [make_config(label, selection, "crossover_one_point", mutation_prob, crossover_prob)
+                   for label, selection in [("Selekcja Kołem Ruletki", "selection_roulette_wheel"),
+                                            ("Selekcja Rankingowa", "selection_rank")]]
+        result.append(("selection", f"Porównanie Selekcji (Plik: {data_file})", configs))
+    if "crossover" in experiments:
+        configs = [make_config(label, "selection_rank", crossover, mutation_prob, crossover_prob)
+                   for label, crossover in [("Krzyżowanie Jednopunktowe", "crossover_one_point"),
+                                            ("Krzyżowanie Dwupunktowe", "crossover_two_point")]]
+        result.append(("crossover", f"Porównanie Krzyżowania (Plik: {data_file})", configs))
+    if "mutation_rate" in experiments:
+        # Selekcja Rankingowa i Krzyżowanie Jednopunktowe jako stabilna baza, bazowe krzyżowanie
+        configs = [make_config(f"Mutacja {rate}", "selection_rank", "crossover_one_point", rate, crossover_prob)
+                   for rate in mutation_rates]
+        result.append(("mutation_rate", f"Porównanie współczynników mutacji (Plik: {data_file})", configs))
+    if "crossover_rate" in experiments:
+        configs = [make_config(f"Krzyżowanie {rate}", "selection_rank", "crossover_one_point", mutation_prob, rate)
+                   for rate in crossover_rates]
+        result.append(("crossover_rate", f"Porównanie współczynników krzyżowania (Plik: {data_file})", configs))
+    if "adaptive" in experiments:
+        # Parametry bazowe są punktem startowym sterowania adaptacyjnego
+        configs = [make_config("Parametry stałe", "selection_rank", "crossover_one_point", mutation_prob, crossover_prob),
+                   make_config("Sterowanie adaptacyjne", "selection_rank", "crossover_one_point",
+                               mutation_prob, crossover_prob, adaptive_control=dict(adaptive_options or {}))]
+        result.append(("adaptive", f"Sterowanie adaptacyjne (Plik: {data_file})", configs))
+    return result
+
+
+def run_single_experiment(config, verbose=False):
+    """
+    Uruchamia jedną ewolucję na własnej, niezależnej instancji algorytmu.
+    Generatory liczb losowych algorytmu są tworzone z ziarna konfiguracji, więc wynik jest powtarzalny.
+    Jeśli konfiguracja ma istniejący plik punktu kontrolnego, ewolucja jest z niego wznawiana
+    (także zakończona - wtedy od razu zwracana jest zapisana historia).
+    Przy `config.reduce` algorytm działa tylko na rdzeniu instancji, a historia jest przeliczana
+    na wartości pełnego problemu.
+    Zwraca historię najlepszego fitnessu (ze statystykami pokoleń w tablicach `history.columns`).
+    """
+    engine_class = ENGINES[config.engine]
+
+    # Komunikaty z wielu procesów naraz byłyby nieczytelne, więc domyślnie je wyciszamy
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        problem = config.data_file
+        reduced = None
+        stopping_criteria = config.stopping_criteria
+        if config.reduce:
+            reduced = reduce_instance(load_instance(config.data_file, config.binary_cache))
+            problem = reduced.core
+            print(f"Redukcja problemu: {len(reduced.instance)} -> {len(reduced.core_items)} przedmiotów "
+                  f"(ustalone w plecaku: {len(reduced.fixed_ones)}, wartość {reduced.fixed_value})")
+            if stopping_criteria and stopping_criteria.get("target_fitness") is not None:
+                # Cel dotyczy pełnego problemu, a algorytm widzi tylko wartość rdzenia
+                stopping_criteria = dict(stopping_criteria,
+                                         target_fitness=stopping_criteria["target_fitness"] - reduced.fixed_value)
+
+        options = {}
+        if config.representation is not None:
+            options["representation"] = REPRESENTATIONS[config.representation]()
+        if config.repair_mode is not None:
+            options["repair_mode"] = config.repair_mode
+        ga = engine_class(problem, config.population_size, config.crossover_prob,
+                          config.mutation_prob, config.iterations, elitism=config.elitism,
+                          replacement=config.replacement, steady_state_size=config.steady_state_size,
+                          seed=config.seed, binary_cache=config.binary_cache, **options)
+
+        if stopping_criteria:
+            ga.set_stopping_criteria(**stopping_criteria)
+        if config.adaptive_control is not None:
+            ga.set_adaptive_control(**config.adaptive_control)
+        if config.local_search is not None:
+            ga.set_local_search(**config.local_search)
+        resume = config.checkpoint_path and os.path.exists(config.checkpoint_path)
+        with contextlib.ExitStack() as stack:
+            if config.telemetry_path:
+                # Po wznowieniu dopisujemy kolejne pokolenia do istniejącego pliku
+                writer = stack.enter_context(JsonLinesWriter(config.telemetry_path, 'a' if resume else 'w'))
+                ga.add_hook(writer)
+            if resume:
+                history = ga.resume_evolution(
+                    config.checkpoint_path,
+                    selection_method=getattr(ga, config.selection),
+                    crossover_method=getattr(ga, config.crossover),
+                    checkpoint_interval=config.checkpoint_interval
+                )
+            else:
+                history = ga.run_evolution(
+                    selection_method=getattr(ga, config.selection),
+                    crossover_method=getattr(ga, config.crossover),
+                    checkpoint_path=config.checkpoint_path,
+                    checkpoint_interval=config.checkpoint_interval
+                )
+        if reduced is not None:
+            history = reduced.map_history(history)
+        return history
+
+
+def run_experiments(configs, max_workers=None, verbose=False):
+    """
+    Uruchamia wszystkie konfiguracje równolegle w puli procesów.
+    Zwraca listę par (konfiguracja, historia) w kolejności podanych konfiguracji.
+
+    :param max_workers: Liczba procesów (domyślnie liczba rdzeni procesora).
+    """
+    configs = list(configs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        histories = list(executor.map(partial(run_single_experiment, verbose=verbose), configs))
+    return list(zip(configs, histories))
+
+
+def record_experiments(configs, store, max_workers=None, verbose=False):
+    """
+    Jak `run_experiments`, ale każda historia (ze statystykami pokoleń z `history.columns`)
+    trafia do magazynu `store` (`history_store.HistoryStore`) zaraz po zakończeniu uruchomienia
+    i nie jest trzymana w pamięci. Zwraca listę par (konfiguracja, klucz uruchomienia w magazynie).
+    """
+    configs = list(configs)
+    keys = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for config, history in zip(configs, executor.map(partial(run_single_experiment, verbose=verbose), configs)):
+            keys.append((config, store.append(config, history)))
+    store.flush()
+    return keys
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """
+    Pamięć podręczna wyników oceny osobników: klucz genotypu -> (fitness, waga, wartość).
+    Ma ograniczony rozmiar; po jego przekroczeniu usuwany jest najdawniej używany wpis (LRU).
+    Liczniki trafień i chybień pokazują, ile pełnych ocen oszczędza. `GeneticAlgorithm` pyta ją
+    tylko o osobniki bez znanych sum (np. losowe), bo potomków ocenia przyrostowo w czasie O(1).
+    """
+
+    def __init__(self, max_size):
+        if max_size <= 0:
+            raise ValueError("Rozmiar pamięci podręcznej musi być dodatni.")
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Zwraca zapamiętaną krotkę (fitness, waga, wartość) lub None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        # Oznacz wpis jako ostatnio używany
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        """Zapisuje wynik oceny; usuwa najdawniej używany wpis, jeśli brakuje miejsca."""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Czyści zawartość i liczniki."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        """Odsetek zapytań obsłużonych z pamięci podręcznej."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        """Reprezentacja tekstowa z licznikami."""
+        return f"FitnessCache(size={len(self)}/{self.max_size}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,132 @@
+import argparse
+import os
+
+import numpy as np
+
+from exact_solvers import solve_branch_and_bound, solve_dp
+from go_knapsack import KnapsackInstance, optimum_file_path
+from reduction import reduce_instance
+
+# Rodziny instancji Pisingera: nazwa -> numer typu w nazwach plików knapPI_<typ>_<n>_<R>_<indeks>
+FAMILIES = {
+    "uncorrelated": 1,
+    "weakly_correlated": 2,
+    "strongly_correlated": 3,
+    "inverse_strongly_correlated": 4,
+    "subset_sum": 6,
+}
+
+# Maksymalny rozmiar n * capacity dla DP liczącego samą wartość (pamięć O(capacity), więc limit
+# wynika tylko z czasu; jest dużo większy niż `exact_solvers.DP_SIZE_LIMIT` dla DP z odtwarzaniem rozwiązania)
+DP_VALUE_SIZE_LIMIT = 2_000_000_000
+# Limit węzłów branch-and-bound przy liczeniu optimum (powyżej niego optimum nie jest zapisywane)
+DEFAULT_MAX_NODES = 2_000_000
+
+
+def generate_instance(family, n, coefficient_range=1000, seed=None, index=1, series=100):
+    """
+    Tworzy losową instancję z rodziny Pisingera ("Where are the hard knapsack problems?"),
+    R = `coefficient_range`:
+    - uncorrelated: w, v ~ U[1, R],
+    - weakly_correlated: w ~ U[1, R], v ~ U[w - R/10, w + R/10] (v >= 1),
+    - strongly_correlated: w ~ U[1, R], v = w + R/10,
+    - inverse_strongly_correlated: v ~ U[1, R], w = v + R/10,
+    - subset_sum: w ~ U[1, R], v = w.
+    Pojemność jak w seriach Pisingera: `index` / (`series` + 1) sumy wag (instancja `index` z `series`).
+    Wszystkie liczby losowane są naraz (NumPy), więc także instancje z milionem przedmiotów powstają szybko.
+    """
+    if family not in FAMILIES:
+        raise ValueError(f"Nieznana rodzina instancji: {family}. Dostępne: {', '.join(FAMILIES)}")
+    if n < 1 or coefficient_range < 1:
+        raise ValueError("Liczba przedmiotów i zakres współczynników muszą być dodatnie.")
+    if not 1 <= index <= series:
+        raise ValueError(f"Indeks instancji musi być z zakresu [1, {series}].")
+
+    rng = np.random.default_rng(seed)
+    offset = coefficient_range // 10
+    if family == "inverse_strongly_correlated":
+        values = rng.integers(1, coefficient_range + 1, size=n, dtype=np.int64)
+        weights = values + offset
+    else:
+        weights = rng.integers(1, coefficient_range + 1, size=n, dtype=np.int64)
+        if family == "uncorrelated":
+            values = rng.integers(1, coefficient_range + 1, size=n, dtype=np.int64)
+        elif family == "weakly_correlated":
+            values = np.maximum(1, weights + rng.integers(-offset, offset + 1, size=n, dtype=np.int64))
+        elif family == "strongly_correlated":
+            values = weights + offset
+        else:
+            values = weights.copy()
+
+    capacity = int(index * int(weights.sum()) // (series + 1))
+    return KnapsackInstance(capacity, values, weights)
+
+
+def instance_file_name(family, n, coefficient_range, index=1):
+    """Nazwa pliku zgodna z konwencją instancji Pisingera (np. knapPI_1_100_1000_1)."""
+    return f"knapPI_{FAMILIES[family]}_{n}_{coefficient_range}_{index}"
+
+
+def write_instance(instance, path):
+    """Zapisuje instancję w formacie czytanym przez `load_instance`: nagłówek 'n capacity', wiersze 'value weight'."""
+    rows = np.column_stack((instance.values, instance.weights))
+    with open(path, 'w') as f:
+        f.write(f"{len(instance)} {instance.capacity}\n")
+        np.savetxt(f, rows, fmt="%d")
+
+
+def exact_optimum(instance, max_nodes=DEFAULT_MAX_NODES):
+    """
+    Liczy optimum dokładnie, jeśli to wykonalne: najpierw redukcja do rdzenia (`reduction`),
+    potem DP (gdy tablica jest dość mała) lub branch-and-bound z limitem `max_nodes` węzłów.
+    Zwraca wartość optymalną albo None, gdy nie udało się udowodnić optymalności.
+    """
+    reduced = reduce_instance(instance)
+    core = reduced.core
+    if len(core) * (core.capacity + 1) <= DP_VALUE_SIZE_LIMIT:
+        value, _ = solve_dp(core.capacity, core.values, core.weights)
+        return value + reduced.fixed_value
+    value, _, optimal = solve_branch_and_bound(core.capacity, core.values, core.weights, max_nodes=max_nodes)
+    return value + reduced.fixed_value if optimal else None
+
+
+def write_optimum(data_file, optimum):
+    """Zapisuje wartość optymalną do pliku w katalogu z dopiskiem "-optimum" (jak `load_optimum` oczekuje)."""
+    path = optimum_file_path(data_file)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(str(optimum))
+
+
+# --- Uruchomienie z linii poleceń ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generator instancji problemu plecakowego (rodziny Pisingera).")
+    parser.add_argument("--families", nargs="+", default=list(FAMILIES), choices=list(FAMILIES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000], help="Liczby przedmiotów.")
+    parser.add_argument("--range", type=int, default=1000, dest="coefficient_range",
+                        help="Zakres współczynników R (wartości i wagi z [1, R]).")
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno (każda instancja dostaje kolejne).")
+    parser.add_argument("--index", type=int, default=1, help="Numer instancji w serii (pojemność index/101 sumy wag).")
+    parser.add_argument("--output-dir", default="generated", help="Katalog na pliki instancji.")
+    parser.add_argument("--no-optimum", action="store_true", help="Nie licz plików optimum.")
+    parser.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES,
+                        help="Limit węzłów branch-and-bound przy liczeniu optimum.")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    seed = args.seed
+    for family in args.families:
+        for n in args.sizes:
+            instance = generate_instance(family, n, args.coefficient_range, seed, index=args.index)
+            seed += 1
+            path = os.path.join(args.output_dir, instance_file_name(family, n, args.coefficient_range, args.index))
+            write_instance(instance, path)
+            if args.no_optimum:
+                print(f"{path}: n={n}, pojemność={instance.capacity}")
+                continue
+            optimum = exact_optimum(instance, args.max_nodes)
+            if optimum is None:
+                print(f"OSTRZEŻENIE: {path}: nie udało się udowodnić optymalności (limit węzłów), brak pliku optimum.")
+                continue
+            write_optimum(path, optimum)
+            print(f"{path}: n={n}, pojemność={instance.capacity}, optimum={optimum}")
@@ -0,0 +1,188 @@
+import numpy as np
+
+# Tablica pomocnicza: dla każdej wartości bajtu (0-255) lista pozycji ustawionych bitów.
+# Pozwala przejść po genotypie upakowanym w bity bajt po bajcie, zamiast bit po bicie.
+_BYTE_BITS = [tuple(bit for bit in range(8) if (byte >> bit) & 1) for byte in range(256)]
+
+
+class ListRepresentation:
+    """
+    Klasyczna reprezentacja genotypu: lista liczb 0 i 1 (jeden int na gen).
+    Wszystkie operacje zwracają nowe genotypy (nie modyfikują argumentów).
+    """
+    name = "list"
+
+    def random(self, length, rng):
+        """Tworzy losowy genotyp o zadanej długości (generator `rng`, np. `random.Random`)."""
+        bits = rng.getrandbits(length)
+        return [(bits >> i) & 1 for i in range(length)]
+
+    def from_list(self, genes):
+        """Tworzy genotyp z listy 0/1."""
+        return list(genes)
+
+    def to_list(self, genotype, length):
+        """Zamienia genotyp na listę 0/1 o zadanej długości."""
+        return list(genotype)
+
+    def to_bytes(self, genotype, length):
+        """Pakuje genotyp do zwartego bufora bajtów (8 genów na bajt, little-endian)."""
+        packed = bytearray((length + 7) // 8)
+        for i, gene in enumerate(genotype):
+            if gene:
+                packed[i >> 3] |= 1 << (i & 7)
+        return bytes(packed)
+
+    def from_bytes(self, data, length):
+        """Odtwarza genotyp z bufora utworzonego przez `to_bytes`."""
+        return [(data[i >> 3] >> (i & 7)) & 1 for i in range(length)]
+
+    def to_matrix(self, genotypes, length):
+        """Zamienia listę genotypów na macierz 0/1 (uint8), jeden wiersz na genotyp."""
+        # Sklejenie bajtów genotypów jest ok. 2x szybsze niż np.array na liście list
+        return np.frombuffer(b"".join(map(bytes, genotypes)), dtype=np.uint8).reshape(len(genotypes), length)
+
+    def key(self, genotype):
+        """Zwarty, haszowalny klucz genotypu: geny upakowane w bity (jak `to_bytes`, ale w NumPy)."""
+        return np.packbits(np.frombuffer(bytes(genotype), dtype=np.uint8), bitorder='little').tobytes()
+
+    def from_key(self, key, length):
+        """Odtwarza genotyp z klucza utworzonego przez `key`."""
+        return np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=length, bitorder='little').tolist()
+
+    def selected_indices(self, genotype):
+        """Zwraca indeksy przedmiotów, które są w plecaku (geny równe 1)."""
+        return [i for i, gene in enumerate(genotype) if gene == 1]
+
+    def get(self, genotype, index):
+        """Zwraca wartość genu na pozycji `index`."""
+        return genotype[index]
+
+    def diff_indices(self, gen1, gen2, start, stop):
+        """
+        Porównuje genotypy na odcinku [start, stop). Zwraca dwie listy indeksów:
+        geny, które `gen2` ma równe 1, a `gen1` równe 0 (zyskane), oraz odwrotnie (utracone).
+        Koszt jest O(długość odcinka): listy trzeba porównać gen po genie (konwersja do NumPy
+        kosztuje tyle samo), więc ocena przyrostowa oszczędza tu tylko pracę poza odcinkiem.
+        Koszt zależny wyłącznie od liczby zmienionych genów daje `BitsetRepresentation`.
+        """
+        gained = []
+        lost = []
+        for i in range(start, stop):
+            if gen1[i] != gen2[i]:
+                if gen2[i] == 1:
+                    gained.append(i)
+                else:
+                    lost.append(i)
+        return gained, lost
+
+    def one_point(self, gen1, gen2, cut_point):
+        """Krzyżowanie jednopunktowe: wymiana końcówek od `cut_point`."""
+        return gen1[:cut_point] + gen2[cut_point:], gen2[:cut_point] + gen1[cut_point:]
+
+    def two_point(self, gen1, gen2, p1, p2):
+        """Krzyżowanie dwupunktowe: wymiana środkowej części [p1, p2)."""
+        return gen1[:p1] + gen2[p1:p2] + gen1[p2:], gen2[:p1] + gen1[p1:p2] + gen2[p2:]
+
+    def flip(self, genotype, positions):
+        """Zwraca kopię genotypu z odwróconymi bitami na podanych pozycjach."""
+        genotype = genotype[:]
+        for i in positions:
+            genotype[i] = 1 - genotype[i]
+        return genotype
+
+
+class BitsetRepresentation:
+    """
+    Upakowana reprezentacja genotypu: jeden Pythonowy `int` używany jako zbiór bitów
+    (bit `i` odpowiada genowi `i`). Zajmuje ok. 1 bit na gen zamiast 8 bajtów,
+    a krzyżowanie i mutacja sprowadzają się do operacji na maskach (AND / OR / XOR),
+    czyli kosztują O(liczba słów), a nie O(liczba przedmiotów).
+    """
+    name = "bitset"
+
+    def random(self, length, rng):
+        """Tworzy losowy genotyp o zadanej długości (generator `rng`, np. `random.Random`)."""
+        return rng.getrandbits(length)
+
+    def from_list(self, genes):
+        """Tworzy genotyp z listy 0/1."""
+        genotype = 0
+        for i, gene in enumerate(genes):
+            if gene:
+                genotype |= 1 << i
+        return genotype
+
+    def to_list(self, genotype, length):
+        """Zamienia genotyp na listę 0/1 o zadanej długości."""
+        return [(genotype >> i) & 1 for i in range(length)]
+
+    def to_bytes(self, genotype, length):
+        """Pakuje genotyp do zwartego bufora bajtów (8 genów na bajt, little-endian)."""
+        return genotype.to_bytes((length + 7) // 8, 'little')
+
+    def from_bytes(self, data, length):
+        """Odtwarza genotyp z bufora utworzonego przez `to_bytes`."""
+        return int.from_bytes(data, 'little')
+
+    def to_matrix(self, genotypes, length):
+        """Zamienia listę genotypów na macierz 0/1 (uint8), jeden wiersz na genotyp."""
+        row_bytes = (length + 7) // 8
+        packed = np.frombuffer(b"".join(self.to_bytes(g, length) for g in genotypes), dtype=np.uint8)
+        bits = np.unpackbits(packed.reshape(len(genotypes), row_bytes), axis=1, bitorder='little')
+        return bits[:, :length]
+
+    def key(self, genotype):
+        """Zwarty, haszowalny klucz genotypu (sam zbiór bitów)."""
+        return genotype
+
+    def from_key(self, key, length):
+        """Odtwarza genotyp z klucza utworzonego przez `key`."""
+        return key
+
+    def selected_indices(self, genotype):
+        """Zwraca indeksy ustawionych bitów (przedmiotów w plecaku), bajt po bajcie."""
+        data = genotype.to_bytes((genotype.bit_length() + 7) // 8, 'little')
+        indices = []
+        for byte_index, byte in enumerate(data):
+            if byte:
+                base = byte_index * 8
+                indices.extend(base + bit for bit in _BYTE_BITS[byte])
+        return indices
+
+    def get(self, genotype, index):
+        """Zwraca wartość genu na pozycji `index`."""
+        return (genotype >> index) & 1
+
+    def diff_indices(self, gen1, gen2, start, stop):
+        """
+        Porównuje genotypy na odcinku [start, stop) za pomocą masek. Zwraca indeksy
+        genów zyskanych (1 tylko w `gen2`) i utraconych (1 tylko w `gen1`).
+        Koszt zależy od liczby różniących się genów, a nie od długości odcinka.
+        """
+        segment_mask = ((1 << stop) - 1) ^ ((1 << start) - 1)
+        gained = self.selected_indices(gen2 & ~gen1 & segment_mask)
+        lost = self.selected_indices(gen1 & ~gen2 & segment_mask)
+        return gained, lost
+
+    def one_point(self, gen1, gen2, cut_point):
+        """Krzyżowanie jednopunktowe jako operacja na masce."""
+        low_mask = (1 << cut_point) - 1  # Bity [0, cut_point)
+        return (gen1 & low_mask) | (gen2 & ~low_mask), (gen2 & low_mask) | (gen1 & ~low_mask)
+
+    def two_point(self, gen1, gen2, p1, p2):
+        """Krzyżowanie dwupunktowe jako operacja na masce."""
+        middle_mask = ((1 << p2) - 1) ^ ((1 << p1) - 1)  # Bity [p1, p2)
+        diff = (gen1 ^ gen2) & middle_mask
+        return gen1 ^ diff, gen2 ^ diff
+
+    def flip(self, genotype, positions):
+        """Mutacja jako XOR z rzadką maską zbudowaną z podanych pozycji."""
+        mask = 0
+        for i in positions:
+            mask |= 1 << i
+        return genotype ^ mask
+
+
+# Dostępne reprezentacje genotypu (nazwa -> klasa), np. dla konfiguracji eksperymentów i usługi
+REPRESENTATIONS = {ListRepresentation.name: ListRepresentation, BitsetRepresentation.name: BitsetRepresentation}
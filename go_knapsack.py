@@ -1,54 +1,307 @@
+import heapq
+import io
+import math
+import os
 import random
+import time
 
-class Item:
+import numpy as np
+
+from adaptive import AdaptiveControl
+from checkpoints import (decode_numbers, encode_numbers, instance_digest, load_checkpoint, pack_random_state,
+                         save_checkpoint, unpack_random_state)
+from fitness_cache import FitnessCache
+from genotypes import ListRepresentation
+from history_store import HistoryRecorder
+from sampling import AliasTable
+from telemetry import PhaseProfiler
+
+# Tryby naprawy niepoprawnych osobników:
+# "lamarckian" - naprawiony genotyp zastępuje oryginał (zmiana jest dziedziczona),
+# "baldwinian" - genotyp zostaje bez zmian, osobnik dostaje tylko fitness naprawionej wersji.
+REPAIR_MODES = ("lamarckian", "baldwinian")
+
+# Sposoby zastępowania populacji:
+# "generational" - co pokolenie cała nowa populacja (opcjonalnie z `elitism` najlepszymi bez zmian),
+# "steady_state" - co pokolenie tylko `steady_state_size` dzieci zastępuje najgorszych osobników w miejscu.
+REPLACEMENT_MODES = ("generational", "steady_state")
+
+class KnapsackInstance:
     """
-    Prosta klasa reprezentująca pojedynczy przedmiot w plecaku.
-    Posiada dwa atrybuty: wartość (value) i wagę (weight).
+    Dane problemu plecakowego: pojemność oraz wartości i wagi przedmiotów
+    przechowywane jako ciągłe tablice int64 (zamiast listy osobnych obiektów).
+
+    Wielowymiarowy problem plecakowy (kilka ograniczeń, np. waga, objętość, budżet):
+    `capacity` jest wtedy wektorem m pojemności, a `weights` macierzą m x n
+    (wiersz = jedno ograniczenie). Dla m = 1 `capacity` to zwykły int, a `weights` tablica 1-D.
     """
-    def __init__(self, value, weight):
-        self.value = value
-        self.weight = weight
+    def __init__(self, capacity, values, weights):
+        self.values = np.ascontiguousarray(values, dtype=np.int64)
+        self.capacities = np.atleast_1d(np.asarray(capacity, dtype=np.int64))
+        self.dimensions = len(self.capacities)  # Liczba ograniczeń (m)
+        weight_matrix = np.atleast_2d(np.asarray(weights, dtype=np.int64))
+        if self.capacities.ndim != 1 or weight_matrix.shape != (self.dimensions, len(self.values)):
+            raise ValueError("Macierz wag musi mieć wymiary [liczba ograniczeń x liczba przedmiotów].")
+        
+        if self.dimensions == 1:
+            self.capacity = int(self.capacities[0])
+            self.weights = np.ascontiguousarray(weight_matrix[0])
+            # Widoki bez kopiowania danych: indeksowanie zwraca zwykłe int-y Pythona,
+            # co jest dużo szybsze niż pojedyncze odczyty z tablicy NumPy w pętlach.
+            self.weight_at = memoryview(self.weights)
+        else:
+            self.capacity = self.capacities
+            self.weights = np.ascontiguousarray(weight_matrix)
+            self.weight_at = None  # Przyrostowe liczenie sum dotyczy tylko jednego ograniczenia
+        self.value_at = memoryview(self.values)
+        # Wagi zawsze jako macierz m x n (widok, bez kopiowania)
+        self.weight_matrix = self.weights.reshape(self.dimensions, -1)
+
+    def __len__(self):
+        """Liczba przedmiotów."""
+        return len(self.values)
+
+    def __reduce__(self):
+        """Obiekty memoryview nie dają się serializować, więc odtwarzamy instancję z tablic."""
+        return (KnapsackInstance, (self.capacity, self.values, self.weights))
 
     def __repr__(self):
         """Reprezentacja tekstowa obiektu, przydatna przy debugowaniu."""
-        return f"(V: {self.value}, W: {self.weight})"
+        if self.dimensions > 1:
+            return f"KnapsackInstance(n={len(self)}, capacities={self.capacities.tolist()})"
+        return f"KnapsackInstance(n={len(self)}, capacity={self.capacity})"
+
+def binary_cache_path(data_file):
+    """Ścieżka do binarnej kopii instancji (plik .npy obok pliku źródłowego)."""
+    return data_file + ".npy"
+
+def load_instance(data_file, binary_cache=False):
+    """
+    Wczytuje dane problemu z pliku tekstowego: nagłówek [liczba_przedmiotow] [pojemnosc_plecaka],
+    a następnie wiersze [wartosc] [waga]. Wszystkie liczby są parsowane naraz (w C)
+    prosto do tablicy int64 (patrz `parse_instance`).
+    Plik z m ograniczeniami ma nagłówek [liczba_przedmiotow] [pojemnosc_1] ... [pojemnosc_m]
+    i wiersze [wartosc] [waga_1] ... [waga_m].
+    
+    :param binary_cache: Jeśli True, używa pliku .npy obok pliku źródłowego: przy pierwszym
+                         wczytaniu go tworzy, a przy kolejnych mapuje go do pamięci (bez kopiowania).
+    """
+    cache_path = binary_cache_path(data_file)
+    if binary_cache and os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(data_file):
+        data = np.load(cache_path, mmap_mode='r')
+        if data.shape[0] == 2:
+            # Układ pliku .npy dla jednego ograniczenia: [[capacity, wartości...], [n, wagi...]]
+            return KnapsackInstance(data[0, 0], data[0, 1:], data[1, 1:])
+        # Dla m ograniczeń: [[m, wartości...], [capacity_1, wagi_1...], ..., [capacity_m, wagi_m...]]
+        return KnapsackInstance(data[1:, 0], data[0, 1:], data[1:, 1:])
+    
+    with open(data_file, 'rb') as f:
+        instance = parse_instance(f.read(), data_file)
+    
+    if binary_cache:
+        n = len(instance)
+        dimensions = instance.dimensions
+        data = np.empty((max(2, dimensions + 1), n + 1), dtype=np.int64)
+        if dimensions == 1:
+            data[0, 0] = instance.capacity
+            data[1, 0] = n
+        else:
+            data[0, 0] = dimensions
+            data[1:, 0] = instance.capacities
+        data[0, 1:] = instance.values
+        data[1:, 1:] = instance.weight_matrix
+        try:
+            # Zapis do pliku tymczasowego i podmiana: równoległe procesy nie zobaczą niepełnego pliku
+            temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'wb') as f:
+                np.save(f, data)
+            os.replace(temporary_path, cache_path)
+        except OSError as e:
+            print(f"OSTRZEŻENIE: Nie udało się zapisać pliku {cache_path}: {e}")
+    
+    return instance
+
+def parse_instance(data, source="<dane>"):
+    """
+    Parsuje zawartość pliku z danymi (bajty lub tekst w formacie opisanym w `load_instance`)
+    i zwraca `KnapsackInstance`. `source` trafia tylko do komunikatów o błędach.
+    Każdy niepusty wiersz po nagłówku musi zawierać wartość i wagi wszystkich ograniczeń (liczby
+    całkowite), a wierszy musi być tyle, ile przedmiotów podano w nagłówku.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    header, _, body = data.partition(b"\n")
+    first_line = header.split()
+    if not first_line:
+        raise ValueError(f"Plik {source} nie zawiera nagłówka.")
+    try:
+        n = int(first_line[0])
+        capacities = [int(token) for token in first_line[1:]]
+    except ValueError:
+        raise ValueError(f"Nagłówek pliku {source} musi zawierać liczby całkowite: {header.decode(errors='replace')!r}.")
+    
+    dimensions = len(capacities)
+    row_length = dimensions + 1  # Wartość i m wag
+    if dimensions == 0:
+        raise ValueError(f"Plik {source} nie zawiera pojemności plecaka w nagłówku.")
+    if body.strip():
+        try:
+            # Wszystkie wiersze parsowane naraz (w C); zła liczba lub zmiana liczby kolumn to błąd
+            rows = np.loadtxt(io.BytesIO(body), dtype=np.int64, ndmin=2)
+        except ValueError as e:
+            raise ValueError(f"Niepoprawne dane przedmiotów w pliku {source}: {e}")
+    else:
+        rows = np.empty((0, row_length), dtype=np.int64)
+    if rows.shape[1] != row_length:
+        raise ValueError(f"Wiersze przedmiotów w pliku {source} mają {rows.shape[1]} liczb zamiast {row_length} "
+                         f"(wartość i {dimensions} wag).")
+    if len(rows) != n:
+        raise ValueError(f"Plik {source} zawiera {len(rows)} przedmiotów zamiast {n}.")
+    capacity = capacities[0] if dimensions == 1 else capacities
+    return KnapsackInstance(capacity, rows[:, 0], rows[:, 1:].T)
+
+def optimum_file_path(data_file):
+    """
+    Zwraca ścieżkę do pliku z wartością optymalną dla danego pliku z danymi.
+    Plik optimum leży w katalogu o nazwie katalogu danych z dopiskiem "-optimum",
+    np. low-dimensional/f1_l-d_kp_10_269 -> low-dimensional-optimum/f1_l-d_kp_10_269.
+    """
+    directory, file_name = os.path.split(data_file)
+    parent, directory_name = os.path.split(directory)
+    return os.path.join(parent, directory_name + "-optimum", file_name)
+
+def load_optimum(data_file):
+    """
+    Wczytuje wartość optymalną dla danego pliku z danymi (z katalogu z dopiskiem "-optimum").
+    Rzuca FileNotFoundError, jeśli plik optimum nie istnieje.
+    """
+    with open(optimum_file_path(data_file), 'r') as f:
+        first_line = f.readline().split()
+        return int(first_line[0])
+
+def population_diversity(matrix):
+    """
+    Różnorodność populacji zapisanej jako macierz 0/1 (wiersz = genotyp): średnia
+    znormalizowana odległość Hamminga między parami osobników. Losowa populacja ma ok. 0.5,
+    populacja złożona z samych kopii jednego osobnika ma 0.
+    """
+    n_individuals, length = matrix.shape
+    if n_individuals < 2 or length == 0:
+        return 0.0
+    ones = matrix.mean(axis=0)  # Odsetek jedynek w każdym genie
+    pair_factor = n_individuals / (n_individuals - 1)
+    return float((2 * ones * (1 - ones)).mean() * pair_factor)
+
+class EvolutionHistory(list):
+    """
+    Historia najlepszego fitnessu z kolejnych pokoleń (zwykła lista, zgodna z `plot_results`)
+    z dodatkową informacją, dlaczego ewolucja się zakończyła i ile pokoleń wykonano,
+    oraz (przy sterowaniu adaptacyjnym) harmonogramem operatorów i parametrów z kolejnych pokoleń.
+    `columns` to opcjonalne statystyki pokoleń w tablicach NumPy (patrz `history_store.HistoryRecorder`).
+    `value_offset` to wartość dodana do poprawnych wyników historii względem problemu, na którym działał
+    algorytm (np. przedmioty ustalone przez redukcję); kolumny `columns` poza "best" jej nie zawierają.
+    """
+    def __init__(self, values=(), stop_reason=None, generations=0, schedule=None, columns=None, value_offset=0):
+        super().__init__(values)
+        self.stop_reason = stop_reason
+        self.generations = generations
+        self.schedule = schedule
+        self.columns = columns
+        self.value_offset = value_offset
+
+class StoppingCriteria:
+    """
+    Warunki wcześniejszego zakończenia ewolucji (każdy opcjonalny):
+    - target_fitness: osiągnięto zadany fitness (np. znane optimum),
+    - stall_generations: brak poprawy najlepszego wyniku przez tyle pokoleń,
+    - min_diversity: różnorodność populacji spadła poniżej progu,
+    - time_limit: przekroczono limit czasu (w sekundach),
+    - max_evaluations: przekroczono limit ocenionych osobników.
+    """
+    def __init__(self, target_fitness=None, stall_generations=None, min_diversity=None,
+                 time_limit=None, max_evaluations=None):
+        self.target_fitness = target_fitness
+        self.stall_generations = stall_generations
+        self.min_diversity = min_diversity
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.start()
+
+    def start(self):
+        """Zeruje stan przed nową ewolucją (czas startu, najlepszy wynik, ostatnia poprawa)."""
+        self.start_time = time.perf_counter()
+        self.best_fitness = None
+        self.last_improvement = 0
+
+    def check(self, generation, best_fitness, evaluations, diversity):
+        """
+        Sprawdza warunki po ocenie pokolenia `generation`. Zwraca nazwę spełnionego
+        warunku albo None. `diversity` to funkcja bez argumentów (liczona tylko w razie potrzeby).
+        """
+        if self.best_fitness is None or best_fitness > self.best_fitness:
+            self.best_fitness = best_fitness
+            self.last_improvement = generation
+        
+        if self.target_fitness is not None and best_fitness >= self.target_fitness:
+            return "target_fitness"
+        if self.stall_generations is not None and generation - self.last_improvement >= self.stall_generations:
+            return "stall"
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return "max_evaluations"
+        if self.time_limit is not None and time.perf_counter() - self.start_time >= self.time_limit:
+            return "time_limit"
+        if self.min_diversity is not None and diversity() < self.min_diversity:
+            return "diversity"
+        return None
 
 class Individual:
     """
     Reprezentuje pojedynczego osobnika (kandydata na rozwiązanie) w populacji.
-    Osobnik ma "genotyp" (listę 0 i 1) oraz obliczoną "wartość fitness".
+    Osobnik ma "genotyp" (domyślnie listę 0 i 1, zależnie od reprezentacji)
+    oraz obliczoną "wartość fitness".
     """
-    def __init__(self, items, capacity, genotype=None):
-        self.items = items  # Lista wszystkich dostępnych przedmiotów (referencja)
-        self.capacity = capacity  # Maksymalna pojemność plecaka (referencja)
-        self.chromosome_length = len(items)  # Długość chromosomu (liczba przedmiotów)
+    def __init__(self, instance, genotype=None, representation=None, total_weight=None, total_value=None):
+        self.instance = instance  # Dane problemu: wartości i wagi przedmiotów (referencja)
+        self.capacity = instance.capacity  # Maksymalna pojemność plecaka
+        self.chromosome_length = len(instance)  # Długość chromosomu (liczba przedmiotów)
+        # Sposób przechowywania genotypu (lista 0/1 lub upakowane bity)
+        self.representation = representation if representation is not None else ListRepresentation()
         
         if genotype is None:
-            # Jeśli nie podano genotypu (np. przy tworzeniu pierwszej populacji),
-            # stwórz losowy genotyp (losową listę 0 i 1).
-            self.genotype = [random.randint(0, 1) for _ in range(self.chromosome_length)]
+            # Jeśli nie podano genotypu, stwórz losowy genotyp. `GeneticAlgorithm` zawsze podaje
+            # genotyp wylosowany własnym generatorem; tu używamy modułu `random` tylko awaryjnie.
+            self.genotype = self.representation.random(self.chromosome_length, random)
         else:
             # Jeśli podano genotyp (np. po krzyżowaniu), użyj go.
             self.genotype = genotype
         
+        if total_weight is None or total_value is None:
+            # Sumy nie są znane (np. nowy losowy osobnik) -> pełne przejście po genotypie.
+            total_weight, total_value = self.calculate_totals()
+        
+        # Zapamiętane sumy pozwalają liczyć potomków przyrostowo (tylko zmienione geny)
+        self.total_weight = total_weight
+        self.total_value = total_value
+        
         # Oblicz fitness dla tego genotypu.
         self.fitness = self.calculate_fitness()
 
+    def calculate_totals(self):
+        """Oblicza łączną wagę i wartość przedmiotów w plecaku (pełne przejście po genotypie)."""
+        # Indeksy genów równych '1' (przedmiotów w plecaku); sumowanie odbywa się w NumPy
+        selected = self.representation.selected_indices(self.genotype)
+        total_weight = int(self.instance.weights[selected].sum())
+        total_value = int(self.instance.values[selected].sum())
+        
+        return total_weight, total_value
+
     def calculate_fitness(self):
         """
-        Oblicza wartość fitness dla osobnika na podstawie jego genotypu.
+        Oblicza wartość fitness dla osobnika na podstawie zapamiętanych sum wagi i wartości.
         Jest to kluczowa funkcja całego algorytmu.
         """
-        total_weight = 0
-        total_value = 0
-        
-        # Przejdź przez genotyp bit po bicie
-        for i in range(self.chromosome_length):
-            if self.genotype[i] == 1:
-                # Jeśli genotyp ma '1' na pozycji 'i', dodaj przedmiot 'i' do plecaka
-                current_item = self.items[i]
-                total_weight += current_item.weight
-                total_value += current_item.value
+        total_weight = self.total_weight
+        total_value = self.total_value
         
         if total_weight > self.capacity:
             # Jeśli plecak jest za ciężki, osobnik jest "niepoprawny".
@@ -70,165 +323,618 @@ class Individual:
 class GeneticAlgorithm:
     """
     Główna klasa zarządzająca całym procesem ewolucji.
+    Obsługuje jedno ograniczenie pojemności (wiele ograniczeń: `VectorizedGeneticAlgorithm`).
     """
+    # Czy silnik obsługuje instancje z wieloma ograniczeniami (KnapsackInstance.dimensions > 1)
+    supports_multidimensional = False
     
-    def __init__(self, data_file, population_size, crossover_prob, mutation_prob, iterations):
+    def __init__(self, data_file, population_size, crossover_prob, mutation_prob, iterations, representation=None,
+                 fitness_cache_size=None, repair_mode=None, tournament_size=2, elitism=0,
+                 replacement="generational", steady_state_size=None, seed=None, binary_cache=False):
         # Inicjalizacja parametrów algorytmu
         self.population_size = population_size
         self.crossover_prob = crossover_prob
         self.mutation_prob = mutation_prob
         self.iterations = iterations
+        self.tournament_size = tournament_size  # Liczba uczestników turnieju w selekcji turniejowej
+        # Reprezentacja genotypu (np. ListRepresentation lub BitsetRepresentation z modułu genotypes)
+        self.representation = representation if representation is not None else ListRepresentation()
+        # Wspólna pamięć podręczna ocen (genotyp -> fitness, waga, wartość); None = wyłączona
+        self.fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size else None
+        # Naprawa niepoprawnych osobników (None = wyłączona)
+        if repair_mode is not None and repair_mode not in REPAIR_MODES:
+            raise ValueError(f"Nieznany tryb naprawy: {repair_mode}. Dostępne: {', '.join(REPAIR_MODES)}")
+        self.repair_mode = repair_mode
+        # Elitaryzm i sposób zastępowania populacji (patrz REPLACEMENT_MODES)
+        if replacement not in REPLACEMENT_MODES:
+            raise ValueError(f"Nieznany sposób zastępowania: {replacement}. Dostępne: {', '.join(REPLACEMENT_MODES)}")
+        if not 0 <= elitism < population_size:
+            raise ValueError(f"Liczba elitarnych osobników musi być z zakresu [0, {population_size}).")
+        if steady_state_size is None:
+            steady_state_size = max(2, population_size // 10)
+        if not 1 <= steady_state_size <= population_size:
+            raise ValueError(f"Liczba dzieci w trybie steady_state musi być z zakresu [1, {population_size}].")
+        self.elitism = elitism
+        self.replacement = replacement
+        self.steady_state_size = steady_state_size
+        # Własne generatory liczb losowych (zamiast globalnego modułu `random`), wyprowadzone z jednego ziarna
+        # (int lub np.random.SeedSequence, np. z `SeedSequence.spawn` dla równoległych procesów):
+        # `random` do szybkich pojedynczych losowań w operatorach, `rng` do losowań hurtowych w NumPy.
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        scalar_sequence, bulk_sequence = self.seed_sequence.spawn(2)
+        self.random = random.Random(int.from_bytes(scalar_sequence.generate_state(4).tobytes(), 'little'))
+        self.rng = np.random.default_rng(bulk_sequence)
+        self.mutation_buffer = []  # Pozycje mutacji wylosowane hurtowo dla kolejnych dzieci
+        # Licznik ocenionych osobników (na potrzeby pomiarów wydajności)
+        self.evaluations = 0
+        # Warunki wcześniejszego zatrzymania (domyślnie brak: zawsze `iterations` pokoleń)
+        self.stopping_criteria = StoppingCriteria()
+        self.stop_reason = None
+        # Przeszukiwanie lokalne najlepszych osobników (domyślnie wyłączone, patrz `set_local_search`)
+        self.local_search_fraction = None
+        self.local_search_budget = None
+        self.local_search_improvements = 0  # Liczba osobników ulepszonych przez przeszukiwanie lokalne
+        # Sterowanie adaptacyjne operatorami i parametrami (domyślnie wyłączone, patrz `set_adaptive_control`)
+        self.adaptive_control = None
+        self.offspring = []  # Dzieci z ostatniego pokolenia (do nagród sterowania adaptacyjnego)
+        # Numer bieżącego pokolenia i statystyki kolejnych pokoleń w tablicach (historia najlepszego fitnessu,
+        # średni fitness, różnorodność; patrz `history_store.HistoryRecorder`)
+        self.generation = 0
+        self.statistics = HistoryRecorder(iterations)
+        self.best_individual = None  # Najlepszy osobnik całej ewolucji (patrz `best_solution`)
+        # Hooki telemetrii: funkcje wywoływane z rekordem statystyk po każdym pokoleniu (patrz `add_hook`)
+        self.hooks = []
+        self.profiler = None
+        self.reported_evaluations = 0
+        
+        # Wczytanie danych z pliku (lub użycie gotowej instancji KnapsackInstance);
+        # `binary_cache` włącza binarną kopię pliku (patrz `load_instance`)
+        self.binary_cache = binary_cache
+        self.instance = data_file if isinstance(data_file, KnapsackInstance) else self.load_data(data_file)
+        self.capacity = self.instance.capacity
+        self.values = self.instance.values
+        self.weights = self.instance.weights
+        self.chromosome_length = len(self.instance)
+        if self.instance.dimensions > 1 and not self.supports_multidimensional:
+            raise ValueError(f"{type(self).__name__} obsługuje tylko jedno ograniczenie; "
+                             f"dla {self.instance.dimensions} ograniczeń użyj VectorizedGeneticAlgorithm.")
         
-        # Wczytanie danych z pliku
-        self.capacity, self.items = self.load_data(data_file)
-        self.chromosome_length = len(self.items)
+        # Indeks przedmiotów posortowanych malejąco wg stosunku wartość/waga (liczony raz na instancję);
+        # używany przez naprawę osobników, która dotyczy tylko jednego ograniczenia
+        self.ratio_order, self.min_weight_from = (None, None)
+        if self.instance.dimensions == 1:
+            self.ratio_order, self.min_weight_from = self.build_ratio_index()
         
         # Stworzenie pierwszej, losowej populacji
         self.population = self.create_initial_population()
 
     def load_data(self, data_file):
-        """Wczytuje dane problemu (pojemność i listę przedmiotów) z pliku tekstowego."""
-        items = []
-        with open(data_file, 'r') as f:
-            first_line = f.readline().split()
-            # Pierwsza linia pliku: [liczba_przedmiotow] [pojemnosc_plecaka]
-            capacity = int(first_line[1])
-            
-            # Kolejne linie: [wartosc] [waga]
-            for line in f:
-                if line.strip():  # Ignoruj puste linie
-                    value, weight = line.split()
-                    items.append(Item(int(value), int(weight)))
+        """
+        Wczytuje dane problemu (pojemność, wartości i wagi przedmiotów) z pliku tekstowego,
+        a przy `binary_cache` z jego binarnej kopii .npy (patrz `load_instance`).
+        """
+        return load_instance(data_file, self.binary_cache)
+
+    def create_individual(self, genotype=None, total_weight=None, total_value=None):
+        """
+        Tworzy osobnika o podanym (lub losowym) genotypie. Pamięć podręczna ocen jest sprawdzana
+        tylko wtedy, gdy sumy wagi i wartości nie są znane: z podanymi sumami (potomkowie liczeni
+        przyrostowo) ocena kosztuje O(1), a klucz genotypu i wyszukiwanie kosztowałyby więcej.
+        Trafienie pomija pełne przejście po genotypie i nie jest liczone w `evaluations`.
+        """
+        if genotype is None:
+            genotype = self.representation.random(self.chromosome_length, self.random)
         
-        return capacity, items
+        if self.fitness_cache is None or total_weight is not None:
+            self.evaluations += 1
+            return Individual(self.instance, genotype, self.representation, total_weight, total_value)
+        
+        key = self.representation.key(genotype)
+        cached = self.fitness_cache.get(key)
+        if cached is not None:
+            _, total_weight, total_value = cached
+            return Individual(self.instance, genotype, self.representation, total_weight, total_value)
+        
+        self.evaluations += 1
+        individual = Individual(self.instance, genotype, self.representation)
+        self.fitness_cache.put(key, (individual.fitness, individual.total_weight, individual.total_value))
+        return individual
 
     def create_initial_population(self):
         """Tworzy listę losowych osobników o rozmiarze `population_size`."""
-        return [Individual(self.items, self.capacity) for _ in range(self.population_size)]
+        return [self.repair(self.create_individual()) for _ in range(self.population_size)]
+
+    # --- NAPRAWA NIEPOPRAWNYCH OSOBNIKÓW ---
+
+    def build_ratio_index(self):
+        """
+        Zwraca listę indeksów przedmiotów posortowanych malejąco według stosunku wartość/waga
+        oraz listę `min_weight_from[k]` = najmniejsza waga wśród przedmiotów ratio_order[k:]
+        (pozwala przerwać dokładanie, gdy nic więcej się nie zmieści).
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = self.values / self.weights
+        # Przedmioty o zerowej wadze mają stosunek nieskończony; 0/0 traktujemy jako 0
+        ratios = np.nan_to_num(ratios, nan=0.0, posinf=np.inf)
+        order = np.argsort(-ratios, kind='stable')
+        
+        min_weight_from = np.minimum.accumulate(self.weights[order][::-1])[::-1]
+        return order.tolist(), min_weight_from.tolist()
+
+    def repair(self, individual):
+        """
+        Naprawia przeładowanego osobnika: usuwa przedmioty o najgorszym stosunku wartość/waga,
+        aż plecak przestanie być przeładowany, a potem zachłannie dokłada przedmioty
+        o najlepszym stosunku, które jeszcze się mieszczą. Poprawni osobnicy nie są zmieniani.
+        W trybie Baldwina zwracany osobnik zachowuje niepoprawny genotyp i sumy, a tylko jego fitness
+        pochodzi z naprawy; rozwiązanie odpowiadające temu fitnessowi daje `solution`.
+        """
+        if self.repair_mode is None or individual.total_weight <= self.capacity:
+            return individual
+        
+        genotype = individual.genotype
+        flipped, total_weight, total_value = self.repair_moves(genotype, individual.total_weight,
+                                                               individual.total_value)
+        
+        if self.repair_mode == "lamarckian":
+            # Naprawiony genotyp zastępuje oryginał
+            return self.create_individual(self.representation.flip(genotype, flipped), total_weight, total_value)
+        
+        # Tryb Baldwina: genotyp (i jego sumy) bez zmian, fitness jak po naprawie
+        self.evaluations += 1
+        repaired = Individual(self.instance, genotype, self.representation, individual.total_weight, individual.total_value)
+        repaired.fitness = total_value
+        return repaired
+
+    def repair_moves(self, genotype, total_weight, total_value):
+        """
+        Wyznacza naprawę przeładowanego genotypu (bez tworzenia osobnika i bez liczenia ocen).
+        Zwraca krotkę (pozycje genów do odwrócenia, waga po naprawie, wartość po naprawie).
+        """
+        weight_at = self.instance.weight_at
+        value_at = self.instance.value_at
+        flipped = []
+        
+        # 1. Usuwanie od najgorszego stosunku wartość/waga
+        for i in reversed(self.ratio_order):
+            if total_weight <= self.capacity:
+                break
+            if self.representation.get(genotype, i):
+                total_weight -= weight_at[i]
+                total_value -= value_at[i]
+                flipped.append(i)
+        removed = set(flipped)
+        
+        # 2. Zachłanne dokładanie od najlepszego stosunku
+        for position, i in enumerate(self.ratio_order):
+            if self.capacity - total_weight < self.min_weight_from[position]:
+                break  # Żaden z pozostałych przedmiotów już się nie zmieści
+            if i not in removed and weight_at[i] <= self.capacity - total_weight and not self.representation.get(genotype, i):
+                total_weight += weight_at[i]
+                total_value += value_at[i]
+                flipped.append(i)
+        return flipped, total_weight, total_value
+
+    def diversity(self):
+        """Różnorodność bieżącej populacji (średnia znormalizowana odległość Hamminga)."""
+        genotypes = [ind.genotype for ind in self.population]
+        return population_diversity(self.representation.to_matrix(genotypes, self.chromosome_length))
 
     def find_best_individual(self, population):
         """Znajduje i zwraca najlepszego osobnika z danej populacji."""
         return max(population, key=lambda ind: ind.fitness)
 
+    def solution(self, individual):
+        """
+        Rozwiązanie odpowiadające fitnessowi osobnika: krotka (lista 0/1, łączna waga, łączna wartość).
+        Przy włączonej naprawie przeładowany osobnik (tryb Baldwina) jest naprawiany przy eksporcie,
+        więc zwracany plecak jest poprawny, a jego wartość równa fitnessowi.
+        """
+        genotype = individual.genotype
+        total_weight, total_value = individual.total_weight, individual.total_value
+        if self.repair_mode is not None and total_weight > self.capacity:
+            flipped, total_weight, total_value = self.repair_moves(genotype, total_weight, total_value)
+            genotype = self.representation.flip(genotype, flipped)
+        return self.representation.to_list(genotype, self.chromosome_length), total_weight, total_value
+
+    def best_solution(self):
+        """
+        Najlepsze rozwiązanie całej ewolucji (osobnik, którego fitness jest maksimum historii):
+        krotka z `solution` uzupełniona o jego fitness, albo None przed pierwszym pokoleniem.
+        """
+        if self.best_individual is None:
+            return None
+        return self.solution(self.best_individual) + (self.best_individual.fitness,)
+
     # --- METODY SELEKCJI ---
 
+    def fitness_array(self):
+        """Zwraca fitness wszystkich osobników bieżącej populacji jako tablicę NumPy."""
+        return np.fromiter((ind.fitness for ind in self.population), dtype=np.float64, count=len(self.population))
+
     def selection_roulette_wheel(self):
-        """Metoda selekcji kołem ruletki."""
-        total_fitness = sum(ind.fitness for ind in self.population)
+        """Metoda selekcji kołem ruletki (skumulowane sumy + wyszukiwanie binarne)."""
+        cumulative = np.cumsum(self.fitness_array())
+        total_fitness = cumulative[-1]
         
         if total_fitness == 0:
             # Sytuacja awaryjna (np. cała populacja ma fitness 0)
-            return [random.choice(self.population) for _ in range(self.population_size)]
+            return [self.random.choice(self.population) for _ in range(self.population_size)]
 
-        # Prawdopodobieństwo wyboru jest proporcjonalne do fitnessu
-        selection_probs = [ind.fitness / total_fitness for ind in self.population]
+        # Prawdopodobieństwo wyboru jest proporcjonalne do fitnessu: losujemy hurtowo (generator NumPy)
+        # punkty na odcinku [0, total_fitness) i szukamy ich przedziałów
+        points = self.rng.random(self.population_size) * total_fitness
+        # (przycięcie chroni przed błędem zaokrąglenia dla punktu równego sumie)
+        indices = np.minimum(np.searchsorted(cumulative, points, side='right'), len(cumulative) - 1)
         
         # Losowanie `population_size` osobników do nowej puli rodziców
-        selected_population = random.choices(
-            self.population,
-            weights=selection_probs,
-            k=self.population_size
-        )
-        return selected_population
+        population = self.population
+        return [population[i] for i in indices.tolist()]
+
+    def rank_alias_table(self, size):
+        """
+        Tablica aliasów dla wag rang 1, 2, ..., size. Zależy tylko od rozmiaru populacji,
+        więc jest budowana raz i używana ponownie w kolejnych pokoleniach.
+        """
+        table = getattr(self, "_rank_alias_table", None)
+        if table is None or table.size != size:
+            table = AliasTable(range(1, size + 1))
+            self._rank_alias_table = table
+        return table
 
     def selection_rank(self):
         """Metoda selekcji rankingowej."""
-        # Sortowanie populacji od najgorszego do najlepszego
-        sorted_population = sorted(self.population, key=lambda ind: ind.fitness)
+        # Indeksy populacji od najgorszego do najlepszego
+        sorted_indices = np.argsort(self.fitness_array(), kind='stable').tolist()
         
-        N = self.population_size
-        total_rank_sum = N * (N + 1) / 2  # Suma rang (1 + 2 + ... + N)
+        # Prawdopodobieństwo wyboru jest proporcjonalne do miejsca w rankingu (1 + 2 + ... + N)
+        table = self.rank_alias_table(len(sorted_indices))
         
-        if total_rank_sum == 0:
-             # Sytuacja awaryjna
-             return [random.choice(self.population) for _ in range(self.population_size)]
+        # Losowanie `population_size` osobników do nowej puli rodziców
+        population = self.population
+        return [population[sorted_indices[rank]] for rank in table.sample(self.population_size, self.random)]
 
-        # Prawdopodobieństwo wyboru jest proporcjonalne do miejsca w rankingu
-        selection_probs = [(i + 1) / total_rank_sum for i in range(N)]
+    def selection_stochastic_universal(self):
+        """
+        Próbkowanie stochastyczne uniwersalne (SUS): jedno losowanie i `population_size`
+        równo rozstawionych wskaźników na kole ruletki. Mniejsza wariancja niż zwykła ruletka.
+        """
+        cumulative = np.cumsum(self.fitness_array())
+        total_fitness = cumulative[-1]
         
-        # Losowanie `population_size` osobników do nowej puli rodziców
-        selected_population = random.choices(
-            sorted_population,
-            weights=selection_probs,
-            k=N
-        )
+        if total_fitness == 0:
+            # Sytuacja awaryjna (np. cała populacja ma fitness 0)
+            return [self.random.choice(self.population) for _ in range(self.population_size)]
+        
+        step = total_fitness / self.population_size
+        pointers = self.random.random() * step + step * np.arange(self.population_size)
+        indices = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(cumulative) - 1)
+        
+        population = self.population
+        return [population[i] for i in indices.tolist()]
+
+    def selection_tournament(self):
+        """
+        Selekcja turniejowa: dla każdego miejsca w puli losujemy `tournament_size`
+        osobników (ze zwracaniem) i wybieramy najlepszego z nich.
+        """
+        population = self.population
+        size = len(population)
+        selected_population = []
+        for _ in range(self.population_size):
+            best = population[int(self.random.random() * size)]
+            for _ in range(self.tournament_size - 1):
+                candidate = population[int(self.random.random() * size)]
+                if candidate.fitness > best.fitness:
+                    best = candidate
+            selected_population.append(best)
         return selected_population
 
     # --- METODY KRZYŻOWANIA ---
 
     def crossover_one_point(self, parent1, parent2):
         """Krzyżowanie jednopunktowe."""
-        if random.random() > self.crossover_prob:
+        if self.random.random() > self.crossover_prob:
             # Jeśli losowanie się nie powiodło, zwróć rodziców bez zmian
             return parent1, parent2
         
         # Losowanie punktu cięcia (od 1 do przedostatniego bitu)
-        cut_point = random.randint(1, self.chromosome_length - 1)
+        cut_point = self.random.randint(1, self.chromosome_length - 1)
         
         # Tworzenie genotypów dzieci
-        child1_genotype = parent1.genotype[:cut_point] + parent2.genotype[cut_point:]
-        child2_genotype = parent2.genotype[:cut_point] + parent1.genotype[cut_point:]
+        child1_genotype, child2_genotype = self.representation.one_point(parent1.genotype, parent2.genotype, cut_point)
+        
+        # Sumy dzieci liczone przyrostowo na krótszym z dwóch odcinków
+        if cut_point >= self.chromosome_length - cut_point:
+            # child1 = parent1 z końcówką [cut_point, n) od parent2
+            delta_weight, delta_value = self.segment_delta(parent1.genotype, parent2.genotype, cut_point, self.chromosome_length)
+            base1, base2 = parent1, parent2
+        else:
+            # child1 = parent2 z początkiem [0, cut_point) od parent1
+            delta_weight, delta_value = self.segment_delta(parent2.genotype, parent1.genotype, 0, cut_point)
+            base1, base2 = parent2, parent1
         
         # Tworzenie nowych obiektów Individual z nowymi genotypami
-        child1 = Individual(self.items, self.capacity, child1_genotype)
-        child2 = Individual(self.items, self.capacity, child2_genotype)
+        child1 = self.create_individual(child1_genotype, base1.total_weight + delta_weight, base1.total_value + delta_value)
+        child2 = self.create_individual(child2_genotype, base2.total_weight - delta_weight, base2.total_value - delta_value)
         
         return child1, child2
 
     def crossover_two_point(self, parent1, parent2):
         """Krzyżowanie dwupunktowe."""
-        if random.random() > self.crossover_prob:
+        if self.random.random() > self.crossover_prob:
             # Jeśli losowanie się nie powiodło, zwróć rodziców bez zmian
             return parent1, parent2
         
         # Losowanie dwóch różnych punktów cięcia
-        p1, p2 = sorted(random.sample(range(1, self.chromosome_length), 2))
-        
-        gen1 = parent1.genotype
-        gen2 = parent2.genotype
+        p1, p2 = sorted(self.random.sample(range(1, self.chromosome_length), 2))
         
         # Wymiana "środkowej" części genotypu
-        child1_genotype = gen1[:p1] + gen2[p1:p2] + gen1[p2:]
-        child2_genotype = gen2[:p1] + gen1[p1:p2] + gen2[p2:]
+        child1_genotype, child2_genotype = self.representation.two_point(parent1.genotype, parent2.genotype, p1, p2)
+        
+        # child1 = parent1 ze środkiem od parent2 (child2 dostaje zmianę przeciwną)
+        delta_weight, delta_value = self.segment_delta(parent1.genotype, parent2.genotype, p1, p2)
         
-        child1 = Individual(self.items, self.capacity, child1_genotype)
-        child2 = Individual(self.items, self.capacity, child2_genotype)
+        child1 = self.create_individual(child1_genotype, parent1.total_weight + delta_weight, parent1.total_value + delta_value)
+        child2 = self.create_individual(child2_genotype, parent2.total_weight - delta_weight, parent2.total_value - delta_value)
         
         return child1, child2
 
+    def segment_delta(self, base_genotype, donor_genotype, start, stop):
+        """
+        Zmiana (waga, wartość) po skopiowaniu odcinka [start, stop) z `donor_genotype`
+        do `base_genotype`. Uwzględnia tylko geny, którymi oba genotypy się różnią.
+        """
+        gained, lost = self.representation.diff_indices(base_genotype, donor_genotype, start, stop)
+        
+        weight_at = self.instance.weight_at
+        value_at = self.instance.value_at
+        
+        delta_weight = 0
+        delta_value = 0
+        for i in gained:
+            delta_weight += weight_at[i]
+            delta_value += value_at[i]
+        for i in lost:
+            delta_weight -= weight_at[i]
+            delta_value -= value_at[i]
+        return delta_weight, delta_value
+
     # --- METODA MUTACJI ---
 
+    def draw_mutation_positions(self, count):
+        """
+        Losuje hurtowo pozycje genów do odwrócenia dla `count` chromosomów naraz.
+        Zamiast losować liczbę dla każdego genu, losuje jedną tablicą NumPy odstępy
+        między kolejnymi mutacjami (rozkład geometryczny) w połączonych chromosomach,
+        więc koszt zależy od liczby mutacji, a nie od długości chromosomu.
+        Zwraca listę `count` list pozycji.
+        """
+        length = self.chromosome_length
+        if self.mutation_prob <= 0:
+            return [[] for _ in range(count)]
+        if self.mutation_prob >= 1:
+            return [list(range(length)) for _ in range(count)]
+        
+        total = count * length
+        expected = total * self.mutation_prob
+        # Zapas ponad wartość oczekiwaną, żeby zwykle wystarczyło jedno losowanie
+        batch = int(expected + 5 * math.sqrt(expected)) + 16
+        positions = np.cumsum(self.rng.geometric(self.mutation_prob, size=batch)) - 1
+        while positions[-1] < total:
+            more = positions[-1] + np.cumsum(self.rng.geometric(self.mutation_prob, size=batch))
+            positions = np.concatenate((positions, more))
+        positions = positions[positions < total]
+        
+        # Podział na chromosomy: numer chromosomu i pozycja genu w nim
+        bounds = np.searchsorted(positions // length, np.arange(count + 1)).tolist()
+        genes = (positions % length).tolist()
+        return [genes[bounds[k]:bounds[k + 1]] for k in range(count)]
+
+    def mutation_positions(self):
+        """Zwraca pozycje mutacji dla kolejnego dziecka (z puli wylosowanej hurtowo w `breed`)."""
+        if not self.mutation_buffer:
+            self.mutation_buffer = self.draw_mutation_positions(1)
+        return self.mutation_buffer.pop()
+
     def mutate(self, individual):
         """Mutacja osobnika poprzez odwrócenie bitów (bit-flip)."""
-        genotype = individual.genotype[:]  # Stwórz kopię genotypu
+        positions = self.mutation_positions()
+        if not positions:
+            # Mutacja nie zaszła: osobnik pozostaje bez zmian (bez tworzenia nowego obiektu)
+            return individual
+        
+        # Aktualizacja sum tylko o odwracane geny (bez ponownego przeliczania całości)
+        total_weight = individual.total_weight
+        total_value = individual.total_value
+        weight_at = self.instance.weight_at
+        value_at = self.instance.value_at
+        for i in positions:
+            if self.representation.get(individual.genotype, i):
+                # Gen 1 -> 0: przedmiot wypada z plecaka
+                total_weight -= weight_at[i]
+                total_value -= value_at[i]
+            else:
+                # Gen 0 -> 1: przedmiot trafia do plecaka
+                total_weight += weight_at[i]
+                total_value += value_at[i]
         
-        for i in range(self.chromosome_length):
-            if random.random() < self.mutation_prob:
-                # Jeśli losowanie się powiodło, odwróć bit (0 -> 1, 1 -> 0)
-                genotype[i] = 1 - genotype[i]
+        # Odwróć bity (0 -> 1, 1 -> 0) na wylosowanych pozycjach
+        genotype = self.representation.flip(individual.genotype, positions)
         
-        # Zwróć nowego osobnika (lub starego, jeśli mutacja nie zaszła)
-        return Individual(self.items, self.capacity, genotype)
+        # Zwróć nowego osobnika ze zaktualizowanymi sumami
+        return self.create_individual(genotype, total_weight, total_value)
 
     # --- GŁÓWNA PĘTLA EWOLUCJI ---
 
-    def run_evolution(self, selection_method, crossover_method):
+    def offspring_count(self):
+        """Liczba dzieci tworzonych w jednym pokoleniu (zależy od sposobu zastępowania i elitaryzmu)."""
+        if self.replacement == "steady_state":
+            return self.steady_state_size
+        return self.population_size - self.elitism
+
+    def evolve_generation(self, selection_method, crossover_method):
+        """
+        Wykonuje jeden krok ewolucji (selekcja, krzyżowanie, mutacja) i zwraca nową populację.
+        W trybie pokoleniowym tworzy nową listę (z `elitism` najlepszymi osobnikami przeniesionymi
+        bez zmian i bez ponownej oceny), a w trybie "steady_state" podmienia w miejscu
+        najgorszych osobników istniejącej listy `self.population` i zwraca tę samą listę.
+        Przy włączonym przeszukiwaniu lokalnym najlepsi osobnicy nowej populacji są następnie ulepszani.
+        """
+        # 1. Selekcja -> Stworzenie puli rodziców
+        parents_pool = selection_method()
+        
+        # 2. Krzyżowanie i mutacja -> dzieci
+        children = self.breed(parents_pool, crossover_method, self.offspring_count())
+        self.offspring = children
+        
+        # 3. Zastąpienie populacji
+        if self.replacement == "steady_state":
+            # Dzieci zajmują miejsca najgorszych osobników (bez budowania nowej listy)
+            worst = np.argpartition(self.fitness_array(), len(children) - 1)[:len(children)]
+            for index, child in zip(worst.tolist(), children):
+                self.population[index] = child
+            population = self.population
+        elif self.elitism:
+            # Najlepsi osobnicy przechodzą do nowej populacji bez zmian (te same obiekty)
+            population = heapq.nlargest(self.elitism, self.population, key=lambda ind: ind.fitness) + children
+        else:
+            population = children
+        
+        # 4. Opcjonalne przeszukiwanie lokalne najlepszych osobników (algorytm memetyczny)
+        if self.local_search_fraction:
+            self.improve_population(population)
+        return population
+
+    def breed(self, parents_pool, crossover_method, count):
+        """Tworzy `count` dzieci z par losowanych z puli rodziców (krzyżowanie, mutacja, naprawa)."""
+        new_population = []
+        # Pozycje mutacji dla wszystkich dzieci (także nadmiarowego drugiego) losowane jednym wywołaniem
+        self.mutation_buffer = self.draw_mutation_positions(2 * ((count + 1) // 2))
+        
+        # Wypełnij listę dziećmi
+        while len(new_population) < count:
+            # a. Wybierz 2 rodziców z puli
+            parent1, parent2 = self.random.sample(parents_pool, 2)
+            
+            # b. Krzyżowanie
+            child1, child2 = crossover_method(parent1, parent2)
+            
+            # c. Mutacja (i opcjonalna naprawa niepoprawnych dzieci)
+            child1 = self.repair(self.mutate(child1))
+            child2 = self.repair(self.mutate(child2))
+            
+            # d. Dodaj dzieci do listy
+            new_population.append(child1)
+            if len(new_population) < count:
+                # Dodaj drugie dziecko tylko, jeśli jest jeszcze miejsce
+                new_population.append(child2)
+        
+        return new_population
+
+    def run_evolution(self, selection_method, crossover_method, checkpoint_path=None, checkpoint_interval=None):
         """
-        Uruchamia główną pętlę algorytmu genetycznego na `iterations` pokoleń.
+        Uruchamia główną pętlę algorytmu genetycznego na `iterations` pokoleń
+        (lub krócej, jeśli spełniony zostanie warunek z `set_stopping_criteria`).
+        Zwraca `EvolutionHistory`: listę najlepszego fitnessu z każdej generacji
+        z atrybutami `stop_reason` i `generations`.
+
+        :param checkpoint_path: (Opcjonalnie) Plik .npz, do którego zapisywany jest punkt kontrolny
+                                co `checkpoint_interval` pokoleń oraz po zakończeniu ewolucji.
+                                Przerwaną ewolucję można kontynuować przez `resume_evolution`.
         """
         
         print(f"Start ewolucji: Selekcja={selection_method.__name__}, Krzyżowanie={crossover_method.__name__}")
         
-        # Resetowanie populacji na początku każdego eksperymentu
+        # Resetowanie populacji (i pamięci podręcznej ocen) na początku każdego eksperymentu
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+        self.evaluations = 0
+        self.local_search_improvements = 0
+        self.stopping_criteria.start()
+        if self.adaptive_control is not None:
+            self.adaptive_control.start()
+        self.stop_reason = "iterations"
+        self.reported_evaluations = 0
+        # Pomiar czasu faz tylko przy podłączonych hookach (czas populacji początkowej trafia do pokolenia 0)
+        self.profiler = self.attach_profiler() if self.hooks else None
         self.population = self.create_initial_population()
-        best_fitness_history = []  # Lista do przechowywania najlepszego fitnessu z każdej generacji
+        self.generation = 0
+        self.statistics = HistoryRecorder(self.iterations)
+        self.best_individual = None
+        
+        return self.evolution_loop(selection_method, crossover_method, checkpoint_path, checkpoint_interval)
+
+    def resume_evolution(self, checkpoint_path, selection_method=None, crossover_method=None,
+                         checkpoint_interval=None):
+        """
+        Kontynuuje ewolucję od punktu kontrolnego zapisanego przez `run_evolution`.
+        Odtwarza populację, historię, licznik pokoleń, parametry i stan generatora liczb losowych,
+        więc dalszy przebieg jest identyczny jak w nieprzerwanym uruchomieniu.
+        Metody selekcji i krzyżowania domyślnie są brane z punktu kontrolnego.
+        Zwraca pełną `EvolutionHistory` (razem z pokoleniami sprzed przerwania).
+        """
+        arrays, meta = load_checkpoint(checkpoint_path)
+        self.restore_checkpoint(arrays, meta)
+        
+        selection_method = selection_method or getattr(self, meta["selection"])
+        crossover_method = crossover_method or getattr(self, meta["crossover"])
+        if checkpoint_interval is None:
+            checkpoint_interval = meta["checkpoint_interval"]
+        
+        if meta["finished"]:
+            # Ewolucja zakończyła się przed zapisem -> nie ma czego kontynuować
+            print(f"Punkt kontrolny {checkpoint_path} zawiera zakończoną ewolucję.")
+            return self.evolution_history()
+        
+        print(f"Wznowienie ewolucji od iteracji {self.generation + 1}/{self.iterations}: "
+              f"Selekcja={selection_method.__name__}, Krzyżowanie={crossover_method.__name__}")
+        self.reported_evaluations = self.evaluations
+        self.profiler = self.attach_profiler() if self.hooks else None
+        return self.evolution_loop(selection_method, crossover_method, checkpoint_path, checkpoint_interval)
+
+    def evolution_loop(self, selection_method, crossover_method, checkpoint_path=None, checkpoint_interval=None):
+        """Pętla ewolucji od pokolenia `self.generation` (wspólna dla `run_evolution` i `resume_evolution`)."""
+        try:
+            history = self.run_generations(selection_method, crossover_method, checkpoint_path, checkpoint_interval)
+        finally:
+            self.detach_profiler()
+        if self.adaptive_control is not None:
+            self.report_adaptive_control()
+        return history
+
+    def evolution_history(self):
+        """
+        Zwraca `EvolutionHistory` bieżącej ewolucji: historię najlepszego fitnessu z tablicami statystyk
+        pokoleń w `columns` (i harmonogramem sterowania adaptacyjnego, jeśli jest).
+        """
+        statistics = self.statistics
+        schedule = self.adaptive_control.schedule if self.adaptive_control is not None else None
+        return EvolutionHistory(statistics.values(), self.stop_reason, statistics.length, schedule,
+                                statistics.result())
 
-        # Pętla główna - wykonuje się 'iterations' razy
-        for i in range(self.iterations):
-            # 1. Znajdź najlepszego osobnika w bieżącej populacji
-            best_in_gen = self.find_best_individual(self.population)
-            # Zapisz jego fitness do historii (na potrzeby wykresu)
-            best_fitness_history.append(best_in_gen.fitness)
+    def run_generations(self, selection_method, crossover_method, checkpoint_path, checkpoint_interval):
+        """Właściwa pętla pokoleń wywoływana przez `evolution_loop`."""
+        statistics = self.statistics
+        profiler = self.profiler
+        if profiler is not None:
+            selection_method = profiler.wrap("selection", selection_method)
+            crossover_method = profiler.wrap("crossover", crossover_method)
+        adaptive = self.adaptive_control
+        methods = self.adaptive_methods() if adaptive is not None else None
+        
+        # Pętla główna - wykonuje się (pozostałe z) 'iterations' razy
+        for i in range(self.generation, self.iterations):
+            # 1. Znajdź najlepszego osobnika w bieżącej populacji i zapisz statystyki pokolenia
+            fitness = self.fitness_array()
+            best_in_gen = self.population[int(fitness.argmax())]
+            diversity = self.diversity()
+            statistics.record(i, best_in_gen.fitness, isinstance(best_in_gen.fitness, (int, np.integer)),
+                              fitness.mean(), diversity)
+            if self.best_individual is None or best_in_gen.fitness > self.best_individual.fitness:
+                self.best_individual = best_in_gen
+            if profiler is not None:
+                self.report_generation(i)
 
             # Logowanie postępów co 20 generacji
             if (i + 1) % 20 == 0:
@@ -238,35 +944,395 @@ class GeneticAlgorithm:
                 else:
                     print(f"Iteracja {i+1}/{self.iterations}: Najlepszy Fitness = {current_fitness}")
 
-            # 2. Selekcja -> Stworzenie puli rodziców
-            parents_pool = selection_method()
-            
-            # 3. Tworzenie nowej populacji
-            new_population = []
-            
-            # Wypełnij nową populację dziećmi
-            while len(new_population) < self.population_size:
-                # a. Wybierz 2 rodziców z puli
-                parent1, parent2 = random.sample(parents_pool, 2)
-                
-                # b. Krzyżowanie
-                child1, child2 = crossover_method(parent1, parent2)
-                
-                # c. Mutacja
-                child1 = self.mutate(child1)
-                child2 = self.mutate(child2)
-                
-                # d. Dodaj dzieci do nowej populacji
-                new_population.append(child1)
-                if len(new_population) < self.population_size:
-                    # Dodaj drugie dziecko tylko, jeśli jest jeszcze miejsce
-                    new_population.append(child2)
+            # 2. Sprawdzenie warunków wcześniejszego zakończenia
+            reason = self.stopping_criteria.check(i, best_in_gen.fitness, self.evaluations, lambda: diversity)
+            if reason is not None:
+                self.stop_reason = reason
+                print(f"Wcześniejsze zakończenie w iteracji {i+1}: {reason}")
+                break
+
+            # 3. Selekcja, krzyżowanie i mutacja -> zastąp starą populację nową
+            #    (przy sterowaniu adaptacyjnym operatory wybiera bandyta, a po pokoleniu zmieniane są parametry)
+            if adaptive is not None:
+                selection_name, crossover_name = adaptive.choose(self.random)
+                selection_method, crossover_method = methods[selection_name], methods[crossover_name]
+                previous_fitness = self.fitness_array()
+            self.population = self.evolve_generation(selection_method, crossover_method)
+            if adaptive is not None:
+                adaptive.record(self, i, previous_fitness, [child.fitness for child in self.offspring])
+            self.generation = i + 1
             
-            # 4. Zastąp starą populację nową
-            self.population = new_population
+            # 4. Okresowy punkt kontrolny (stan na początku następnego pokolenia)
+            if checkpoint_path and checkpoint_interval and self.generation % checkpoint_interval == 0:
+                self.save_checkpoint(checkpoint_path, selection_method, crossover_method, checkpoint_interval)
         
         print("Ewolucja zakończona.")
-        return best_fitness_history
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path, selection_method, crossover_method, checkpoint_interval,
+                                 finished=True)
+        if self.fitness_cache is not None:
+            print(f"Pamięć podręczna ocen: trafienia={self.fitness_cache.hits}, chybienia={self.fitness_cache.misses} "
+                  f"({self.fitness_cache.hit_rate():.1%})")
+        if self.local_search_fraction:
+            print(f"Przeszukiwanie lokalne: ulepszono {self.local_search_improvements} osobników")
+        return self.evolution_history()
+
+    # --- PRZESZUKIWANIE LOKALNE (ALGORYTM MEMETYCZNY) ---
+
+    def set_local_search(self, fraction=0.1, budget=None):
+        """
+        Włącza przeszukiwanie lokalne w każdym pokoleniu: najlepsze `fraction` populacji jest
+        ulepszane ruchami 1-flip (dołożenie przedmiotu) i 1-swap (zamiana przedmiotu w plecaku
+        na przedmiot spoza niego), aż do wyczerpania budżetu `budget` sprawdzonych ruchów na pokolenie
+        (domyślnie 10 * liczba przedmiotów). `fraction=None` wyłącza przeszukiwanie.
+        """
+        if fraction is not None and not 0.0 < fraction <= 1.0:
+            raise ValueError("Odsetek osobników do przeszukiwania lokalnego musi być z zakresu (0, 1].")
+        if budget is not None and budget < 1:
+            raise ValueError("Budżet przeszukiwania lokalnego musi być dodatni.")
+        self.local_search_fraction = fraction
+        self.local_search_budget = budget
+
+    def improve_population(self, population):
+        """Zastępuje w miejscu najlepsze osobniki listy `population` wynikami `local_search`."""
+        count = max(1, int(len(population) * self.local_search_fraction))
+        budget = self.local_search_budget or 10 * self.chromosome_length
+        moves_per_individual = max(1, budget // count)
+        ranked = heapq.nlargest(count, range(len(population)), key=lambda index: population[index].fitness)
+        for index in ranked:
+            population[index] = self.local_search(population[index], moves_per_individual)
+
+    def local_search(self, individual, max_moves):
+        """
+        Wspinaczka (pierwsza poprawa) w sąsiedztwie 1-flip/1-swap poprawnego osobnika.
+        Każdy ruch to losowa para: przedmiot w plecaku `i` i przedmiot spoza plecaka `j`.
+        Najpierw sprawdzane jest dołożenie `j` (zysk v_j), potem zamiana `i` na `j` (zysk v_j - v_i,
+        przyjmowana także przy zerowym zysku, jeśli zwalnia miejsce). Zysk i dopuszczalność
+        liczone są w O(1) z sum osobnika i tablic wartości/wag przedmiotów, bez przeglądania genotypu.
+        Zwraca nowego osobnika (lub tego samego, jeśli nie znaleziono poprawy).
+        """
+        if individual.total_weight > self.capacity:
+            return individual  # Niepoprawnymi osobnikami zajmuje się naprawa
+        
+        weight_at = self.instance.weight_at
+        value_at = self.instance.value_at
+        randrange = self.random.randrange
+        inside = self.representation.selected_indices(individual.genotype)
+        in_knapsack = set(inside)
+        outside = [i for i in range(self.chromosome_length) if i not in in_knapsack]
+        if not outside:
+            return individual
+        
+        slack = self.capacity - individual.total_weight
+        total_value = individual.total_value
+        changed = set()  # Pozycje genów różniące się od oryginału
+        for _ in range(max_moves):
+            b = randrange(len(outside))
+            j = outside[b]
+            if weight_at[j] <= slack:
+                # 1-flip: dołożenie przedmiotu j (przenosimy go na koniec listy `inside`)
+                slack -= weight_at[j]
+                total_value += value_at[j]
+                inside.append(j)
+                outside[b] = outside[-1]
+                outside.pop()
+                changed ^= {j}
+                if not outside:
+                    break
+                continue
+            if not inside:
+                continue
+            a = randrange(len(inside))
+            i = inside[a]
+            gain = value_at[j] - value_at[i]
+            weight_change = weight_at[j] - weight_at[i]
+            if weight_change <= slack and (gain > 0 or (gain == 0 and weight_change < 0)):
+                # 1-swap: i wypada z plecaka, j do niego trafia (zamiana miejscami na listach)
+                slack -= weight_change
+                total_value += gain
+                inside[a], outside[b] = j, i
+                changed ^= {i, j}
+        
+        if not changed:
+            return individual
+        self.local_search_improvements += 1
+        genotype = self.representation.flip(individual.genotype, sorted(changed))
+        return self.create_individual(genotype, self.capacity - slack, total_value)
+
+    # --- STEROWANIE ADAPTACYJNE ---
+
+    def set_adaptive_control(self, **options):
+        """
+        Włącza sterowanie adaptacyjne w `run_evolution`: wybór operatorów selekcji i krzyżowania
+        przez wielorękiego bandytę oraz dopasowywanie prawdopodobieństw mutacji i krzyżowania
+        do różnorodności i stagnacji (opcje i opis w `adaptive.AdaptiveControl`).
+        Metody przekazane do `run_evolution` są wtedy używane tylko w logach i punktach kontrolnych.
+        Wybrany harmonogram jest dostępny jako `EvolutionHistory.schedule`.
+        """
+        control = AdaptiveControl(**options)
+        missing = [name for name in control.selection_bandit.arms + control.crossover_bandit.arms
+                   if not callable(getattr(self, name, None))]
+        if missing:
+            raise ValueError(f"Nieznane operatory: {', '.join(missing)}")
+        self.adaptive_control = control
+
+    def adaptive_methods(self):
+        """Operatory, spośród których wybiera sterowanie adaptacyjne: nazwa -> metoda (z pomiarem czasu)."""
+        control = self.adaptive_control
+        methods = {}
+        for phase, bandit in (("selection", control.selection_bandit), ("crossover", control.crossover_bandit)):
+            for name in bandit.arms:
+                method = getattr(self, name)
+                methods[name] = self.profiler.wrap(phase, method) if self.profiler is not None else method
+        return methods
+
+    def report_adaptive_control(self):
+        """Wypisuje podsumowanie harmonogramu wybranego przez sterowanie adaptacyjne."""
+        summary = self.adaptive_control.summary()
+        if not summary["generations"]:
+            return
+        print(f"Sterowanie adaptacyjne ({summary['generations']} pokoleń): "
+              f"selekcja {summary['selection']}, krzyżowanie {summary['crossover']}")
+        print(f"  P. mutacji: średnio {summary['mean_mutation_prob']:.4f}, na końcu {summary['final_mutation_prob']:.4f}; "
+              f"p. krzyżowania: średnio {summary['mean_crossover_prob']:.3f}, na końcu {summary['final_crossover_prob']:.3f}")
+
+    # --- TELEMETRIA ---
+
+    def add_hook(self, hook):
+        """
+        Podłącza hook telemetrii: funkcję (np. `telemetry.InMemoryRecorder` lub `telemetry.JsonLinesWriter`)
+        wywoływaną po każdym pokoleniu ze słownikiem: numer pokolenia, najlepszy/średni/najgorszy fitness,
+        różnorodność, liczba ocen i nowych osobników oraz czasy faz (`telemetry.PHASES`) w sekundach.
+        Bez podłączonych hooków statystyki nie są liczone.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Odłącza hook telemetrii."""
+        self.hooks.remove(hook)
+
+    def attach_profiler(self):
+        """Podmienia operatory na wersje mierzące czas faz. Zwraca `PhaseProfiler`."""
+        profiler = PhaseProfiler()
+        self.mutate = profiler.wrap("mutation", self.mutate)
+        self.repair = profiler.wrap("repair", self.repair)
+        self.local_search = profiler.wrap("local_search", self.local_search)
+        self.create_individual = profiler.wrap_evaluation(self.create_individual)
+        return profiler
+
+    def detach_profiler(self):
+        """Przywraca oryginalne operatory (usuwa nakładki z `attach_profiler`)."""
+        for name in ("mutate", "repair", "local_search", "create_individual", "evaluate_population"):
+            self.__dict__.pop(name, None)
+        self.profiler = None
+
+    def report_generation(self, generation):
+        """
+        Wysyła do hooków rekord statystyk bieżącej populacji (najlepszy i średni fitness oraz różnorodność
+        już zapisane w `statistics`) i zeruje liczniki profilera.
+        """
+        columns = self.statistics.columns
+        profiler = self.profiler
+        record = {
+            "generation": generation,
+            "best": float(columns["best"][generation]),
+            "mean": float(columns["mean"][generation]),
+            "worst": float(self.fitness_array().min()),
+            "diversity": float(columns["diversity"][generation]),
+            "evaluations": self.evaluations - self.reported_evaluations,
+            "allocations": profiler.allocations,
+            "timings": profiler.times,
+        }
+        self.reported_evaluations = self.evaluations
+        profiler.reset()
+        for hook in self.hooks:
+            hook(record)
+
+    # --- PUNKTY KONTROLNE ---
+
+    def save_checkpoint(self, path, selection_method, crossover_method, checkpoint_interval=None, finished=False):
+        """
+        Zapisuje stan ewolucji do pliku .npz (format w module `checkpoints`): populację
+        (`checkpoint_population`), historię, stan obu generatorów liczb losowych, parametry,
+        warunki zatrzymania i stan sterowania adaptacyjnego.
+        """
+        length = self.chromosome_length
+        to_bytes = self.representation.to_bytes
+        row_size = (length + 7) // 8
+        
+        columns = self.statistics.result()
+        rng_state, rng_meta = pack_random_state(self.random.getstate())
+        
+        arrays = dict(self.checkpoint_population(), history=columns["best"], history_is_int=columns["feasible"],
+                      history_mean=columns["mean"], history_diversity=columns["diversity"], rng_state=rng_state)
+        
+        # Zawartość pamięci podręcznej ocen (w kolejności LRU), aby licznik ocen też się zgadzał
+        cache_meta = None
+        if self.fitness_cache is not None:
+            entries = list(self.fitness_cache.entries.items())
+            from_key = self.representation.from_key
+            arrays["cache_genotypes"] = np.frombuffer(
+                b"".join(to_bytes(from_key(key, length), length) for key, _ in entries),
+                dtype=np.uint8).reshape(len(entries), row_size)
+            arrays["cache_totals"] = np.array([entry[1:] for _, entry in entries], dtype=np.int64).reshape(-1, 2)
+            cache_meta = {"max_size": self.fitness_cache.max_size,
+                          "hits": self.fitness_cache.hits, "misses": self.fitness_cache.misses}
+        
+        criteria = self.stopping_criteria
+        meta = {
+            "generation": self.generation,
+            "finished": finished,
+            "stop_reason": self.stop_reason,
+            "evaluations": self.evaluations,
+            "local_search_improvements": self.local_search_improvements,
+            "selection": selection_method.__name__,
+            "crossover": crossover_method.__name__,
+            "checkpoint_interval": checkpoint_interval,
+            "parameters": {
+                "population_size": self.population_size,
+                "crossover_prob": self.crossover_prob,
+                "mutation_prob": self.mutation_prob,
+                "iterations": self.iterations,
+                "tournament_size": self.tournament_size,
+                "repair_mode": self.repair_mode,
+                "elitism": self.elitism,
+                "replacement": self.replacement,
+                "steady_state_size": self.steady_state_size,
+                "representation": self.representation.name,
+                "local_search_fraction": self.local_search_fraction,
+                "local_search_budget": self.local_search_budget,
+            },
+            "stopping_criteria": {
+                "target_fitness": criteria.target_fitness,
+                "stall_generations": criteria.stall_generations,
+                "min_diversity": criteria.min_diversity,
+                "time_limit": criteria.time_limit,
+                "max_evaluations": criteria.max_evaluations,
+                "best_fitness": criteria.best_fitness,
+                "last_improvement": criteria.last_improvement,
+                "elapsed": time.perf_counter() - criteria.start_time,
+            },
+            "fitness_cache": cache_meta,
+            "adaptive_control": self.adaptive_control.state() if self.adaptive_control is not None else None,
+            # Pojemność jako int (jedno ograniczenie) lub lista pojemności (wiele ograniczeń)
+            "instance": {"items": length, "capacity": np.asarray(self.capacity).tolist(),
+                         "digest": instance_digest(self.instance)},
+            "random": rng_meta,
+            "numpy_random": self.rng.bit_generator.state,
+        }
+        save_checkpoint(path, arrays, meta)
+
+    def checkpoint_population(self):
+        """
+        Tablice populacji (i najlepszego osobnika całej ewolucji) do punktu kontrolnego. Genotypy są
+        upakowane po 8 genów na bajt (niezależnie od reprezentacji), a zamiast obiektów `Individual`
+        zapisywane są tylko ich sumy i fitness.
+        """
+        length = self.chromosome_length
+        to_bytes = self.representation.to_bytes
+        population = np.frombuffer(b"".join(to_bytes(ind.genotype, length) for ind in self.population),
+                                   dtype=np.uint8).reshape(len(self.population), (length + 7) // 8)
+        fitness, fitness_is_int = encode_numbers([ind.fitness for ind in self.population])
+        arrays = {
+            "population": population,
+            "total_weight": np.array([ind.total_weight for ind in self.population], dtype=np.int64),
+            "total_value": np.array([ind.total_value for ind in self.population], dtype=np.int64),
+            "fitness": fitness,
+            "fitness_is_int": fitness_is_int,
+        }
+        best = self.best_individual
+        if best is not None:
+            arrays["best_genotype"] = np.frombuffer(to_bytes(best.genotype, length), dtype=np.uint8)
+            arrays["best_totals"] = np.array([best.total_weight, best.total_value], dtype=np.int64)
+            arrays["best_fitness"], arrays["best_fitness_is_int"] = encode_numbers([best.fitness])
+        return arrays
+
+    def restore_population(self, arrays):
+        """Odtwarza populację z tablic zapisanych przez `checkpoint_population`."""
+        length = self.chromosome_length
+        from_bytes = self.representation.from_bytes
+        # Osobniki odtwarzane z zapisanych sum i fitnessu (w trybie Baldwina fitness nie wynika z genotypu)
+        population = []
+        for row, total_weight, total_value, fitness in zip(
+                arrays["population"], arrays["total_weight"].tolist(), arrays["total_value"].tolist(),
+                decode_numbers(arrays["fitness"], arrays["fitness_is_int"])):
+            individual = Individual(self.instance, from_bytes(row.tobytes(), length), self.representation,
+                                    total_weight, total_value)
+            individual.fitness = fitness
+            population.append(individual)
+        self.population = population
+        
+        self.best_individual = None
+        if "best_genotype" in arrays:
+            total_weight, total_value = arrays["best_totals"].tolist()
+            self.best_individual = Individual(self.instance, from_bytes(arrays["best_genotype"].tobytes(), length),
+                                              self.representation, total_weight, total_value)
+            self.best_individual.fitness = decode_numbers(arrays["best_fitness"], arrays["best_fitness_is_int"])[0]
+
+    def restore_checkpoint(self, arrays, meta):
+        """
+        Przywraca stan zapisany przez `save_checkpoint` (wynik `checkpoints.load_checkpoint`).
+        Algorytm musi działać na tej samej instancji problemu; reprezentacja genotypu może być inna.
+        """
+        instance_meta = meta["instance"]
+        if (instance_meta["items"] != self.chromosome_length or instance_meta["capacity"] != np.asarray(self.capacity).tolist()
+                or instance_meta["digest"] != instance_digest(self.instance)):
+            raise ValueError("Punkt kontrolny dotyczy innej instancji problemu.")
+        
+        parameters = meta["parameters"]
+        self.population_size = parameters["population_size"]
+        self.crossover_prob = parameters["crossover_prob"]
+        self.mutation_prob = parameters["mutation_prob"]
+        self.iterations = parameters["iterations"]
+        self.tournament_size = parameters["tournament_size"]
+        self.repair_mode = parameters["repair_mode"]
+        self.elitism = parameters.get("elitism", 0)
+        self.replacement = parameters.get("replacement", "generational")
+        self.steady_state_size = parameters.get("steady_state_size", self.steady_state_size)
+        self.local_search_fraction = parameters.get("local_search_fraction")
+        self.local_search_budget = parameters.get("local_search_budget")
+        
+        self.restore_population(arrays)
+        length = self.chromosome_length
+        from_bytes = self.representation.from_bytes
+        history = {"best": arrays["history"], "feasible": arrays["history_is_int"]}
+        if "history_mean" in arrays:
+            history.update(mean=arrays["history_mean"], diversity=arrays["history_diversity"])
+        self.statistics = HistoryRecorder(self.iterations)
+        self.statistics.restore(history)
+        self.generation = meta["generation"]
+        self.evaluations = meta["evaluations"]
+        self.local_search_improvements = meta.get("local_search_improvements", 0)
+        self.stop_reason = meta["stop_reason"]
+        
+        cache_meta = meta["fitness_cache"]
+        if cache_meta is None:
+            self.fitness_cache = None
+        else:
+            self.fitness_cache = FitnessCache(cache_meta["max_size"])
+            key = self.representation.key
+            for row, (total_weight, total_value) in zip(arrays["cache_genotypes"], arrays["cache_totals"].tolist()):
+                individual = Individual(self.instance, from_bytes(row.tobytes(), length), self.representation,
+                                        total_weight, total_value)
+                self.fitness_cache.put(key(individual.genotype), (individual.fitness, total_weight, total_value))
+            self.fitness_cache.hits = cache_meta["hits"]
+            self.fitness_cache.misses = cache_meta["misses"]
+        
+        criteria_meta = meta["stopping_criteria"]
+        self.set_stopping_criteria(criteria_meta["target_fitness"], criteria_meta["stall_generations"],
+                                   criteria_meta["min_diversity"], criteria_meta["time_limit"],
+                                   criteria_meta["max_evaluations"])
+        # Limit czasu liczony jest łącznie z czasem sprzed przerwania
+        self.stopping_criteria.start_time = time.perf_counter() - criteria_meta["elapsed"]
+        self.stopping_criteria.best_fitness = criteria_meta["best_fitness"]
+        self.stopping_criteria.last_improvement = criteria_meta["last_improvement"]
+        
+        adaptive_meta = meta.get("adaptive_control")
+        self.adaptive_control = AdaptiveControl.from_state(adaptive_meta) if adaptive_meta else None
+        
+        self.random.setstate(unpack_random_state(arrays["rng_state"], meta["random"]))
+        self.rng.bit_generator.state = meta["numpy_random"]
+        self.mutation_buffer = []
 
     # --- NOWE FUNKCJE (SETTERY) ---
     
@@ -277,6 +1343,12 @@ class GeneticAlgorithm:
         else:
             print(f"OSTRZEŻENIE: Próba ustawienia nieprawidłowej stopy mutacji: {prob}. Używam domyślnej.")
 
+    def set_stopping_criteria(self, target_fitness=None, stall_generations=None, min_diversity=None,
+                              time_limit=None, max_evaluations=None):
+        """Ustawia warunki wcześniejszego zakończenia ewolucji (opis w `StoppingCriteria`)."""
+        self.stopping_criteria = StoppingCriteria(target_fitness, stall_generations, min_diversity,
+                                                  time_limit, max_evaluations)
+
     def set_crossover_prob(self, prob):
         """Pozwala na zmianę prawdopodobieństwa krzyżowania po inicjalizacji."""
         if 0.5 <= prob <= 1.0:
@@ -0,0 +1,245 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# Kolumny zapisywane dla każdego pokolenia (nazwa -> typ). Najlepszy fitness w float64, bo musi
+# dokładnie przechować całkowite wartości plecaka; "feasible" mówi, czy był on wartością plecaka (int),
+# a nie karą (float); średnia i różnorodność służą tylko do analiz i wykresów.
+COLUMNS = {"best": np.float64, "feasible": np.bool_, "mean": np.float32, "diversity": np.float32}
+
+# Ile uruchomień trafia do jednego fragmentu (katalogu z kolumnami) magazynu
+DEFAULT_CHUNK_RUNS = 256
+
+# Pola konfiguracji, które nie wpływają na wynik ewolucji (nie wchodzą do klucza uruchomienia)
+IGNORED_CONFIG_FIELDS = ("label", "checkpoint_path", "checkpoint_interval", "telemetry_path", "binary_cache")
+
+
+def empty_column(name, length):
+    """Kolumna `name` bez danych: NaN (kolumny liczbowe) albo False ("feasible")."""
+    dtype = COLUMNS[name]
+    return np.full(length, np.nan if np.issubdtype(dtype, np.floating) else False, dtype=dtype)
+
+
+def history_values(best, feasible):
+    """Najlepszy fitness kolejnych pokoleń jako lista Pythona: int dla wartości plecaka, float dla kar."""
+    return [int(value) if flag else float(value) for value, flag in zip(best.tolist(), feasible.tolist())]
+
+
+class HistoryRecorder:
+    """
+    Statystyki kolejnych pokoleń zapisywane przez pętlę ewolucji (`GeneticAlgorithm.run_generations`)
+    wprost do wcześniej zaalokowanych tablic o stałym typie (`COLUMNS`) zamiast do list obiektów Pythona.
+    Tablice są powiększane dwukrotnie, gdy ewolucja trwa dłużej niż przewidziano.
+    Kolumny średniej i różnorodności są w wartościach problemu, na którym działał algorytm: przy redukcji
+    dotyczą rdzenia i nie zawierają `EvolutionHistory.value_offset` (dodanie go mieszałoby wartości z karami).
+    """
+    def __init__(self, capacity):
+        self.length = 0
+        self.columns = {name: empty_column(name, max(1, capacity)) for name in COLUMNS}
+
+    def record(self, generation, best, feasible, mean, diversity):
+        """Zapisuje statystyki pokolenia `generation` (kolejne pokolenia zwiększają `length`)."""
+        columns = self.columns
+        if generation >= len(columns["best"]):
+            self.grow(generation + 1)
+        columns["best"][generation] = best
+        columns["feasible"][generation] = feasible
+        columns["mean"][generation] = mean
+        columns["diversity"][generation] = diversity
+        self.length = generation + 1
+
+    def grow(self, minimum):
+        """Powiększa tablice (co najmniej do `minimum` pokoleń)."""
+        capacity = max(minimum, 2 * len(self.columns["best"]))
+        for name, column in self.columns.items():
+            grown = empty_column(name, capacity)
+            grown[:len(column)] = column
+            self.columns[name] = grown
+
+    def restore(self, columns):
+        """Wczytuje zapisane wcześniej kolumny (np. z punktu kontrolnego); brakujące pozostają puste."""
+        length = len(columns["best"])
+        if length > len(self.columns["best"]):
+            self.grow(length)
+        for name, column in columns.items():
+            self.columns[name][:length] = column
+        self.length = length
+
+    def values(self):
+        """Najlepszy fitness zapisanych pokoleń jako lista int/float (patrz `history_values`)."""
+        return history_values(self.columns["best"][:self.length], self.columns["feasible"][:self.length])
+
+    def result(self):
+        """Zwraca słownik kolumn przyciętych do liczby zapisanych pokoleń (kopie)."""
+        return {name: column[:self.length].copy() for name, column in self.columns.items()}
+
+
+def config_record(config):
+    """Opis konfiguracji (`experiments.ExperimentConfig`) jako słownik zgodny z JSON (bez pól z `IGNORED_CONFIG_FIELDS`)."""
+    return {name: value for name, value in vars(config).items() if name not in IGNORED_CONFIG_FIELDS}
+
+
+def run_key(config):
+    """Klucz uruchomienia: skrót SHA-1 opisu konfiguracji (ta sama konfiguracja i ziarno = ten sam klucz)."""
+    return hashlib.sha1(json.dumps(config_record(config), sort_keys=True).encode()).hexdigest()
+
+
+class HistoryStore:
+    """
+    Kolumnowy magazyn historii uruchomień na dysku:
+
+        <katalog>/index.jsonl               jeden wiersz JSON na uruchomienie: klucz, etykieta, konfiguracja,
+                                            powód zakończenia, przesunięcie wartości, harmonogram
+                                            sterowania adaptacyjnego, fragment, przesunięcie
+                                            i długość historii
+        <katalog>/chunk-000001/best.npy     kolumna "best" wszystkich uruchomień fragmentu, jedna za drugą
+        <katalog>/chunk-000001/mean.npy     (i tak dalej dla każdej kolumny z `COLUMNS`)
+
+    Nowe uruchomienia są buforowane i zapisywane po `chunk_runs` naraz (`flush`, także przy `close`),
+    więc w pamięci jest najwyżej jeden niezapisany fragment. Odczyt (`load`, `series`) mapuje pliki
+    kolumn do pamięci i zwraca tylko wycinki potrzebnych uruchomień - bez wczytywania całego magazynu.
+    Ta sama konfiguracja zapisana kilka razy ma kilka wpisów; `find` zwraca wtedy najnowszy.
+
+    Kolumna "best" jest w wartościach pełnego problemu. Pozostałe kolumny są w wartościach problemu,
+    na którym działał algorytm; przy redukcji wpis ma "value_offset" (wartość ustalonych przedmiotów),
+    który trzeba dodać do średniego fitnessu poprawnych rozwiązań, aby porównać go z "best".
+    """
+    def __init__(self, directory, chunk_runs=DEFAULT_CHUNK_RUNS):
+        if chunk_runs <= 0:
+            raise ValueError("Liczba uruchomień we fragmencie musi być dodatnia.")
+        self.directory = directory
+        self.chunk_runs = chunk_runs
+        self.index_path = os.path.join(directory, "index.jsonl")
+        os.makedirs(directory, exist_ok=True)
+        self.entries = []
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r') as f:
+                self.entries = [json.loads(line) for line in f if line.strip()]
+        self.chunks = len({entry["chunk"] for entry in self.entries})
+        self.pending = []      # Niezapisane uruchomienia: (wpis indeksu, kolumny)
+        self.mapped = {}       # (fragment, kolumna) -> tablica zmapowana do pamięci
+
+    def __len__(self):
+        return len(self.entries) + len(self.pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # --- Zapis ---
+
+    def append(self, config, history, columns=None):
+        """
+        Dodaje uruchomienie konfiguracji `config` z historią `history` (`EvolutionHistory` lub lista).
+        `columns` to słownik kolumn (np. `history.columns`); brakujące kolumny są puste (`empty_column`),
+        a "feasible" bez kolumny wynika z typów wartości historii. Zwraca klucz uruchomienia (`run_key`).
+        """
+        if columns is None:
+            columns = getattr(history, "columns", None) or {}
+        length = len(history)
+        data = {}
+        for name, dtype in COLUMNS.items():
+            if name == "best":
+                column = history
+            elif name == "feasible" and name not in columns:
+                column = [isinstance(value, (int, np.integer)) for value in history]
+            else:
+                column = columns.get(name, empty_column(name, length))
+            column = np.asarray(column, dtype=dtype)
+            if len(column) != length:
+                raise ValueError(f"Kolumna {name} ma {len(column)} wartości zamiast {length}.")
+            data[name] = column
+        entry = {
+            "key": run_key(config),
+            "label": getattr(config, "label", None),
+            "config": config_record(config),
+            "stop_reason": getattr(history, "stop_reason", None),
+            "value_offset": getattr(history, "value_offset", 0),
+            "schedule": getattr(history, "schedule", None),
+            "length": length,
+        }
+        self.pending.append((entry, data))
+        if len(self.pending) >= self.chunk_runs:
+            self.flush()
+        return entry["key"]
+
+    def flush(self):
+        """Zapisuje buforowane uruchomienia jako nowy fragment i dopisuje je do indeksu."""
+        if not self.pending:
+            return
+        self.chunks += 1
+        chunk = f"chunk-{self.chunks:06d}"
+        os.makedirs(os.path.join(self.directory, chunk), exist_ok=True)
+        for name in COLUMNS:
+            np.save(os.path.join(self.directory, chunk, f"{name}.npy"),
+                    np.concatenate([data[name] for _, data in self.pending]))
+        # Indeks jest dopisywany po zapisaniu kolumn, więc przerwany zapis nie zostawia wpisów bez danych
+        offset = 0
+        with open(self.index_path, 'a') as f:
+            for entry, _ in self.pending:
+                entry.update(chunk=chunk, offset=offset)
+                offset += entry["length"]
+                f.write(json.dumps(entry) + "\n")
+                self.entries.append(entry)
+        self.pending = []
+
+    def close(self):
+        """Zapisuje niezapisane uruchomienia i zwalnia zmapowane pliki."""
+        self.flush()
+        self.mapped.clear()
+
+    # --- Odczyt ---
+
+    def runs(self, **filters):
+        """
+        Zwraca wpisy indeksu (słowniki) zapisanych uruchomień, których konfiguracja ma podane wartości,
+        np. `runs(data_file="large_scale/knapPI_1_100_1000_1", selection="selection_rank")`.
+        Klucze "key", "label" i "stop_reason" filtrują pola wpisu zamiast konfiguracji.
+        """
+        def matches(entry):
+            for name, value in filters.items():
+                actual = entry[name] if name in ("key", "label", "stop_reason") else entry["config"].get(name)
+                if actual != value:
+                    return False
+            return True
+        return [entry for entry in self.entries if matches(entry)]
+
+    def find(self, key):
+        """Zwraca najnowszy wpis indeksu o kluczu `key` (lub None)."""
+        for entry in reversed(self.entries):
+            if entry["key"] == key:
+                return entry
+        return None
+
+    def load(self, entry, column="best"):
+        """
+        Zwraca kolumnę `column` jednego uruchomienia (wpis indeksu lub klucz) jako wycinek tablicy
+        zmapowanej do pamięci - dane są czytane z dysku dopiero przy dostępie.
+        """
+        if isinstance(entry, str):
+            key, entry = entry, self.find(entry)
+            if entry is None:
+                raise KeyError(f"Brak uruchomienia o kluczu {key} w magazynie {self.directory}.")
+        if column not in COLUMNS:
+            raise ValueError(f"Nieznana kolumna: {column}. Dostępne: {', '.join(COLUMNS)}")
+        mapped = self.mapped.get((entry["chunk"], column))
+        if mapped is None:
+            mapped = np.load(os.path.join(self.directory, entry["chunk"], f"{column}.npy"), mmap_mode='r')
+            self.mapped[(entry["chunk"], column)] = mapped
+        return mapped[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def values(self, entry):
+        """Historia najlepszego fitnessu uruchomienia (wpis lub klucz) jako lista int/float, jak z `run_evolution`."""
+        return history_values(self.load(entry, "best"), self.load(entry, "feasible"))
+
+    def series(self, column="best", **filters):
+        """
+        Słownik etykieta -> kolumna `column` (zmapowana do pamięci) dla uruchomień pasujących
+        do `filters` (jak w `runs`), gotowy do przekazania `main.plot_results`.
+        Przy powtórzonych etykietach zostaje najnowsze uruchomienie.
+        """
+        return {entry["label"] or entry["key"]: self.load(entry, column) for entry in self.runs(**filters)}
@@ -0,0 +1,165 @@
+import contextlib
+import io
+import multiprocessing
+import queue
+import random
+
+import numpy as np
+
+from genotypes import BitsetRepresentation
+from go_knapsack import GeneticAlgorithm
+
+# Dostępne topologie migracji
+TOPOLOGIES = ("ring", "fully_connected")
+
+
+def migration_targets(index, n_islands, topology):
+    """Zwraca listę wysp, do których wyspa `index` wysyła swoich najlepszych osobników."""
+    if n_islands < 2:
+        return []
+    if topology == "ring":
+        # Pierścień: każda wyspa wysyła tylko do następnej
+        return [(index + 1) % n_islands]
+    if topology == "fully_connected":
+        # Graf pełny: każda wyspa wysyła do wszystkich pozostałych
+        return [i for i in range(n_islands) if i != index]
+    raise ValueError(f"Nieznana topologia migracji: {topology}. Dostępne: {', '.join(TOPOLOGIES)}")
+
+
+def _island_worker(index, settings, inboxes, results):
+    """
+    Ewolucja jednej wyspy w osobnym procesie.
+    Co `migration_interval` pokoleń wysyła genotypy swoich najlepszych osobników
+    (jako upakowane bajty) do sąsiadów i zastępuje swoich najgorszych osobników imigrantami.
+    """
+    representation = BitsetRepresentation()
+    n_islands = len(inboxes)
+
+    # Wyspy nie wypisują postępów (robi to tylko model jako całość)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(
+            settings["data_file"], settings["population_size"], settings["crossover_prob"],
+            settings["mutation_prob"], settings["iterations"], representation=representation,
+            # Niezależne strumienie losowe wysp: kolejne potomki jednego ziarna modelu
+            seed=np.random.SeedSequence(settings["seed"]).spawn(n_islands)[index]
+        )
+    selection_method = getattr(ga, settings["selection"])
+    crossover_method = getattr(ga, settings["crossover"])
+
+    targets = migration_targets(index, n_islands, settings["topology"])
+    # Liczba wysp, od których ta wyspa otrzymuje migrantów
+    n_sources = sum(index in migration_targets(i, n_islands, settings["topology"]) for i in range(n_islands))
+
+    history = []
+    pending = []  # Odebrane wiadomości (pokolenie, nadawca, genotypy) czekające na swoją epokę
+    for generation in range(settings["iterations"]):
+        best_in_gen = ga.find_best_individual(ga.population)
+        history.append(best_in_gen.fitness)
+
+        ga.population = ga.evolve_generation(selection_method, crossover_method)
+
+        # Migracja co `migration_interval` pokoleń
+        if targets and (generation + 1) % settings["migration_interval"] == 0:
+            ga.population.sort(key=lambda ind: ind.fitness, reverse=True)
+            emigrants = [
+                representation.to_bytes(ind.genotype, ga.chromosome_length)
+                for ind in ga.population[:settings["migration_size"]]
+            ]
+            for target in targets:
+                inboxes[target].put((generation, index, emigrants))
+
+            # Szybsza wyspa może przysłać migrantów z kolejnej epoki, zanim dotrą wszystkie
+            # z bieżącej, więc wiadomości z przyszłości odkładamy na później
+            while sum(message[0] == generation for message in pending) < n_sources:
+                pending.append(inboxes[index].get())
+            received = sorted(message for message in pending if message[0] == generation)
+            pending = [message for message in pending if message[0] != generation]
+
+            # Porządek według numeru wyspy nadawcy zapewnia powtarzalność wyników
+            immigrants = [data for _, _, batch in received for data in batch]
+
+            # Imigranci zastępują najgorszych osobników wyspy
+            for position, data in enumerate(immigrants[:len(ga.population)], start=1):
+                genotype = representation.from_bytes(data, ga.chromosome_length)
+                ga.population[-position] = ga.create_individual(genotype)
+
+    results.put((index, history))
+
+
+class IslandModel:
+    """
+    Model wyspowy algorytmu genetycznego: populacja jest podzielona na `n_islands` wysp,
+    z których każda ewoluuje we własnym procesie przy użyciu operatorów `GeneticAlgorithm`.
+    Wyspy co `migration_interval` pokoleń wymieniają `migration_size` najlepszych osobników
+    zgodnie z wybraną topologią ("ring" lub "fully_connected").
+    """
+
+    def __init__(self, data_file, n_islands, island_population_size, crossover_prob, mutation_prob,
+                 iterations, migration_interval=10, migration_size=2, topology="ring", seed=None):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Nieznana topologia migracji: {topology}. Dostępne: {', '.join(TOPOLOGIES)}")
+        self.data_file = data_file
+        self.n_islands = n_islands
+        self.island_population_size = island_population_size
+        self.crossover_prob = crossover_prob
+        self.mutation_prob = mutation_prob
+        self.iterations = iterations
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.seed = seed if seed is not None else random.randrange(2**32)
+
+    def run_evolution(self, selection_method, crossover_method):
+        """
+        Uruchamia ewolucję na wszystkich wyspach równolegle.
+        Metody można podać jako nazwy (np. "selection_rank") lub jako metody `GeneticAlgorithm`.
+        Zwraca łączną historię: najlepszy fitness spośród wszystkich wysp w każdym pokoleniu
+        (ten sam format, który przyjmuje `plot_results`).
+        """
+        selection = getattr(selection_method, "__name__", selection_method)
+        crossover = getattr(crossover_method, "__name__", crossover_method)
+        print(f"Start ewolucji wyspowej ({self.n_islands} wysp, topologia={self.topology}): "
+              f"Selekcja={selection}, Krzyżowanie={crossover}")
+
+        settings = {
+            "data_file": self.data_file,
+            "population_size": self.island_population_size,
+            "crossover_prob": self.crossover_prob,
+            "mutation_prob": self.mutation_prob,
+            "iterations": self.iterations,
+            "selection": selection,
+            "crossover": crossover,
+            "migration_interval": self.migration_interval,
+            "migration_size": self.migration_size,
+            "topology": self.topology,
+            "seed": self.seed,
+        }
+
+        inboxes = [multiprocessing.Queue() for _ in range(self.n_islands)]
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_island_worker, args=(index, settings, inboxes, results), daemon=True)
+            for index in range(self.n_islands)
+        ]
+        for process in processes:
+            process.start()
+
+        # Wyniki trzeba odebrać przed `join`, inaczej procesy mogą czekać na opróżnienie kolejki
+        island_histories = {}
+        while len(island_histories) < self.n_islands:
+            try:
+                index, history = results.get(timeout=1.0)
+                island_histories[index] = history
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    for process in processes:
+                        process.terminate()
+                    raise RuntimeError("Jedna z wysp zakończyła się błędem.")
+        for process in processes:
+            process.join()
+
+        self.island_histories = [island_histories[i] for i in range(self.n_islands)]
+        best_fitness_history = [max(values) for values in zip(*self.island_histories)]
+
+        print("Ewolucja wyspowa zakończona.")
+        return best_fitness_history
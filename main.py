@@ -1,17 +1,45 @@
 # Importowanie niezbędnych bibliotek
-from go_knapsack import GeneticAlgorithm  # Importuje główną klasę algorytmu genetycznego
-import matplotlib.pyplot as plt          # Biblioteka do tworzenia wykresów
-import tkinter as tk                     # Biblioteka do tworzenia prostych okien GUI
-from tkinter import filedialog           # Specyficznie do okna dialogowego wyboru pliku
+import os                                # Ścieżki plików punktów kontrolnych
+import random                            # Losowanie ziarna bazowego eksperymentów
+from experiments import STANDARD_EXPERIMENTS, build_standard_experiments, record_experiments  # Konfiguracje i równoległe uruchamianie
+from go_knapsack import load_optimum, optimum_file_path  # Wartość optymalna i ścieżka do jej pliku
+from history_store import HistoryStore   # Zapis historii uruchomień na dysku (kolumnowo)
+# Biblioteki graficzne (matplotlib, tkinter) są importowane dopiero w funkcjach, które ich używają,
+# dzięki czemu funkcje pomocnicze z tego pliku można importować także bez środowiska graficznego.
 
-def plot_results(results_dict, title, optimum=None):
+# Wybór silnika algorytmu: False -> obiektowy (GeneticAlgorithm), True -> macierzowy (VectorizedGeneticAlgorithm)
+USE_VECTORIZED_ENGINE = False
+
+# Katalog punktów kontrolnych: None -> wyłączone.
+# Po przerwaniu programu ponowne uruchomienie z tymi samymi danymi wznawia ewolucje z zapisanych plików
+# (przed nową serią eksperymentów katalog należy wyczyścić).
+CHECKPOINT_DIR = None
+CHECKPOINT_INTERVAL = 50  # Co ile pokoleń zapisywać punkt kontrolny
+
+# Sterowanie adaptacyjne: True -> zamiast przeglądu współczynników mutacji i krzyżowania (10 ewolucji)
+# jedno uruchomienie dobiera operatory i parametry w trakcie ewolucji (porównane z parametrami stałymi)
+USE_ADAPTIVE_CONTROL = False
+
+# Redukcja problemu: True -> przedmioty, których wartość w optimum wynika z ograniczenia LP, są ustalane
+# przed ewolucją, a algorytm działa tylko na pozostałym "rdzeniu" (wyniki w wartościach pełnego problemu)
+USE_PROBLEM_REDUCTION = False
+
+# Katalog magazynu historii (`history_store.HistoryStore`): najlepszy i średni fitness oraz różnorodność
+# każdego pokolenia wszystkich uruchomień są dopisywane na dysk i zostają po zakończeniu programu.
+# Wykresy czytają z magazynu tylko potrzebne serie (pliki zmapowane do pamięci).
+HISTORY_STORE_DIR = "histories"
+
+def plot_results(results_dict, title, optimum=None, output_path=None):
     """
     Funkcja do rysowania wykresów wyników ewolucji.
     
     :param results_dict: Słownik, gdzie klucze to nazwy serii, a wartości to historie fitnessu.
     :param title: Tytuł wykresu.
     :param optimum: (Opcjonalnie) Wartość optymalna, która zostanie narysowana jako linia pozioma.
+    :param output_path: (Opcjonalnie) Plik, do którego zapisać wykres zamiast go wyświetlać.
     """
+    import matplotlib.pyplot as plt  # Biblioteka do tworzenia wykresów
+    
     plt.figure(figsize=(12, 8))  # Ustawienie rozmiaru okna wykresu
     
     # Pętla przez wszystkie serie wyników (np. "Selekcja Rankingowa")
@@ -28,13 +56,20 @@ def plot_results(results_dict, title, optimum=None):
     plt.ylabel("Najlepszy Fitness")
     plt.legend()  # Pokaż legendę (opisy linii)
     plt.grid(True)  # Pokaż siatkę
-    plt.show()  # Wyświetl wykres
+    if output_path is not None:
+        plt.savefig(output_path)  # Zapisz wykres do pliku (tryb bez okien)
+        plt.close()
+    else:
+        plt.show()  # Wyświetl wykres
 
 
 def get_file_path():
     """
     Otwiera okno dialogowe (używając Tkinter), aby użytkownik mógł wybrać plik.
     """
+    import tkinter as tk                # Biblioteka do tworzenia prostych okien GUI
+    from tkinter import filedialog      # Specyficznie do okna dialogowego wyboru pliku
+    
     root = tk.Tk()  # Inicjalizacja głównego okna Tkinter
     root.withdraw()  # Ukrycie tego głównego okna (potrzebujemy tylko okna dialogowego)
     
@@ -46,6 +81,14 @@ def get_file_path():
         quit()  # Zakończ program
     return file_path
 
+def detect_file_type(data_file_path):
+    """Rozpoznaje typ problemu na podstawie ścieżki do pliku z danymi."""
+    if "low-dimensional" in data_file_path:
+        return "low-dimensional"
+    elif "large_scale" in data_file_path:
+        return "large_scale"
+    return "unknown"
+
 def get_recommendations(file_type):
     """
     Zwraca słownik z zalecanymi zakresami parametrów na podstawie typu problemu.
@@ -70,6 +113,20 @@ def get_recommendations(file_type):
         # Nieznany typ, brak zaleceń
         return {}
 
+def default_parameters(file_type):
+    """
+    Parametry algorytmu bez pytania użytkownika, na podstawie zaleceń z `get_recommendations`:
+    górne granice rozmiaru populacji i liczby iteracji, dolna granica mutacji, górna krzyżowania.
+    Dla nieznanego typu pliku używane są zalecenia dla "large_scale".
+    """
+    recs = get_recommendations(file_type) or get_recommendations("large_scale")
+    return {
+        "pop_size": recs["pop_size"][1],
+        "iterations": recs["iterations"][1],
+        "mutation_prob": recs["mutation_prob"][0],
+        "crossover_prob": recs["crossover_prob"][1],
+    }
+
 def get_validated_input(prompt, input_type=int, rec_range=None, hard_min=None, hard_max=None):
     """
     Pobiera dane od użytkownika z walidacją twardą (błąd) i miękką (ostrzeżenie).
@@ -117,23 +174,12 @@ if __name__ == "__main__":
     DATA_FILE_PATH = get_file_path() 
     
     # 2. Automatyczne ustalanie ścieżki do pliku z wartością optymalną
-    DATA_FILE_PATH_SPLITTED = DATA_FILE_PATH.split("/")
-    DATA_FILE_PATH_SPLITTED[len(DATA_FILE_PATH_SPLITTED)-2] = DATA_FILE_PATH_SPLITTED[len(DATA_FILE_PATH_SPLITTED)-2] + "-optimum"
-    DATA_FILE_PATH_OPTIMUM = ""
-
-    for i in range(0, len(DATA_FILE_PATH_SPLITTED)):
-        current = DATA_FILE_PATH_SPLITTED[i]
-        if i == len(DATA_FILE_PATH_SPLITTED)-1:
-            DATA_FILE_PATH_OPTIMUM += current
-            continue
-        DATA_FILE_PATH_OPTIMUM += current + '/'
+    DATA_FILE_PATH_OPTIMUM = optimum_file_path(DATA_FILE_PATH)
 
     # 3. Wczytanie wartości optymalnej z pliku
     OPTIMUM_VALUE = 0
     try:
-        with open(DATA_FILE_PATH_OPTIMUM, 'r') as f:
-            first_line = f.readline().split()
-            OPTIMUM_VALUE = int(first_line[0])
+        OPTIMUM_VALUE = load_optimum(DATA_FILE_PATH)
     except FileNotFoundError:
         # Obsługa błędu, jeśli plik optimum nie istnieje
         print(f"OSTRZEŻENIE: Nie znaleziono pliku optimum: {DATA_FILE_PATH_OPTIMUM}")
@@ -146,11 +192,7 @@ if __name__ == "__main__":
     print(f"Załadowano optimum: {OPTIMUM_VALUE}")
     
     # 4. Wykrywanie typu pliku i wyświetlanie zaleceń
-    file_type = "unknown"
-    if "low-dimensional" in DATA_FILE_PATH:
-        file_type = "low-dimensional"
-    elif "large_scale" in DATA_FILE_PATH:
-        file_type = "large_scale"
+    file_type = detect_file_type(DATA_FILE_PATH)
 
     print(f"\n--- Wykryto typ pliku: {file_type} ---")
     recs = get_recommendations(file_type)  # Pobranie słownika zaleceń
@@ -201,120 +243,38 @@ if __name__ == "__main__":
         hard_max=1.0
     )
 
-    # 6. Inicjalizacja głównego obiektu algorytmu genetycznego
-    ga = GeneticAlgorithm(
-        data_file=DATA_FILE_PATH,
-        population_size=POPULATION_SIZE,
-        crossover_prob=BASE_CROSSOVER_PROB,
-        mutation_prob=BASE_MUTATION_PROB,
-        iterations=ITERATIONS
-    )
-
-    # --- Eksperyment 1: Porównanie selekcji (Wymaganie 4.5) ---
-    print("\n--- Uruchamianie Eksperymentu 1: Metody Selekcji ---")
-    
-    # Upewniamy się, że algorytm używa bazowych parametrów
-    ga.set_mutation_prob(BASE_MUTATION_PROB)
-    ga.set_crossover_prob(BASE_CROSSOVER_PROB)
-    
-    results_selection = {}  # Słownik do przechowywania wyników
-    
-    history_roulette = ga.run_evolution(
-        selection_method=ga.selection_roulette_wheel,
-        crossover_method=ga.crossover_one_point
-    )
-    results_selection["Selekcja Kołem Ruletki"] = history_roulette
-    
-    history_rank = ga.run_evolution(
-        selection_method=ga.selection_rank,
-        crossover_method=ga.crossover_one_point
-    )
-    results_selection["Selekcja Rankingowa"] = history_rank
-
-    plot_results(
-        results_selection,
-        f"Porównanie Selekcji (Plik: {DATA_FILE_PATH})",
-        OPTIMUM_VALUE
-    )
+    # 6. Przygotowanie konfiguracji wszystkich eksperymentów.
+    #    Każde uruchomienie dostaje własną instancję algorytmu i własne ziarno losowości,
+    #    więc wszystkie mogą działać równolegle na wielu rdzeniach.
+    engine = "numpy" if USE_VECTORIZED_ENGINE else "python"
+    BASE_SEED = random.randrange(2**32)
+    print(f"\nZiarno bazowe eksperymentów: {BASE_SEED}")
 
-    # --- Eksperyment 2: Porównanie krzyżowania (Wymaganie 4.5) ---
-    print("\n--- Uruchamianie Eksperymentu 2: Metody Krzyżowania ---")
-    
-    # Upewniamy się, że algorytm używa bazowych parametrów
-    ga.set_mutation_prob(BASE_MUTATION_PROB)
-    ga.set_crossover_prob(BASE_CROSSOVER_PROB)
-    
-    results_crossover = {}
-    
-    history_one_point = ga.run_evolution(
-        selection_method=ga.selection_rank,
-        crossover_method=ga.crossover_one_point
-    )
-    results_crossover["Krzyżowanie Jednopunktowe"] = history_one_point
-    
-    history_two_point = ga.run_evolution(
-        selection_method=ga.selection_rank,
-        crossover_method=ga.crossover_two_point
-    )
-    results_crossover["Krzyżowanie Dwupunktowe"] = history_two_point
-    
-    plot_results(
-        results_crossover,
-        f"Porównanie Krzyżowania (Plik: {DATA_FILE_PATH})",
-        OPTIMUM_VALUE
-    )
-
-    # --- NOWY EKSPERYMENT 3a: Porównanie współczynników mutacji (Wymaganie 3.5) ---
-    print("\n--- Uruchamianie Eksperymentu 3a: Współczynniki Mutacji ---")
-    
-    # Używamy Selekcji Rankingowej i Krzyżowania Jednopunktowego jako stabilnej bazy
-    # Używamy BAZOWEGO prawdopodobieństwa krzyżowania
-    ga.set_crossover_prob(BASE_CROSSOVER_PROB)
-
-    # Definiujemy listę współczynników do przetestowania
-    MUTATION_RATES_TO_TEST = [0.0, 0.01, 0.02, 0.05, 0.1]
-    results_mutation = {}
+    checkpoint_dir = CHECKPOINT_DIR
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
 
-    for rate in MUTATION_RATES_TO_TEST:
-        print(f"\n--- Testowanie P. Mutacji: {rate} ---")
-        ga.set_mutation_prob(rate)  # Ustawiamy nową wartość mutacji
-        
-        history = ga.run_evolution(
-            selection_method=ga.selection_rank,
-            crossover_method=ga.crossover_one_point
-        )
-        results_mutation[f"Mutacja {rate}"] = history
-
-    # Rysowanie wykresu porównawczego dla mutacji
-    plot_results(
-        results_mutation,
-        f"Porównanie współczynników mutacji (Plik: {DATA_FILE_PATH})",
-        OPTIMUM_VALUE
+    # Eksperymenty: porównanie selekcji i krzyżowania (Wymaganie 4.5),
+    # współczynników mutacji i krzyżowania (Wymaganie 3.5) lub sterowania adaptacyjnego
+    experiment_names = (("selection", "crossover", "adaptive") if USE_ADAPTIVE_CONTROL
+                        else STANDARD_EXPERIMENTS)
+    experiments = build_standard_experiments(
+        DATA_FILE_PATH, POPULATION_SIZE, ITERATIONS, BASE_MUTATION_PROB, BASE_CROSSOVER_PROB, BASE_SEED,
+        engine=engine, experiments=experiment_names, reduce=USE_PROBLEM_REDUCTION,
+        checkpoint_dir=checkpoint_dir, checkpoint_interval=CHECKPOINT_INTERVAL
     )
+    all_configs = [config for _, _, configs in experiments for config in configs]
 
-    # --- NOWY EKSPERYMENT 3b: Porównanie współczynników krzyżowania (Wymaganie 3.5) ---
-    print("\n--- Uruchamianie Eksperymentu 3b: Współczynniki Krzyżowania ---")
-    
-    # Używamy BAZOWEGO prawdopodobieństwa mutacji
-    ga.set_mutation_prob(BASE_MUTATION_PROB)
-    
-    # Definiujemy listę współczynników do przetestowania
-    CROSSOVER_RATES_TO_TEST = [0.5, 0.7, 0.8, 0.9, 1.0]
-    results_crossover_rates = {}
-
-    for rate in CROSSOVER_RATES_TO_TEST:
-        print(f"\n--- Testowanie P. Krzyżowania: {rate} ---")
-        ga.set_crossover_prob(rate)  # Ustawiamy nową wartość krzyżowania
-        
-        history = ga.run_evolution(
-            selection_method=ga.selection_rank,
-            crossover_method=ga.crossover_one_point
-        )
-        results_crossover_rates[f"Krzyżowanie {rate}"] = history
+    # 7. Równoległe uruchomienie wszystkich ewolucji; każda historia od razu trafia do magazynu na dysku
+    print(f"\n--- Uruchamianie {len(all_configs)} ewolucji równolegle ---")
+    with HistoryStore(HISTORY_STORE_DIR) as store:
+        run_keys = {id(config): key for config, key in record_experiments(all_configs, store)}
+        print(f"Wszystkie ewolucje zakończone. Historie zapisano w katalogu: {HISTORY_STORE_DIR}")
 
-    # Rysowanie wykresu porównawczego dla krzyżowania
-    plot_results(
-        results_crossover_rates,
-        f"Porównanie współczynników krzyżowania (Plik: {DATA_FILE_PATH})",
-        OPTIMUM_VALUE
-    )
\ No newline at end of file
+        # 8. Rysowanie wykresów porównawczych dla każdego eksperymentu (serie wczytywane z magazynu)
+        for _, title, configs in experiments:
+            plot_results(
+                {config.label: store.load(run_keys[id(config)]) for config in configs},
+                title,
+                OPTIMUM_VALUE
+            )
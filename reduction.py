@@ -0,0 +1,172 @@
+import numpy as np
+
+from go_knapsack import EvolutionHistory, KnapsackInstance
+
+# Najmniejszy rdzeń przekazywany algorytmowi (krzyżowanie dwupunktowe potrzebuje 3 genów)
+MIN_CORE_SIZE = 3
+
+
+class ReducedInstance:
+    """
+    Wynik redukcji instancji (`reduce_instance`): mniejsza instancja "rdzenia" z przedmiotami,
+    których nie dało się ustalić, z pojemnością pomniejszoną o przedmioty ustalone na 1,
+    oraz odwzorowanie rozwiązań rdzenia z powrotem na pełny problem.
+    Przedmioty rdzenia są ułożone malejąco według stosunku wartość/waga.
+    """
+    def __init__(self, instance, core_items, fixed_ones, break_item, lower_bound, upper_bound):
+        self.instance = instance
+        self.core_items = core_items  # Indeksy (w pełnej instancji) kolejnych genów rdzenia
+        self.fixed_ones = fixed_ones  # Indeksy przedmiotów ustalonych na 1
+        self.fixed_value = int(instance.values[fixed_ones].sum())
+        self.fixed_weight = int(instance.weights[fixed_ones].sum())
+        self.core = KnapsackInstance(instance.capacity - self.fixed_weight,
+                                     instance.values[core_items], instance.weights[core_items])
+        self.break_item = break_item    # Przedmiot krytyczny Dantziga (indeks w pełnej instancji) lub None
+        self.lower_bound = lower_bound  # Wartość rozwiązania zachłannego
+        self.upper_bound = upper_bound  # Ograniczenie LP (Dantziga), zaokrąglone w dół
+
+    def __repr__(self):
+        """Reprezentacja tekstowa obiektu, przydatna przy debugowaniu."""
+        return (f"ReducedInstance(n={len(self.instance)}, core={len(self.core_items)}, "
+                f"fixed_ones={len(self.fixed_ones)}, fixed_value={self.fixed_value})")
+
+    def reduction_ratio(self):
+        """Ile razy rdzeń jest krótszy od pełnego chromosomu."""
+        return len(self.instance) / max(1, len(self.core_items))
+
+    def expand_genotype(self, genes):
+        """Zamienia listę 0/1 genów rdzenia na listę 0/1 dla wszystkich przedmiotów pełnej instancji."""
+        full = np.zeros(len(self.instance), dtype=np.uint8)
+        full[self.fixed_ones] = 1
+        full[self.core_items] = np.asarray(genes, dtype=np.uint8)
+        return full.tolist()
+
+    def full_fitness(self, fitness):
+        """
+        Fitness rozwiązania rdzenia jako fitness w pełnym problemie: do poprawnych rozwiązań
+        (wartości całkowite) dodawana jest wartość ustalonych przedmiotów; kary (< 1) zostają bez zmian.
+        """
+        if isinstance(fitness, (int, np.integer)):
+            return int(fitness) + self.fixed_value
+        return fitness
+
+    def map_history(self, history):
+        """
+        Zwraca `EvolutionHistory` ewolucji rdzenia przeliczoną na wartości pełnego problemu.
+        W statystykach pokoleń (`columns`) przeliczana jest tylko kolumna "best"; średnia dotyczy rdzenia.
+        """
+        values = [self.full_fitness(fitness) for fitness in history]
+        columns = getattr(history, "columns", None)
+        if columns is not None:
+            columns = dict(columns, best=np.asarray(values, dtype=np.float64))
+        return EvolutionHistory(values, getattr(history, "stop_reason", None),
+                                getattr(history, "generations", len(history)), getattr(history, "schedule", None),
+                                columns, value_offset=self.fixed_value)
+
+
+def reduce_instance(instance, lower_bound=None, min_core_size=MIN_CORE_SIZE):
+    """
+    Zmniejsza problem przed ewolucją (redukcja Dembo-Hammera z ograniczeniem Dantziga):
+    1. przedmioty cięższe od plecaka są ustalane na 0, a przedmioty o zerowej wadze na 1
+       (przedmioty o zerowej wartości na 0 - nie zmieniają optimum),
+    2. pozostałe są sortowane malejąco według stosunku wartość/waga i wyznaczany jest
+       przedmiot krytyczny b (pierwszy, który nie mieści się w całości); rozwiązanie LP
+       bierze przedmioty przed b i ułamek b, a jego wartość U jest górnym ograniczeniem,
+    3. dolne ograniczenie L to rozwiązanie zachłanne (lub większe `lower_bound`, np. znane optimum),
+    4. dla każdego przedmiotu j koszt zredukowany d_j = v_j - w_j * v_b / w_b daje ograniczenie
+       U - |d_j| dla rozwiązań z x_j innym niż w LP; jeśli jest ono (w liczbach całkowitych) mniejsze
+       od L, żadne optymalne rozwiązanie nie zmienia x_j i zmienna zostaje ustalona.
+    Nieustalone przedmioty tworzą rdzeń; jeśli jest mniejszy niż `min_core_size`, dokładane są
+    (bez utraty poprawności) ustalone przedmioty najbliższe przedmiotowi krytycznemu.
+    Obliczenia ograniczeń są dokładne (liczby całkowite Pythona, bez błędów zaokrągleń).
+
+    :return: `ReducedInstance`.
+    """
+    if instance.dimensions > 1:
+        raise ValueError(f"Redukcja obsługuje tylko jedno ograniczenie (instancja ma {instance.dimensions}).")
+    capacity = instance.capacity
+    values = instance.values.tolist()
+    weights = instance.weights.tolist()
+    n = len(values)
+
+    # 1. Przedmioty ustalone bez liczenia ograniczeń
+    state = [None] * n  # None = wolny, 0/1 = ustalony
+    for i in range(n):
+        if values[i] <= 0 or weights[i] > capacity:
+            state[i] = 0
+        elif weights[i] == 0:
+            state[i] = 1
+    free_capacity = capacity - sum(weights[i] for i in range(n) if state[i] == 1)
+    # Ograniczenia są w wartościach pełnego problemu (jak `lower_bound`), więc obejmują przedmioty ustalone na 1
+    fixed_value = sum(values[i] for i in range(n) if state[i] == 1)
+
+    # 2. Sortowanie według efektywności (porównanie v_i/w_i bez dzielenia) i przedmiot krytyczny
+    candidates = [i for i in range(n) if state[i] is None]
+    ratios = np.array([values[i] / weights[i] for i in candidates])
+    order = [candidates[k] for k in np.argsort(-ratios, kind='stable').tolist()]
+
+    lp_value = fixed_value  # Wartość przedmiotów ustalonych i przed przedmiotem krytycznym
+    lp_weight = 0
+    break_position = len(order)
+    for position, i in enumerate(order):
+        if lp_weight + weights[i] > free_capacity:
+            break_position = position
+            break
+        lp_weight += weights[i]
+        lp_value += values[i]
+
+    break_item = order[break_position] if break_position < len(order) else None
+    if break_item is None:
+        # Wszystkie przedmioty mieszczą się naraz: rozwiązanie LP jest całkowite i optymalne
+        upper_bound = lower_bound_value = lp_value
+        for i in order:
+            state[i] = 1
+    else:
+        v_b, w_b = values[break_item], weights[break_item]
+        residual = free_capacity - lp_weight
+        # U = lp_value + residual * v_b / w_b (zaokrąglone w dół)
+        upper_bound = (lp_value * w_b + residual * v_b) // w_b
+
+        # 3. Dolne ograniczenie: przedmioty przed krytycznym + zachłanne dokładanie kolejnych
+        lower_bound_value = lp_value
+        remaining = residual
+        for i in order[break_position:]:
+            if weights[i] <= remaining:
+                remaining -= weights[i]
+                lower_bound_value += values[i]
+        if lower_bound is not None:
+            lower_bound_value = max(lower_bound_value, lower_bound)
+
+        # 4. Ustalanie zmiennych kosztami zredukowanymi:
+        #    U - |d_j| = (lp_value * w_b + residual * v_b - |v_j * w_b - w_j * v_b|) / w_b
+        numerator = lp_value * w_b + residual * v_b
+        for position, i in enumerate(order):
+            if i == break_item:
+                continue
+            bound = (numerator - abs(values[i] * w_b - weights[i] * v_b)) // w_b
+            if bound < lower_bound_value:
+                state[i] = 1 if position < break_position else 0
+
+    # Rdzeń: wolne przedmioty w kolejności efektywności (uzupełniony do `min_core_size` wokół krytycznego)
+    core = [i for i in order if state[i] is None]
+    if len(core) < min(min_core_size, n):
+        center = min(break_position, len(order) - 1) if order else 0
+        by_distance = sorted(range(len(order)), key=lambda position: abs(position - center))
+        for position in by_distance:
+            if len(core) >= min_core_size:
+                break
+            if state[order[position]] is not None:
+                state[order[position]] = None
+                core.append(order[position])
+        # Przy bardzo małych instancjach do rdzenia trafiają też przedmioty ustalone w kroku 1
+        for i in range(n):
+            if len(core) >= min_core_size:
+                break
+            if state[i] is not None:
+                state[i] = None
+                core.append(i)
+        core = [i for i in order if state[i] is None] + [i for i in core if i not in order]
+
+    fixed_ones = np.array([i for i in range(n) if state[i] == 1], dtype=np.int64)
+    return ReducedInstance(instance, np.array(core, dtype=np.int64), fixed_ones, break_item,
+                           lower_bound_value, upper_bound)
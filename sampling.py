@@ -0,0 +1,52 @@
+class AliasTable:
+    """
+    Tablica aliasów (metoda Walkera, wariant Vose'a) do losowania indeksów
+    z rozkładu dyskretnego o zadanych wagach. Budowa kosztuje O(N),
+    a każde losowanie O(1): jedna liczba losowa i jedno porównanie.
+    """
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("Wagi muszą być niepuste i mieć dodatnią sumę.")
+
+        # Wagi przeskalowane tak, by ich średnia wynosiła 1
+        scaled = [w * n / total for w in weights]
+        self.size = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            # Kubełek `s` jest wypełniany w części sobą, a w reszcie aliasem `l`
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # Pozostałe kubełki (także z błędów zaokrągleń) mają prawdopodobieństwo 1
+
+    def draw(self, rng):
+        """Losuje jeden indeks generatorem `rng` (np. `random.Random`)."""
+        u = rng.random() * self.size
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def sample(self, k, rng):
+        """Losuje `k` indeksów (ze zwracaniem) generatorem `rng` (np. `random.Random`)."""
+        draw = rng.random
+        prob = self.prob
+        alias = self.alias
+        size = self.size
+        indices = []
+        for _ in range(k):
+            u = draw() * size
+            i = int(u)
+            indices.append(i if u - i < prob[i] else alias[i])
+        return indices
@@ -0,0 +1,103 @@
+import argparse
+import json
+
+from benchmark import BENCHMARK_ENGINES, run_once
+from generator import FAMILIES, generate_instance
+
+# Domyślne rozmiary instancji (liczby przedmiotów) w pomiarze skalowania
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+
+def scaling_parameters(n, population_size, iterations):
+    """Parametry algorytmu dla instancji z `n` przedmiotami (mutacja ~1 gen na osobnika)."""
+    return {
+        "pop_size": population_size,
+        "iterations": iterations,
+        "mutation_prob": min(0.1, 1 / n),
+        "crossover_prob": 0.8,
+    }
+
+
+def measure_scaling(sizes, engines, family="uncorrelated", coefficient_range=1000, seed=0,
+                    population_size=50, iterations=20, selection="selection_rank",
+                    crossover="crossover_one_point"):
+    """
+    Mierzy czas pokolenia i szczyt pamięci każdego silnika/reprezentacji dla instancji
+    z rodziny `family` o kolejnych rozmiarach. Instancje są generowane w pamięci (bez plików),
+    a pamięć mierzona jest w osobnym przebiegu, żeby tracemalloc nie zaburzał pomiaru czasu.
+    Zwraca listę rekordów (po jednym na rozmiar i silnik).
+    """
+    records = []
+    for n in sizes:
+        instance = generate_instance(family, n, coefficient_range, seed)
+        params = scaling_parameters(n, population_size, iterations)
+        for engine in engines:
+            history, elapsed, evaluations, _ = run_once(instance, engine, selection, crossover, params, seed)
+            _, _, _, peak_memory_kb = run_once(instance, engine, selection, crossover, params, seed,
+                                               measure_memory=True)
+            record = {
+                "n": n,
+                "engine": engine,
+                "family": family,
+                "generations": len(history),
+                "elapsed_s": elapsed,
+                "seconds_per_generation": elapsed / len(history),
+                "evaluations_per_s": evaluations / elapsed,
+                "peak_memory_kb": peak_memory_kb,
+            }
+            records.append(record)
+            print(f"n={n} | {engine}: {record['seconds_per_generation'] * 1000:.2f} ms/pokolenie, "
+                  f"pamięć {peak_memory_kb / 1024:.1f} MB")
+    return records
+
+
+def plot_scaling(records, output_path):
+    """Zapisuje wykres (skala log-log) czasu pokolenia i szczytu pamięci w funkcji n dla każdego silnika."""
+    # Backend bez okien musi być wybrany przed pierwszym importem matplotlib.pyplot
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, (time_axis, memory_axis) = plt.subplots(1, 2, figsize=(12, 5))
+    for engine in dict.fromkeys(record["engine"] for record in records):
+        series = sorted((r for r in records if r["engine"] == engine), key=lambda r: r["n"])
+        sizes = [r["n"] for r in series]
+        time_axis.plot(sizes, [r["seconds_per_generation"] for r in series], marker="o", label=engine)
+        memory_axis.plot(sizes, [r["peak_memory_kb"] / 1024 for r in series], marker="o", label=engine)
+
+    for axis, ylabel in ((time_axis, "Czas pokolenia [s]"), (memory_axis, "Szczyt pamięci [MB]")):
+        axis.set_xscale("log")
+        axis.set_yscale("log")
+        axis.set_xlabel("Liczba przedmiotów (n)")
+        axis.set_ylabel(ylabel)
+        axis.grid(True, which="both", linestyle='--', alpha=0.5)
+        axis.legend()
+    time_axis.set_title("Czas pokolenia")
+    memory_axis.set_title("Pamięć")
+    fig.tight_layout()
+    fig.savefig(output_path)
+    plt.close(fig)
+
+
+# --- Uruchomienie z linii poleceń ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pomiar skalowania silników algorytmu genetycznego względem n.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="Liczby przedmiotów.")
+    parser.add_argument("--engines", nargs="+", default=list(BENCHMARK_ENGINES), choices=list(BENCHMARK_ENGINES))
+    parser.add_argument("--family", default="uncorrelated", choices=list(FAMILIES))
+    parser.add_argument("--range", type=int, default=1000, dest="coefficient_range")
+    parser.add_argument("--population-size", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-json", default="scaling_results.json")
+    parser.add_argument("--plot", help="Plik PNG z wykresem (wymaga matplotlib).")
+    args = parser.parse_args()
+
+    records = measure_scaling(args.sizes, args.engines, args.family, args.coefficient_range, args.seed,
+                              args.population_size, args.iterations)
+    with open(args.output_json, 'w') as f:
+        json.dump(records, f, indent=2)
+    print(f"Zapisano wyniki: {args.output_json}")
+    if args.plot:
+        plot_scaling(records, args.plot)
+        print(f"Zapisano wykres: {args.plot}")
@@ -0,0 +1,489 @@
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from checkpoints import instance_digest
+from experiments import ENGINES, check_engine_options
+from fitness_cache import FitnessCache
+from genotypes import REPRESENTATIONS
+from go_knapsack import REPAIR_MODES, KnapsackInstance, parse_instance
+
+# Lokalna usługa rozwiązywania problemu plecakowego (HTTP/1.1 po TCP lub gnieździe Unix).
+#
+#   POST /solve   treść JSON: {"instance": {"capacity": c, "values": [...], "weights": [...]}
+#                              lub "instance_text": "<zawartość pliku z danymi>",
+#                              "parameters": {...} (patrz DEFAULT_PARAMETERS),
+#                              "progress_interval": co ile pokoleń wysyłać postęp (domyślnie 0 = bez postępu)}
+#                 odpowiedź: strumień JSON Lines - rekordy {"type": "progress", ...} z kolejnych
+#                 pokoleń, a na końcu {"type": "result", ...} albo {"type": "error", ...}
+#                 Żądania z ziarnem ("seed" w parametrach) o ten sam problem i parametry są liczone raz:
+#                 wynik jest zapamiętywany, a żądanie przychodzące w trakcie obliczeń dołącza do zadania
+#                 w toku i dostaje postęp z odstępem `progress_interval` pierwszego żądania (także 0 = brak).
+#                 Żądania bez ziarna są zawsze liczone osobno i nie są zapamiętywane.
+#                 Zadania czekające na wolny proces roboczy są łączone w partie: jedno wywołanie puli
+#                 na proces, z każdą instancją przesłaną raz (patrz `SolveService.dispatch`).
+#   GET /stats    liczniki pamięci podręcznych i zadań
+#
+# Przykład: curl -N -d @zadanie.json http://127.0.0.1:8765/solve
+
+# Parametry algorytmu przyjmowane w zadaniu (z wartościami domyślnymi)
+DEFAULT_PARAMETERS = {
+    "engine": "python",
+    "population_size": 100,
+    "iterations": 200,
+    "crossover_prob": 0.8,
+    "mutation_prob": 0.01,
+    "selection": "selection_rank",
+    "crossover": "crossover_one_point",
+    "seed": None,  # Bez ziarna każde żądanie daje inny wynik; z ziarnem wynik jest powtarzalny i zapamiętywany
+    "elitism": 0,
+    "replacement": "generational",
+    "steady_state_size": None,
+    "representation": None,  # Tylko silnik "python": "list" lub "bitset"
+    "repair_mode": None,     # Tylko silnik "python"
+    "stopping_criteria": None,
+    "adaptive_control": None,
+    "local_search": None,
+}
+
+# Maksymalny rozmiar treści żądania (instancje z ~milionem przedmiotów w formacie tekstowym)
+MAX_BODY_SIZE = 256 * 1024 * 1024
+
+
+def content_hash(*parts):
+    """Skrót SHA-1 z kolejnych fragmentów (bajty lub obiekty JSON, serializowane kanonicznie)."""
+    digest = hashlib.sha1()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True).encode()
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def normalize_parameters(parameters):
+    """Uzupełnia parametry wartościami domyślnymi i sprawdza klucze. Zwraca nowy słownik."""
+    parameters = parameters or {}
+    unknown = [key for key in parameters if key not in DEFAULT_PARAMETERS]
+    if unknown:
+        raise ValueError(f"Nieznane parametry: {', '.join(unknown)}")
+    normalized = dict(DEFAULT_PARAMETERS, **parameters)
+    if normalized["engine"] not in ENGINES:
+        raise ValueError(f"Nieznany silnik: {normalized['engine']}. Dostępne: {', '.join(ENGINES)}")
+    if normalized["representation"] is not None and normalized["representation"] not in REPRESENTATIONS:
+        raise ValueError(f"Nieznana reprezentacja: {normalized['representation']}. "
+                         f"Dostępne: {', '.join(REPRESENTATIONS)}")
+    if normalized["repair_mode"] is not None and normalized["repair_mode"] not in REPAIR_MODES:
+        raise ValueError(f"Nieznany tryb naprawy: {normalized['repair_mode']}. Dostępne: {', '.join(REPAIR_MODES)}")
+    check_engine_options(normalized["engine"], representation=normalized["representation"],
+                         repair_mode=normalized["repair_mode"])
+    return normalized
+
+
+def solve_job(key, instance, parameters, progress_queue=None, progress_interval=0):
+    """
+    Jedno zadanie w procesie roboczym: ewolucja z parametrami `parameters` (po `normalize_parameters`).
+    Co `progress_interval` pokoleń wysyła do `progress_queue` krotkę ("progress", klucz zadania, rekord telemetrii).
+    Zwraca słownik z historią i najlepszym rozwiązaniem całej ewolucji (`best_solution` silnika):
+    jego fitnessem, genotypem (w trybie Baldwina naprawionym), wartością, obciążeniem i poprawnością.
+    """
+    engine_class = ENGINES[parameters["engine"]]
+    options = {"seed": parameters["seed"], "elitism": parameters["elitism"],
+               "replacement": parameters["replacement"], "steady_state_size": parameters["steady_state_size"]}
+    if parameters["representation"] is not None:
+        options["representation"] = REPRESENTATIONS[parameters["representation"]]()
+    if parameters["repair_mode"] is not None:
+        options["repair_mode"] = parameters["repair_mode"]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = engine_class(instance, parameters["population_size"], parameters["crossover_prob"],
+                          parameters["mutation_prob"], parameters["iterations"], **options)
+        if parameters["stopping_criteria"]:
+            ga.set_stopping_criteria(**parameters["stopping_criteria"])
+        if parameters["adaptive_control"] is not None:
+            ga.set_adaptive_control(**parameters["adaptive_control"])
+        if parameters["local_search"] is not None:
+            ga.set_local_search(**parameters["local_search"])
+        if progress_queue is not None and progress_interval:
+            def report_progress(record):
+                if record["generation"] % progress_interval == 0:
+                    progress_queue.put(("progress", key, record))
+            ga.add_hook(report_progress)
+        history = ga.run_evolution(getattr(ga, parameters["selection"]), getattr(ga, parameters["crossover"]))
+
+    solution, total_weight, total_value, best_fitness = ga.best_solution()
+    return {
+        "history": list(history),
+        "stop_reason": history.stop_reason,
+        "generations": history.generations,
+        "best_fitness": best_fitness,
+        "evaluations": ga.evaluations,
+        "solution": solution,
+        "value": total_value,
+        "weight": total_weight,
+        "feasible": bool(np.all(np.asarray(total_weight) <= instance.capacities)),
+        "schedule": history.schedule,
+    }
+
+
+def solve_batch(instances, jobs, progress_queue):
+    """
+    Partia zadań w jednym procesie roboczym, liczona po kolei. `instances` to słownik
+    skrót instancji -> instancja (każda instancja jest przesyłana raz na partię), a `jobs` lista krotek
+    (klucz zadania, skrót instancji, parametry, odstęp postępu). Wynik każdego zadania trafia do
+    `progress_queue` zaraz po jego zakończeniu, jako ("result", klucz, wynik) albo ("error", klucz, wyjątek),
+    więc klienci nie czekają na pozostałe zadania partii.
+    """
+    for key, digest, parameters, progress_interval in jobs:
+        try:
+            result = solve_job(key, instances[digest], parameters, progress_queue, progress_interval)
+        except Exception as e:
+            try:
+                progress_queue.put(("error", key, e))
+            except Exception:
+                # Wyjątek, którego nie da się przesłać między procesami, zastępujemy jego opisem
+                progress_queue.put(("error", key, RuntimeError(f"{type(e).__name__}: {e}")))
+        else:
+            progress_queue.put(("result", key, result))
+
+
+class SolveJob:
+    """Zadanie w toku: wspólne dla wszystkich klientów, którzy poprosili o ten sam problem i parametry."""
+
+    def __init__(self, key, instance, digest, parameters, progress_interval):
+        self.key = key
+        self.instance = instance
+        self.digest = digest
+        self.parameters = parameters
+        self.progress_interval = progress_interval
+        self.future = asyncio.get_running_loop().create_future()
+        self.progress = []      # Dotychczasowe rekordy postępu (dla klientów dołączających później)
+        self.subscribers = []   # Kolejki asyncio klientów czekających na kolejne rekordy
+
+
+class SolveService:
+    """
+    Usługa rozwiązywania problemu plecakowego działająca w pętli asyncio:
+    - nowe zadania czekają w kolejce `pending` na wolny proces roboczy; zadania zebrane do tej pory
+      są dzielone na partie (najwyżej jedna na wolny proces, zadania tej samej instancji razem)
+      i każda partia to jedno wywołanie puli (`solve_batch`) z każdą instancją przesłaną raz,
+    - sparsowane instancje i gotowe wyniki są pamiętane (LRU) pod skrótem treści instancji
+      i parametrów, więc powtórzone żądanie jest obsługiwane bez obliczeń,
+    - równoczesne żądania o ten sam problem dołączają do jednego zadania w toku,
+    - postęp kolejnych pokoleń płynie z procesów roboczych przez kolejkę `multiprocessing`
+      i jest rozsyłany do wszystkich klientów zadania.
+    """
+
+    def __init__(self, max_workers=None, instance_cache_size=64, result_cache_size=1024):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.instances = FitnessCache(instance_cache_size)  # Skrót treści -> KnapsackInstance
+        self.results = FitnessCache(result_cache_size)      # Klucz zadania -> wynik
+        self.running = {}                                   # Klucz zadania -> SolveJob (w kolejce lub liczone)
+        self.pending = []                                   # Zadania czekające na wolny proces roboczy
+        self.idle_workers = self.max_workers
+        self.dispatch_scheduled = False
+        self.submitted = 0
+        self.computed = 0
+        self.batches = 0
+
+    async def start(self):
+        """Uruchamia pulę procesów, kolejkę postępu i zadania tła (wywoływane w działającej pętli)."""
+        # Procesy są uruchamiane metodą "spawn": pula tworzy procesy robocze leniwie, już w trakcie obsługi
+        # połączeń, a proces utworzony przez fork dziedziczyłby otwarte gniazda klientów (klient nie
+        # dostałby końca odpowiedzi, dopóki proces roboczy działa)
+        context = multiprocessing.get_context("spawn")
+        self.manager = context.Manager()
+        self.progress_queue = self.manager.Queue()
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        self.tasks = [asyncio.create_task(self.progress_loop())]
+
+    async def close(self):
+        """Zatrzymuje zadania tła, pulę procesów i menedżera kolejki."""
+        for task in self.tasks:
+            task.cancel()
+        # Odblokowanie wątku czekającego na kolejce postępu
+        self.progress_queue.put(None)
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.executor.shutdown(cancel_futures=True)
+        self.manager.shutdown()
+
+    # --- Przyjmowanie zadań ---
+
+    def parse_instance(self, request):
+        """Zwraca (instancja, skrót instancji) z treści żądania, korzystając z pamięci podręcznej."""
+        if "instance_text" in request:
+            if not isinstance(request["instance_text"], str):
+                raise ValueError("'instance_text' musi być tekstem.")
+            raw = request["instance_text"].encode()
+        elif "instance" in request:
+            raw = json.dumps(request["instance"], sort_keys=True).encode()
+        else:
+            raise ValueError("Żądanie musi zawierać 'instance' lub 'instance_text'.")
+
+        raw_key = content_hash(raw)
+        cached = self.instances.get(raw_key)
+        if cached is not None:
+            return cached
+        if "instance_text" in request:
+            instance = parse_instance(raw, "instance_text")
+        else:
+            payload = request["instance"]
+            instance = KnapsackInstance(payload["capacity"], payload["values"], payload["weights"])
+        entry = (instance, instance_digest(instance))
+        self.instances.put(raw_key, entry)
+        return entry
+
+    def submit(self, request):
+        """
+        Przyjmuje żądanie i zwraca parę (zadanie, gotowy wynik). Gotowy wynik (z pamięci podręcznej)
+        oznacza, że zadanie jest None; w przeciwnym razie żądanie dołącza do zadania w toku lub tworzy nowe.
+        Dołączające żądanie dostaje postęp z `progress_interval` żądania, które utworzyło zadanie
+        (własny odstęp jest pomijany). Żądania bez ziarna zawsze tworzą nowe zadanie, którego wynik
+        nie trafia do pamięci podręcznej - ich przebiegi są losowe, więc nie można ich powtórzyć.
+        """
+        instance, digest = self.parse_instance(request)
+        parameters = normalize_parameters(request.get("parameters"))
+        if parameters["seed"] is None:
+            key = uuid.uuid4().hex  # Klucz niepowtarzalny: zadanie nie jest współdzielone
+        else:
+            key = content_hash(digest, parameters)
+            cached = self.results.get(key)
+            if cached is not None:
+                return None, cached
+            job = self.running.get(key)
+            if job is not None:
+                return job, None
+
+        job = SolveJob(key, instance, digest, parameters, int(request.get("progress_interval", 0)))
+        self.running[key] = job
+        self.pending.append(job)
+        self.schedule_dispatch()
+        return job, None
+
+    def schedule_dispatch(self):
+        """
+        Planuje `dispatch` na najbliższy obieg pętli, dzięki czemu żądania przyjęte w tym samym obiegu
+        (i wszystkie, które nadeszły, gdy procesy były zajęte) trafiają do wspólnych partii.
+        """
+        if not self.dispatch_scheduled:
+            self.dispatch_scheduled = True
+            asyncio.get_running_loop().call_soon(self.dispatch)
+
+    def dispatch(self):
+        """Dzieli oczekujące zadania na partie dla wolnych procesów roboczych i przekazuje je do puli."""
+        self.dispatch_scheduled = False
+        if not self.pending or not self.idle_workers:
+            return
+        # Zadania tej samej instancji obok siebie, więc trafiają do jak najmniejszej liczby partii
+        jobs = sorted(self.pending, key=lambda job: job.digest)
+        self.pending = []
+        size = -(-len(jobs) // self.idle_workers)  # Zaokrąglenie w górę
+        for start in range(0, len(jobs), size):
+            self.run_batch(jobs[start:start + size])
+
+    def run_batch(self, batch):
+        """Przekazuje partię zadań do puli procesów jednym wywołaniem."""
+        self.idle_workers -= 1
+        self.batches += 1
+        self.submitted += len(batch)
+        instances = {job.digest: job.instance for job in batch}
+        jobs = [(job.key, job.digest, job.parameters, job.progress_interval) for job in batch]
+        future = asyncio.get_running_loop().run_in_executor(
+            self.executor, solve_batch, instances, jobs, self.progress_queue)
+        future.add_done_callback(lambda done: self.batch_done(batch, done))
+
+    def subscribe(self, job):
+        """Zwraca kolejkę rekordów postępu zadania (z rekordami wysłanymi wcześniej)."""
+        queue = asyncio.Queue()
+        for record in job.progress:
+            queue.put_nowait(record)
+        job.subscribers.append(queue)
+        return queue
+
+    # --- Zadania tła ---
+
+    def batch_done(self, batch, done):
+        """
+        Zwalnia proces roboczy po partii i uruchamia kolejne zadania. Wyniki zadań przychodzą
+        kolejką postępu; tu kończone są tylko zadania partii przerwanej lub anulowanej w całości.
+        """
+        self.idle_workers += 1
+        if done.cancelled() or done.exception() is not None:
+            for job in batch:
+                if self.running.get(job.key) is job:
+                    if done.cancelled():
+                        self.finish(job, "cancelled")
+                    else:
+                        self.finish(job, "error", done.exception())
+        if self.pending:
+            self.schedule_dispatch()
+
+    def finish(self, job, kind, payload=None):
+        """
+        Kończy zadanie (`kind`: "result", "error" lub "cancelled"): zapamiętuje wynik
+        i powiadamia klientów (także o błędzie).
+        """
+        del self.running[job.key]
+        if kind == "cancelled":
+            job.future.cancel()
+        elif kind == "error":
+            job.future.set_exception(payload)
+        else:
+            self.computed += 1
+            if job.parameters["seed"] is not None:
+                self.results.put(job.key, payload)
+            job.future.set_result(payload)
+        for queue in job.subscribers:
+            queue.put_nowait(None)  # Koniec strumienia postępu
+
+    async def progress_loop(self):
+        """Przekazuje rekordy postępu i wyniki zadań z procesów roboczych do klientów zadań."""
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await loop.run_in_executor(None, self.progress_queue.get)
+            if message is None:
+                return
+            kind, key, payload = message
+            job = self.running.get(key)
+            if job is None:
+                continue  # Zadanie już się zakończyło
+            if kind != "progress":
+                self.finish(job, kind, payload)
+                continue
+            record = dict(payload, type="progress")
+            job.progress.append(record)
+            for queue in job.subscribers:
+                queue.put_nowait(record)
+
+    def stats(self):
+        """Liczniki pamięci podręcznych i zadań."""
+        return {
+            "submitted": self.submitted,
+            "computed": self.computed,
+            "batches": self.batches,
+            "queued": len(self.pending),
+            "running": len(self.running),
+            "instance_cache": {"size": len(self.instances.entries), "hits": self.instances.hits,
+                               "misses": self.instances.misses},
+            "result_cache": {"size": len(self.results.entries), "hits": self.results.hits,
+                             "misses": self.results.misses},
+        }
+
+    # --- Obsługa HTTP ---
+
+    async def handle_connection(self, reader, writer):
+        """Obsługuje jedno połączenie HTTP/1.1 (jedno żądanie, potem zamknięcie połączenia)."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            if len(request_line) < 2:
+                return
+            method, path = request_line[0], request_line[1]
+
+            if method == "GET" and path == "/stats":
+                await self.send_json(writer, 200, self.stats())
+            elif method == "POST" and path == "/solve":
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_SIZE:
+                    await self.send_json(writer, 413, {"type": "error", "error": "Za duża treść żądania."})
+                    return
+                body = await reader.readexactly(length)
+                await self.handle_solve(writer, body)
+            else:
+                await self.send_json(writer, 404, {"type": "error", "error": f"Nieznany adres: {method} {path}"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Klient rozłączył się w trakcie
+        finally:
+            writer.close()
+
+    async def handle_solve(self, writer, body):
+        """Przyjmuje zadanie i strumieniuje postęp oraz wynik jako JSON Lines (kodowanie chunked)."""
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("Treść żądania musi być obiektem JSON.")
+            job, cached = self.submit(request)
+        except (ValueError, KeyError, TypeError) as e:
+            await self.send_json(writer, 400, {"type": "error", "error": str(e)})
+            return
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                     b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+        if job is None:
+            await self.send_chunk(writer, dict(cached, type="result", cached=True))
+        else:
+            queue = self.subscribe(job)
+            while (record := await queue.get()) is not None:
+                await self.send_chunk(writer, record)
+            try:
+                result = await job.future
+                await self.send_chunk(writer, dict(result, type="result", cached=False))
+            except Exception as e:
+                await self.send_chunk(writer, {"type": "error", "error": f"{type(e).__name__}: {e}"})
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    async def send_chunk(writer, record):
+        """Wysyła jeden rekord JSON Lines jako fragment odpowiedzi chunked."""
+        data = (json.dumps(record) + "\n").encode()
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        await writer.drain()
+
+    @staticmethod
+    async def send_json(writer, status, payload):
+        """Wysyła zwykłą (niestrumieniowaną) odpowiedź JSON."""
+        data = json.dumps(payload).encode()
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data)
+        await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8765, unix_socket=None, **options):
+    """Uruchamia usługę na porcie TCP lub gnieździe Unix i działa do przerwania."""
+    service = SolveService(**options)
+    await service.start()
+    if unix_socket:
+        server = await asyncio.start_unix_server(service.handle_connection, path=unix_socket)
+        print(f"Usługa nasłuchuje na gnieździe {unix_socket}")
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        print(f"Usługa nasłuchuje na http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+# --- Uruchomienie z linii poleceń ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lokalna usługa rozwiązywania problemu plecakowego (HTTP).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", help="Ścieżka gniazda Unix (zamiast portu TCP).")
+    parser.add_argument("--workers", type=int, help="Liczba procesów roboczych (domyślnie liczba rdzeni).")
+    parser.add_argument("--result-cache-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix_socket, max_workers=args.workers,
+                          result_cache_size=args.result_cache_size))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,107 @@
+import functools
+import json
+import time
+
+# Fazy pokolenia, dla których mierzony jest czas
+PHASES = ("selection", "crossover", "mutation", "repair", "local_search", "evaluation")
+
+
+class PhaseProfiler:
+    """
+    Mierzy czas spędzony w poszczególnych fazach pokolenia. Operatory algorytmu są
+    owijane funkcjami mierzącymi czas tylko wtedy, gdy podłączono hooki, więc bez nich
+    pętla ewolucji działa bez żadnego narzutu.
+    Czas oceny osobników wywołanej wewnątrz innej fazy (np. ocena dziecka w krzyżowaniu)
+    jest przypisywany fazie "evaluation" i odejmowany od fazy nadrzędnej.
+    """
+
+    def __init__(self):
+        self.current_phase = None
+        self.reset()
+
+    def reset(self):
+        """Zeruje liczniki przed kolejnym pokoleniem."""
+        self.times = dict.fromkeys(PHASES, 0.0)
+        self.allocations = 0
+
+    def wrap(self, phase, func):
+        """Zwraca funkcję wywołującą `func` i doliczającą jej czas do fazy `phase`."""
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            parent_phase = self.current_phase
+            self.current_phase = phase
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                self.times[phase] += elapsed
+                self.current_phase = parent_phase
+                if parent_phase is not None:
+                    self.times[parent_phase] -= elapsed
+        return timed
+
+    def wrap_evaluation(self, func, allocated=None):
+        """
+        Jak `wrap` dla fazy "evaluation", dodatkowo licząc nowo utworzone osobniki:
+        jeden na wywołanie lub `allocated(*args)` (np. liczba wierszy ocenianej macierzy).
+        """
+        timed = self.wrap("evaluation", func)
+
+        @functools.wraps(func)
+        def counted(*args, **kwargs):
+            self.allocations += allocated(*args) if allocated is not None else 1
+            return timed(*args, **kwargs)
+        return counted
+
+
+class InMemoryRecorder:
+    """Hook zapisujący rekordy kolejnych pokoleń w pamięci (bez operacji wejścia/wyjścia)."""
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def series(self, key):
+        """Zwraca listę wartości jednego pola (np. "mean" lub "diversity") ze wszystkich pokoleń."""
+        return [record[key] for record in self.records]
+
+    def phase_totals(self):
+        """Łączny czas każdej fazy ze wszystkich pokoleń (w sekundach)."""
+        totals = dict.fromkeys(PHASES, 0.0)
+        for record in self.records:
+            for phase, elapsed in record["timings"].items():
+                totals[phase] += elapsed
+        return totals
+
+    def clear(self):
+        """Usuwa zapisane rekordy."""
+        self.records.clear()
+
+
+class JsonLinesWriter:
+    """
+    Hook zapisujący każdy rekord jako jedną linię JSON (format JSON Lines).
+    Plik jest buforowany; należy go zamknąć przez `close()` lub użyć bloku `with`.
+    """
+
+    def __init__(self, path, mode='w'):
+        self.path = path
+        self.file = open(path, mode)
+
+    def __call__(self, record):
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        """Zapisuje bufor i zamyka plik."""
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Moduły projektu leżą w katalogu głównym repozytorium (bez pakietu), więc dodajemy go do ścieżki importu
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+import pytest
+
+from go_knapsack import GeneticAlgorithm, KnapsackInstance
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1")
+
+
+class Interrupt(Exception):
+    pass
+
+
+def interrupt_after(generation):
+    """Hook telemetrii przerywający ewolucję po zapisaniu pokolenia `generation`."""
+    def hook(record):
+        if record["generation"] == generation:
+            raise Interrupt
+    return hook
+
+
+@pytest.mark.parametrize("engine", [GeneticAlgorithm, VectorizedGeneticAlgorithm], ids=["python", "numpy"])
+def test_resume_matches_uninterrupted_run(engine, tmp_path):
+    path = str(tmp_path / "run.npz")
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference = engine(DATA_FILE, 30, 0.9, 0.02, 40, seed=5)
+        expected = reference.run_evolution(reference.selection_tournament, reference.crossover_two_point)
+
+        interrupted = engine(DATA_FILE, 30, 0.9, 0.02, 40, seed=5)
+        interrupted.add_hook(interrupt_after(25))
+        with pytest.raises(Interrupt):
+            interrupted.run_evolution(interrupted.selection_tournament, interrupted.crossover_two_point,
+                                      checkpoint_path=path, checkpoint_interval=10)
+
+        resumed = engine(DATA_FILE, 30, 0.9, 0.02, 40, seed=99)
+        history = resumed.resume_evolution(path)
+
+    assert list(history) == list(expected)
+    assert [type(value) for value in history] == [type(value) for value in expected]
+    assert resumed.evaluations == reference.evaluations
+    assert resumed.best_solution() == reference.best_solution()
+    for name, column in expected.columns.items():
+        np.testing.assert_array_equal(history.columns[name], column)
+    if engine is VectorizedGeneticAlgorithm:
+        assert np.array_equal(resumed.population, reference.population)
+        assert np.array_equal(resumed.fitness, reference.fitness)
+
+
+def test_resume_multidimensional(tmp_path):
+    path = str(tmp_path / "run.npz")
+    rng = np.random.default_rng(2)
+    weights = rng.integers(1, 1000, (3, 80))
+    instance = KnapsackInstance(weights.sum(axis=1) // 2, rng.integers(1, 1000, 80), weights)
+    with contextlib.redirect_stdout(io.StringIO()):
+        reference = VectorizedGeneticAlgorithm(instance, 30, 0.9, 0.02, 30, seed=5)
+        expected = reference.run_evolution(reference.selection_rank, reference.crossover_one_point)
+
+        interrupted = VectorizedGeneticAlgorithm(instance, 30, 0.9, 0.02, 30, seed=5)
+        interrupted.add_hook(interrupt_after(15))
+        with pytest.raises(Interrupt):
+            interrupted.run_evolution(interrupted.selection_rank, interrupted.crossover_one_point,
+                                      checkpoint_path=path, checkpoint_interval=10)
+
+        history = VectorizedGeneticAlgorithm(instance, 30, 0.9, 0.02, 30).resume_evolution(path)
+
+    assert list(history) == list(expected)
@@ -0,0 +1,69 @@
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from exact_solvers import solve, solve_branch_and_bound, solve_dp, solve_file
+from go_knapsack import load_optimum
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def brute_force(capacity, values, weights):
+    """Optimum przez przejrzenie wszystkich podzbiorów (tylko dla małych instancji)."""
+    best = 0
+    for genes in itertools.product((0, 1), repeat=len(values)):
+        if np.dot(genes, weights) <= capacity:
+            best = max(best, int(np.dot(genes, values)))
+    return best
+
+
+def random_instances(count=40, seed=3):
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        n = int(rng.integers(1, 13))
+        weights = rng.integers(0, 30, n)
+        values = rng.integers(0, 40, n)
+        capacity = int(rng.integers(0, weights.sum() + 2))
+        yield capacity, values, weights
+
+
+def check_solution(capacity, values, weights, value, genotype):
+    assert len(genotype) == len(values)
+    assert int(np.dot(genotype, weights)) <= capacity
+    assert int(np.dot(genotype, values)) == value
+
+
+@pytest.mark.parametrize("capacity, values, weights", list(random_instances()))
+def test_exact_solvers_match_brute_force(capacity, values, weights):
+    expected = brute_force(capacity, values, weights)
+
+    value, genotype = solve_dp(capacity, values, weights, return_solution=True)
+    assert value == expected
+    check_solution(capacity, values, weights, value, genotype)
+    assert solve_dp(capacity, values, weights) == (expected, None)
+
+    value, genotype, optimal = solve_branch_and_bound(capacity, values, weights)
+    assert optimal
+    assert value == expected
+    check_solution(capacity, values, weights, value, genotype)
+
+    assert solve(capacity, values, weights)[0] == expected
+
+
+def test_branch_and_bound_node_limit():
+    rng = np.random.default_rng(0)
+    weights = rng.integers(100, 1000, 60)
+    values = weights + 100  # Silnie skorelowana instancja: wiele węzłów
+    capacity = int(weights.sum() // 2)
+    value, genotype, optimal = solve_branch_and_bound(capacity, values, weights, max_nodes=50)
+    assert not optimal
+    check_solution(capacity, values, weights, value, genotype)
+    assert value <= solve_dp(capacity, values, weights)[0]
+
+
+@pytest.mark.parametrize("data_file", ["low-dimensional/f1_l-d_kp_10_269", "large_scale/knapPI_1_100_1000_1"])
+def test_solve_file_matches_optimum_files(data_file):
+    path = os.path.join(ROOT, data_file)
+    assert solve_file(path)[0] == load_optimum(path)
@@ -0,0 +1,69 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from fitness_cache import FitnessCache
+from genotypes import BitsetRepresentation, ListRepresentation
+from go_knapsack import GeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1")
+
+
+def test_lru_eviction_and_counters():
+    cache = FitnessCache(2)
+    cache.put("a", (1, 1, 1))
+    cache.put("b", (2, 2, 2))
+    assert cache.get("a") == (1, 1, 1)  # "a" staje się ostatnio używanym
+    cache.put("c", (3, 3, 3))           # Usuwa najdawniej używany "b"
+    assert cache.get("b") is None
+    assert cache.get("c") == (3, 3, 3)
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.hit_rate() == pytest.approx(2 / 3)
+    cache.clear()
+    assert len(cache) == 0 and cache.hit_rate() == 0.0
+    with pytest.raises(ValueError):
+        FitnessCache(0)
+
+
+@pytest.mark.parametrize("representation", [ListRepresentation(), BitsetRepresentation()], ids=lambda r: r.name)
+def test_cache_hit_skips_full_evaluation(representation):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(DATA_FILE, 10, 0.9, 0.01, 5, representation=representation,
+                              fitness_cache_size=100, seed=1)
+    genotype = ga.population[0].genotype
+    evaluations = ga.evaluations
+    copy = ga.create_individual(genotype)
+    assert ga.evaluations == evaluations
+    assert ga.fitness_cache.hits == 1
+    assert (copy.fitness, copy.total_weight, copy.total_value) == \
+           (ga.population[0].fitness, ga.population[0].total_weight, ga.population[0].total_value)
+
+    # Osobnik ze znanymi sumami (ocena przyrostowa) nie korzysta z pamięci podręcznej
+    lookups = ga.fitness_cache.hits + ga.fitness_cache.misses
+    ga.create_individual(genotype, copy.total_weight, copy.total_value)
+    assert ga.evaluations == evaluations + 1
+    assert ga.fitness_cache.hits + ga.fitness_cache.misses == lookups
+
+
+@pytest.mark.parametrize("representation", [ListRepresentation(), BitsetRepresentation()], ids=lambda r: r.name)
+def test_cache_does_not_change_evolution(representation):
+    runs = []
+    for fitness_cache_size in (None, 50):
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga = GeneticAlgorithm(DATA_FILE, 30, 0.9, 0.02, 30, representation=representation,
+                                  fitness_cache_size=fitness_cache_size, seed=6)
+            history = ga.run_evolution(ga.selection_tournament, ga.crossover_two_point)
+        runs.append((list(history), ga.evaluations))
+    assert runs[0] == runs[1]
+
+
+def test_packed_list_key_round_trip():
+    representation = ListRepresentation()
+    genotype = [1, 0, 0, 1, 1, 0, 1, 0, 1, 1, 1]
+    key = representation.key(genotype)
+    assert key == representation.to_bytes(genotype, len(genotype))
+    assert representation.from_key(key, len(genotype)) == genotype
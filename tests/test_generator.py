@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from exact_solvers import solve_dp
+from generator import (FAMILIES, exact_optimum, generate_instance, instance_file_name, write_instance,
+                       write_optimum)
+from go_knapsack import load_instance, load_optimum
+
+
+@pytest.mark.parametrize("family", list(FAMILIES))
+def test_generated_families(family):
+    instance = generate_instance(family, 500, coefficient_range=1000, seed=4, index=30)
+    values, weights = instance.values, instance.weights
+    assert len(instance) == 500
+    assert instance.capacity == 30 * int(weights.sum()) // 101
+    assert values.min() >= 1 and weights.min() >= 1
+    if family == "uncorrelated":
+        assert weights.max() <= 1000 and values.max() <= 1000
+    elif family == "weakly_correlated":
+        assert np.all(np.abs(values - weights) <= 100)
+    elif family == "strongly_correlated":
+        assert np.array_equal(values, weights + 100)
+    elif family == "inverse_strongly_correlated":
+        assert np.array_equal(weights, values + 100)
+    else:
+        assert np.array_equal(values, weights)
+
+    again = generate_instance(family, 500, coefficient_range=1000, seed=4, index=30)
+    assert np.array_equal(again.values, values) and np.array_equal(again.weights, weights)
+
+
+@pytest.mark.parametrize("arguments", [
+    {"family": "unknown", "n": 10},
+    {"family": "uncorrelated", "n": 0},
+    {"family": "uncorrelated", "n": 10, "index": 101},
+])
+def test_generator_rejects_invalid_arguments(arguments):
+    with pytest.raises(ValueError):
+        generate_instance(**arguments)
+
+
+@pytest.mark.parametrize("family", list(FAMILIES))
+def test_exact_optimum_matches_dp(family):
+    instance = generate_instance(family, 60, coefficient_range=100, seed=1, index=50)
+    assert exact_optimum(instance) == solve_dp(instance.capacity, instance.values, instance.weights)[0]
+
+
+def test_written_files_round_trip(tmp_path):
+    instance = generate_instance("weakly_correlated", 200, seed=2)
+    directory = tmp_path / "generated"
+    directory.mkdir()
+    data_file = str(directory / instance_file_name("weakly_correlated", 200, 1000))
+    assert data_file.endswith("knapPI_2_200_1000_1")
+
+    write_instance(instance, data_file)
+    loaded = load_instance(data_file)
+    assert loaded.capacity == instance.capacity
+    assert np.array_equal(loaded.values, instance.values)
+    assert np.array_equal(loaded.weights, instance.weights)
+
+    write_optimum(data_file, exact_optimum(instance))
+    assert load_optimum(data_file) == exact_optimum(loaded)
@@ -0,0 +1,100 @@
+import contextlib
+import io
+import os
+import random
+
+import pytest
+
+from genotypes import BitsetRepresentation, ListRepresentation
+from go_knapsack import GeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPRESENTATIONS = [ListRepresentation(), BitsetRepresentation()]
+LENGTH = 70  # Więcej niż jedno słowo maszynowe, żeby sprawdzić maski na granicy słów
+
+
+def random_genes(rng, length=LENGTH):
+    """Losowa lista 0/1."""
+    return [rng.randrange(2) for _ in range(length)]
+
+
+@pytest.fixture
+def rng():
+    return random.Random(1234)
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS, ids=lambda r: r.name)
+def test_round_trip(representation, rng):
+    genes = random_genes(rng)
+    genotype = representation.from_list(genes)
+    assert representation.to_list(genotype, LENGTH) == genes
+    assert representation.to_list(representation.from_bytes(representation.to_bytes(genotype, LENGTH), LENGTH),
+                                  LENGTH) == genes
+    assert representation.selected_indices(genotype) == [i for i, gene in enumerate(genes) if gene]
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS, ids=lambda r: r.name)
+@pytest.mark.parametrize("cut_point", [1, 31, 32, 33, 64, LENGTH - 1])
+def test_one_point(representation, rng, cut_point):
+    genes1, genes2 = random_genes(rng), random_genes(rng)
+    child1, child2 = representation.one_point(representation.from_list(genes1), representation.from_list(genes2),
+                                              cut_point)
+    assert representation.to_list(child1, LENGTH) == genes1[:cut_point] + genes2[cut_point:]
+    assert representation.to_list(child2, LENGTH) == genes2[:cut_point] + genes1[cut_point:]
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS, ids=lambda r: r.name)
+@pytest.mark.parametrize("p1, p2", [(1, 2), (1, LENGTH - 1), (10, 64), (63, 65), (30, 31)])
+def test_two_point(representation, rng, p1, p2):
+    genes1, genes2 = random_genes(rng), random_genes(rng)
+    child1, child2 = representation.two_point(representation.from_list(genes1), representation.from_list(genes2),
+                                              p1, p2)
+    assert representation.to_list(child1, LENGTH) == genes1[:p1] + genes2[p1:p2] + genes1[p2:]
+    assert representation.to_list(child2, LENGTH) == genes2[:p1] + genes1[p1:p2] + genes2[p2:]
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS, ids=lambda r: r.name)
+def test_flip(representation, rng):
+    genes = random_genes(rng)
+    genotype = representation.from_list(genes)
+    positions = [0, 5, 31, 32, 63, 64, LENGTH - 1]
+    flipped = representation.flip(genotype, positions)
+    expected = [1 - gene if i in positions else gene for i, gene in enumerate(genes)]
+    assert representation.to_list(flipped, LENGTH) == expected
+    # Oryginał bez zmian
+    assert representation.to_list(genotype, LENGTH) == genes
+    assert representation.flip(genotype, []) == genotype
+
+
+@pytest.mark.parametrize("representation", REPRESENTATIONS, ids=lambda r: r.name)
+@pytest.mark.parametrize("start, stop", [(0, LENGTH), (0, 1), (5, 40), (32, 64), (63, LENGTH), (10, 10)])
+def test_diff_indices(representation, rng, start, stop):
+    genes1, genes2 = random_genes(rng), random_genes(rng)
+    gained, lost = representation.diff_indices(representation.from_list(genes1), representation.from_list(genes2),
+                                               start, stop)
+    assert gained == [i for i in range(start, stop) if genes2[i] == 1 and genes1[i] == 0]
+    assert lost == [i for i in range(start, stop) if genes1[i] == 1 and genes2[i] == 0]
+
+
+def run(representation, data_file, selection, crossover, seed, **options):
+    """Jedna ewolucja z podaną reprezentacją; zwraca (historia, liczba ocen)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(os.path.join(ROOT, data_file), 40, 0.9, 0.02, 60, representation=representation,
+                              seed=seed, **options)
+        history = ga.run_evolution(getattr(ga, selection), getattr(ga, crossover))
+    return list(history), ga.evaluations
+
+
+@pytest.mark.parametrize("data_file", ["large_scale/knapPI_1_100_1000_1", "low-dimensional/f2_l-d_kp_20_878"])
+@pytest.mark.parametrize("selection, crossover", [
+    ("selection_roulette_wheel", "crossover_one_point"),
+    ("selection_rank", "crossover_two_point"),
+    ("selection_tournament", "crossover_one_point"),
+])
+@pytest.mark.parametrize("options", [{}, {"repair_mode": "lamarckian", "fitness_cache_size": 64}],
+                         ids=["plain", "repair+cache"])
+def test_representations_give_identical_runs(data_file, selection, crossover, options):
+    list_history, list_evaluations = run(ListRepresentation(), data_file, selection, crossover, 7, **options)
+    bitset_history, bitset_evaluations = run(BitsetRepresentation(), data_file, selection, crossover, 7, **options)
+    assert bitset_history == list_history
+    assert bitset_evaluations == list_evaluations
@@ -0,0 +1,120 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+import pytest
+
+from experiments import ExperimentConfig
+from go_knapsack import EvolutionHistory, GeneticAlgorithm
+from history_store import COLUMNS, HistoryRecorder, HistoryStore, run_key
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1")
+
+
+@pytest.mark.parametrize("engine, options", [
+    (GeneticAlgorithm, {}),
+    (GeneticAlgorithm, {"repair_mode": "lamarckian"}),
+    (VectorizedGeneticAlgorithm, {}),
+], ids=["python", "lamarckian", "numpy"])
+def test_run_evolution_returns_typed_columns(engine, options):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = engine(DATA_FILE, 30, 0.9, 0.02, 25, seed=3, **options)
+        history = ga.run_evolution(ga.selection_rank, ga.crossover_one_point)
+
+    columns = history.columns
+    assert set(columns) == set(COLUMNS)
+    for name, dtype in COLUMNS.items():
+        assert columns[name].dtype == dtype
+        assert len(columns[name]) == len(history) == 25
+    np.testing.assert_array_equal(columns["best"], np.asarray(history, dtype=np.float64))
+    np.testing.assert_array_equal(columns["feasible"], [isinstance(value, int) for value in history])
+    assert not np.isnan(columns["mean"]).any()
+    assert (columns["mean"] <= columns["best"] + 1e-3).all()
+    assert ((0 <= columns["diversity"]) & (columns["diversity"] <= 1)).all()
+
+
+def make_history(seed, length):
+    """Historia z kolumnami jak z `run_evolution`: wartości plecaka (int) przeplatane karami (float)."""
+    rng = np.random.default_rng(seed)
+    values = [int(v) if rng.random() < 0.7 else float(rng.random()) for v in rng.integers(1, 10**9, length)]
+    columns = {"best": np.asarray(values, dtype=np.float64),
+               "feasible": np.array([isinstance(v, int) for v in values]),
+               "mean": rng.random(length).astype(np.float32),
+               "diversity": rng.random(length).astype(np.float32)}
+    return EvolutionHistory(values, "iterations", length, None, columns, value_offset=seed)
+
+
+def make_config(seed, **options):
+    return ExperimentConfig("large_scale/knapPI_1_100_1000_1", "selection_rank", "crossover_one_point",
+                            0.01, 0.9, seed, 30, 25, label=f"run {seed}", **options)
+
+
+def test_history_store_round_trip_across_chunks(tmp_path):
+    directory = str(tmp_path / "store")
+    histories = {seed: make_history(seed, 10 + seed) for seed in range(7)}
+    with HistoryStore(directory, chunk_runs=3) as store:
+        keys = {seed: store.append(make_config(seed), history) for seed, history in histories.items()}
+        # Dwa pełne fragmenty są już na dysku, ostatnie uruchomienie czeka w buforze
+        assert len(store.entries) == 6 and len(store) == 7
+
+    store = HistoryStore(directory)
+    assert len(store) == 7
+    assert sorted({entry["chunk"] for entry in store.entries}) == ["chunk-000001", "chunk-000002", "chunk-000003"]
+    for seed, history in histories.items():
+        entry = store.find(keys[seed])
+        assert entry["key"] == run_key(make_config(seed)) and entry["label"] == f"run {seed}"
+        assert entry["stop_reason"] == "iterations" and entry["value_offset"] == seed
+        values = store.values(entry)
+        assert values == list(history)
+        assert [type(value) for value in values] == [type(value) for value in history]
+        for name in COLUMNS:
+            column = store.load(keys[seed], name)
+            assert isinstance(column, np.memmap)
+            np.testing.assert_array_equal(column, history.columns[name])
+
+    # Dopisanie po ponownym otwarciu tworzy nowy fragment; `find` zwraca najnowszy wpis klucza
+    replacement = make_history(100, 5)
+    store.append(make_config(0), replacement)
+    store.close()
+    reopened = HistoryStore(directory)
+    assert len(reopened) == 8
+    assert reopened.values(keys[0]) == list(replacement)
+    assert len(reopened.runs(seed=0)) == 2
+    assert set(reopened.series("diversity", seed=3)) == {"run 3"}
+    with pytest.raises(KeyError):
+        reopened.load("missing")
+    with pytest.raises(ValueError):
+        reopened.load(keys[1], "unknown")
+
+
+def test_history_store_without_columns(tmp_path):
+    with HistoryStore(str(tmp_path)) as store:
+        key = store.append(make_config(1), [0.5, 7, 9])
+        store.flush()
+        assert store.values(key) == [0.5, 7, 9]
+        assert np.isnan(store.load(key, "mean")).all()
+        with pytest.raises(ValueError):
+            store.append(make_config(2), [1, 2], columns={"mean": np.zeros(3)})
+
+
+def test_ignored_fields_do_not_change_run_key():
+    assert run_key(make_config(1)) == run_key(make_config(1, binary_cache=True, checkpoint_interval=5))
+    assert run_key(make_config(1)) != run_key(make_config(2))
+    assert run_key(make_config(1)) != run_key(make_config(1, representation="bitset"))
+
+
+def test_recorder_grows_and_restores():
+    recorder = HistoryRecorder(2)
+    for generation in range(5):
+        recorder.record(generation, generation + 0.5 if generation % 2 else generation, generation % 2 == 0,
+                        generation / 2, 0.1)
+    assert recorder.length == 5
+    assert recorder.values() == [0, 1.5, 2, 3.5, 4]
+
+    restored = HistoryRecorder(1)
+    restored.restore({"best": recorder.result()["best"], "feasible": recorder.result()["feasible"]})
+    assert restored.values() == recorder.values()
+    assert np.isnan(restored.result()["mean"]).all()
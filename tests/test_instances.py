@@ -0,0 +1,59 @@
+import contextlib
+import io
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from go_knapsack import binary_cache_path, load_instance, parse_instance
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_parse_single_and_multidimensional():
+    instance = parse_instance("3 10\n5 4\n\n6 5\n7 6\n")
+    assert instance.capacity == 10
+    assert instance.values.tolist() == [5, 6, 7]
+    assert instance.weights.tolist() == [4, 5, 6]
+
+    instance = parse_instance(b"2 10 20\n5 4 8\n6 5 9")
+    assert instance.capacities.tolist() == [10, 20]
+    assert instance.weight_matrix.tolist() == [[4, 5], [8, 9]]
+
+
+@pytest.mark.parametrize("data", [
+    "",                        # brak nagłówka
+    "3\n5 4\n",                # brak pojemności
+    "2 10\n5 4\n6\n",          # wiersz bez wagi
+    "2 10\n5 4 1\n6 5 2\n",    # za dużo kolumn
+    "2 10\n5 4\n6 x\n",        # zła liczba
+    "3 10\n5 4\n6 5\n",        # za mało przedmiotów
+    "1 10\n5 4\n6 5\n",        # za dużo przedmiotów
+    "2 10\n",                  # brak przedmiotów
+])
+def test_parse_rejects_malformed_data(data):
+    with pytest.raises(ValueError):
+        parse_instance(data)
+
+
+def test_binary_cache_matches_text(tmp_path):
+    data_file = str(tmp_path / "knapPI_1_100_1000_1")
+    shutil.copy(os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1"), data_file)
+    text = load_instance(data_file)
+
+    created = load_instance(data_file, binary_cache=True)
+    assert os.path.exists(binary_cache_path(data_file))
+    mapped = load_instance(data_file, binary_cache=True)
+    for instance in (created, mapped):
+        assert instance.capacity == text.capacity
+        assert np.array_equal(instance.values, text.values)
+        assert np.array_equal(instance.weights, text.weights)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        histories = []
+        for binary_cache in (False, True):
+            ga = VectorizedGeneticAlgorithm(data_file, 20, 0.9, 0.02, 10, seed=1, binary_cache=binary_cache)
+            histories.append(list(ga.run_evolution(ga.selection_rank, ga.crossover_one_point)))
+    assert histories[0] == histories[1]
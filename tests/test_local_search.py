@@ -0,0 +1,33 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from go_knapsack import KnapsackInstance
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+
+def random_instance(dimensions, n=120, seed=1):
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 1000, (dimensions, n))
+    return KnapsackInstance(weights.sum(axis=1) * 6 // 10, rng.integers(1, 1000, n), weights)
+
+
+@pytest.mark.parametrize("dimensions", [1, 3])
+@pytest.mark.parametrize("replacement", ["generational", "steady_state"])
+def test_vectorized_local_search(dimensions, replacement):
+    instance = random_instance(dimensions)
+    with contextlib.redirect_stdout(io.StringIO()):
+        plain = VectorizedGeneticAlgorithm(instance, 40, 0.9, 0.01, 30, seed=4, replacement=replacement)
+        plain_history = plain.run_evolution(plain.selection_tournament, plain.crossover_one_point)
+        ga = VectorizedGeneticAlgorithm(instance, 40, 0.9, 0.01, 30, seed=4, replacement=replacement)
+        ga.set_local_search(0.2)
+        history = ga.run_evolution(ga.selection_tournament, ga.crossover_one_point)
+
+    assert ga.local_search_improvements > 0
+    assert history[-1] > plain_history[-1]
+    # Fitness po przeszukiwaniu lokalnym zgadza się z ponowną oceną populacji
+    evaluations = ga.evaluations
+    assert np.array_equal(ga.evaluate_population(ga.population), ga.fitness)
+    assert evaluations == plain.evaluations + ga.local_search_improvements
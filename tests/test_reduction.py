@@ -0,0 +1,71 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+import pytest
+
+from exact_solvers import solve_dp
+from go_knapsack import GeneticAlgorithm, KnapsackInstance, load_instance, load_optimum
+from reduction import reduce_instance
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def random_instance(seed, n=60):
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(0, 200, n)
+    values = rng.integers(0, 200, n)
+    capacity = int(rng.integers(1, weights.sum() + 1))
+    return KnapsackInstance(capacity, values, weights)
+
+
+def optimum(instance):
+    return solve_dp(instance.capacity, instance.values, instance.weights)[0]
+
+
+@pytest.mark.parametrize("known_optimum", [False, True], ids=["greedy", "known"])
+@pytest.mark.parametrize("seed", range(20))
+def test_reduction_keeps_optimum(seed, known_optimum):
+    instance = random_instance(seed)
+    expected = optimum(instance)
+    reduced = reduce_instance(instance, lower_bound=expected if known_optimum else None)
+
+    assert reduced.lower_bound <= expected <= reduced.upper_bound
+    assert len(reduced.core_items) + len(reduced.fixed_ones) <= len(instance)
+    assert not set(reduced.core_items.tolist()) & set(reduced.fixed_ones.tolist())
+    assert reduced.fixed_weight <= instance.capacity
+    # Optimum rdzenia plus ustalone przedmioty to optimum pełnego problemu
+    core_value, core_genes = solve_dp(reduced.core.capacity, reduced.core.values, reduced.core.weights,
+                                      return_solution=True)
+    assert core_value + reduced.fixed_value == expected
+    genes = reduced.expand_genotype(core_genes)
+    assert int(np.dot(genes, instance.weights)) <= instance.capacity
+    assert int(np.dot(genes, instance.values)) == expected
+
+
+@pytest.mark.parametrize("data_file", ["low-dimensional/f2_l-d_kp_20_878", "large_scale/knapPI_1_100_1000_1",
+                                       "large_scale/knapPI_2_100_1000_1"])
+def test_reduction_of_bundled_instances(data_file):
+    path = os.path.join(ROOT, data_file)
+    instance = load_instance(path)
+    known = load_optimum(path)
+    for lower_bound in (None, known):
+        reduced = reduce_instance(instance, lower_bound=lower_bound)
+        assert optimum(reduced.core) + reduced.fixed_value == known
+    # Znane optimum jako dolne ograniczenie ustala co najmniej tyle zmiennych co rozwiązanie zachłanne
+    assert len(reduce_instance(instance, lower_bound=known).core_items) <= len(reduce_instance(instance).core_items)
+
+
+def test_map_history_returns_full_problem_values():
+    instance = load_instance(os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1"))
+    reduced = reduce_instance(instance)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(reduced.core, 20, 0.9, 0.05, 15, seed=2)
+        history = ga.run_evolution(ga.selection_rank, ga.crossover_one_point)
+    mapped = reduced.map_history(history)
+
+    assert list(mapped) == [reduced.full_fitness(fitness) for fitness in history]
+    assert mapped.value_offset == reduced.fixed_value
+    np.testing.assert_array_equal(mapped.columns["best"], np.asarray(list(mapped), dtype=np.float64))
+    np.testing.assert_array_equal(mapped.columns["mean"], history.columns["mean"])
@@ -0,0 +1,50 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from genotypes import BitsetRepresentation, ListRepresentation
+from go_knapsack import GeneticAlgorithm
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("representation", [ListRepresentation(), BitsetRepresentation()], ids=lambda r: r.name)
+@pytest.mark.parametrize("repair_mode", ["baldwinian", "lamarckian"])
+def test_solution_matches_fitness(representation, repair_mode):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = GeneticAlgorithm(os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1"), 30, 0.9, 0.05, 20,
+                              representation=representation, repair_mode=repair_mode, seed=3)
+        ga.run_evolution(ga.selection_rank, ga.crossover_one_point)
+
+    for individual in ga.population:
+        genes, total_weight, total_value = ga.solution(individual)
+        assert len(genes) == ga.chromosome_length
+        assert total_weight == int(ga.weights[[i for i, gene in enumerate(genes) if gene]].sum())
+        assert total_value == int(ga.values[[i for i, gene in enumerate(genes) if gene]].sum())
+        assert total_weight <= ga.capacity
+        assert total_value == individual.fitness
+
+
+@pytest.mark.parametrize("engine, options", [
+    (GeneticAlgorithm, {}),
+    (GeneticAlgorithm, {"repair_mode": "baldwinian"}),
+    (GeneticAlgorithm, {"repair_mode": "lamarckian", "representation": BitsetRepresentation()}),
+    (VectorizedGeneticAlgorithm, {}),
+], ids=["python", "baldwinian", "lamarckian-bitset", "numpy"])
+def test_best_solution_matches_history(engine, options):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = engine(os.path.join(ROOT, "large_scale/knapPI_2_100_1000_1"), 30, 0.9, 0.05, 40, seed=8, **options)
+        history = ga.run_evolution(ga.selection_tournament, ga.crossover_two_point)
+
+    genes, total_weight, total_value, fitness = ga.best_solution()
+    assert fitness == max(history)
+    assert type(fitness) is type(history[history.index(fitness)])
+    selected = [i for i, gene in enumerate(genes) if gene]
+    assert total_weight == int(ga.weights[selected].sum())
+    assert total_value == int(ga.values[selected].sum())
+    if isinstance(fitness, int):
+        assert total_weight <= ga.capacity
+        assert total_value == fitness
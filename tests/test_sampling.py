@@ -0,0 +1,52 @@
+import contextlib
+import io
+import os
+import random
+
+import numpy as np
+import pytest
+
+from go_knapsack import GeneticAlgorithm
+from sampling import AliasTable
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1")
+
+
+@pytest.mark.parametrize("weights", [[1, 2, 3, 4], [5, 0, 0, 1], [0.1, 0.7, 0.2], list(range(1, 51)), [3]])
+def test_alias_table_matches_weights(weights):
+    table = AliasTable(weights)
+    draws = 200_000
+    counts = np.bincount(table.sample(draws, random.Random(1)), minlength=len(weights))
+    expected = np.asarray(weights, dtype=float) / sum(weights)
+    np.testing.assert_allclose(counts / draws, expected, atol=0.005)
+    assert counts[np.asarray(weights) == 0].sum() == 0
+    assert 0 <= table.draw(random.Random(2)) < len(weights)
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0], [-1, 1]])
+def test_alias_table_rejects_invalid_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+@pytest.mark.parametrize("engine", [GeneticAlgorithm, VectorizedGeneticAlgorithm], ids=["python", "numpy"])
+@pytest.mark.parametrize("selection", ["selection_roulette_wheel", "selection_rank",
+                                       "selection_stochastic_universal", "selection_tournament"])
+def test_selection_favours_fitter_individuals(engine, selection):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = engine(DATA_FILE, 60, 0.9, 0.01, 5, seed=2)
+    if engine is VectorizedGeneticAlgorithm:
+        # Silnik wektorowy ocenia populację dopiero w `run_evolution`
+        ga.fitness = ga.evaluate_population(ga.population)
+    fitness = np.asarray(ga.fitness_array(), dtype=float)
+    chosen = []
+    for _ in range(50):
+        parents = getattr(ga, selection)()
+        if engine is GeneticAlgorithm:
+            chosen.extend(parent.fitness for parent in parents)
+        else:
+            chosen.extend(fitness[parents].tolist())
+    assert len(chosen) == 50 * ga.population_size
+    assert np.mean(chosen) > fitness.mean()
@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+
+from service import SolveService
+
+INSTANCE = {"capacity": 50, "values": [10, 40, 30, 50, 35, 25], "weights": [5, 20, 15, 25, 18, 12]}
+PARAMETERS = {"seed": 1, "iterations": 15, "population_size": 12}
+
+
+class MemoryWriter:
+    """Zastępuje `asyncio.StreamWriter`: zbiera wysłane bajty w pamięci."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+async def request(service, method, path, body=b""):
+    """Obsługuje jedno żądanie HTTP. Zwraca (kod odpowiedzi, lista rekordów JSON z treści)."""
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode()
+    reader = asyncio.StreamReader()
+    reader.feed_data(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    reader.feed_eof()
+    writer = MemoryWriter()
+    await service.handle_connection(reader, writer)
+    head, _, payload = bytes(writer.data).partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    # Treść zwykła (Content-Length) albo chunked: rekordy JSON to wiersze zaczynające się od "{"
+    records = [json.loads(line) for line in payload.split(b"\r\n") if line.startswith(b"{")]
+    return status, records
+
+
+def run_service(scenario, max_workers=2):
+    """Uruchamia `scenario(service)` w pętli asyncio z działającą usługą."""
+    async def main():
+        service = SolveService(max_workers=max_workers)
+        await service.start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("body", [b"[1]", b'"x"', b"not json", {"parameters": {}},
+                                  {"instance_text": 5}, {"instance": INSTANCE, "parameters": {"unknown": 1}},
+                                  {"instance": INSTANCE, "parameters": {"engine": "numpy", "repair_mode": "lamarckian"}}],
+                         ids=["list", "string", "invalid", "no-instance", "text-type", "unknown", "engine-option"])
+def test_bad_request_body_returns_400(body):
+    async def scenario(service):
+        return await request(service, "POST", "/solve", body)
+    status, records = run_service(scenario, max_workers=1)
+    assert status == 400
+    assert records[0]["type"] == "error"
+
+
+def test_repeated_request_is_served_from_cache():
+    async def scenario(service):
+        first = await request(service, "POST", "/solve", {"instance": INSTANCE, "parameters": PARAMETERS,
+                                                           "progress_interval": 5})
+        second = await request(service, "POST", "/solve", {"instance": INSTANCE, "parameters": PARAMETERS})
+        _, stats = await request(service, "GET", "/stats")
+        return first, second, stats[0]
+    (status, first), (_, second), stats = run_service(scenario)
+
+    assert status == 200
+    assert [record["generation"] for record in first if record["type"] == "progress"] == [0, 5, 10]
+    assert first[-1]["type"] == "result" and not first[-1]["cached"]
+    assert len(second) == 1 and second[-1]["cached"]
+    assert dict(second[-1], cached=False) == first[-1]
+    assert first[-1]["feasible"] and first[-1]["weight"] <= INSTANCE["capacity"]
+    assert stats["computed"] == 1 and stats["result_cache"]["hits"] == 1
+
+
+def test_concurrent_requests_join_and_batch():
+    async def scenario(service):
+        same = {"instance": INSTANCE, "parameters": PARAMETERS}
+        others = [{"instance": INSTANCE, "parameters": dict(PARAMETERS, seed=seed)} for seed in (2, 3, 4)]
+        unseeded = {"instance": INSTANCE, "parameters": dict(PARAMETERS, seed=None)}
+        responses = await asyncio.gather(*[request(service, "POST", "/solve", body)
+                                           for body in [same, same] + others + [unseeded, unseeded]])
+        _, stats = await request(service, "GET", "/stats")
+        return responses, stats[0]
+    responses, stats = run_service(scenario)
+
+    results = [records[-1] for _, records in responses]
+    assert all(result["type"] == "result" and not result["cached"] for result in results)
+    # Dwa identyczne żądania z ziarnem dzielą jedno zadanie; żądania bez ziarna są liczone osobno
+    assert results[0] == results[1]
+    assert stats["submitted"] == stats["computed"] == 6
+    # Zadania przyjęte naraz trafiają do puli w najwyżej jednej partii na proces roboczy
+    assert stats["batches"] <= 2
+    assert stats["running"] == stats["queued"] == 0
+    assert stats["result_cache"]["size"] == 4
@@ -0,0 +1,93 @@
+import contextlib
+import io
+import os
+
+import pytest
+
+from go_knapsack import GeneticAlgorithm, StoppingCriteria
+from vectorized_knapsack import VectorizedGeneticAlgorithm
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_FILE = os.path.join(ROOT, "large_scale/knapPI_1_100_1000_1")
+ENGINES = pytest.mark.parametrize("engine", [GeneticAlgorithm, VectorizedGeneticAlgorithm], ids=["python", "numpy"])
+
+
+def run(engine, iterations=60, **criteria):
+    """Uruchamia krótką ewolucję z podanymi warunkami zakończenia. Zwraca (algorytm, historia)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = engine(DATA_FILE, 30, 0.9, 0.02, iterations, seed=3)
+        ga.set_stopping_criteria(**criteria)
+        history = ga.run_evolution(ga.selection_tournament, ga.crossover_one_point)
+    return ga, history
+
+
+def no_diversity():
+    raise AssertionError("różnorodność liczona bez warunku min_diversity")
+
+
+def test_check_order_and_lazy_diversity():
+    criteria = StoppingCriteria(target_fitness=10, stall_generations=0, min_diversity=1.0,
+                                time_limit=0, max_evaluations=1)
+    # Kilka warunków naraz: wygrywa pierwszy w kolejności sprawdzania
+    assert criteria.check(0, 10, 5, lambda: 0.0) == "target_fitness"
+    assert StoppingCriteria(stall_generations=0, max_evaluations=1).check(0, 1, 5, no_diversity) == "stall"
+    assert StoppingCriteria(max_evaluations=5, time_limit=0).check(0, 1, 5, no_diversity) == "max_evaluations"
+    assert StoppingCriteria(time_limit=0, min_diversity=1.0).check(0, 1, 5, lambda: 0.0) == "time_limit"
+    assert StoppingCriteria(min_diversity=0.5).check(0, 1, 5, lambda: 0.4) == "diversity"
+    assert StoppingCriteria(min_diversity=0.5).check(0, 1, 5, lambda: 0.5) is None
+    assert StoppingCriteria().check(0, 1, 5, no_diversity) is None
+
+
+def test_stall_counts_generations_since_last_improvement():
+    criteria = StoppingCriteria(stall_generations=2)
+    assert criteria.check(0, 5, 0, no_diversity) is None
+    assert criteria.check(1, 7, 0, no_diversity) is None
+    assert criteria.check(2, 7, 0, no_diversity) is None  # Równy wynik to nie poprawa
+    assert criteria.check(3, 6, 0, no_diversity) == "stall"
+    criteria.start()
+    assert (criteria.best_fitness, criteria.last_improvement) == (None, 0)
+
+
+@ENGINES
+def test_without_criteria_runs_all_iterations(engine):
+    _, history = run(engine, iterations=25)
+    assert history.stop_reason == "iterations"
+    assert len(history) == history.generations == 25
+
+
+@ENGINES
+def test_target_fitness_stops_at_first_generation_reaching_it(engine):
+    _, full = run(engine)
+    target = full[10]
+    stop = next(i for i, fitness in enumerate(full) if fitness >= target)
+    _, history = run(engine, target_fitness=target)
+    assert history.stop_reason == "target_fitness"
+    assert list(history) == list(full[:stop + 1])
+    assert history.generations == stop + 1
+
+
+@ENGINES
+def test_stall_stops_after_generations_without_improvement(engine):
+    _, history = run(engine, iterations=300, stall_generations=5)
+    assert history.stop_reason == "stall"
+    assert len(history) < 300
+    assert max(history[-5:]) <= max(history[:-5])
+    assert max(history[-6:]) > max(history[:-6])
+
+
+@ENGINES
+def test_max_evaluations(engine):
+    ga, history = run(engine, max_evaluations=200)
+    assert history.stop_reason == "max_evaluations"
+    assert ga.evaluations >= 200
+    assert len(history) < 60
+
+
+@ENGINES
+@pytest.mark.parametrize("criteria, reason", [({"time_limit": 0}, "time_limit"),
+                                              ({"min_diversity": 1.01}, "diversity")],
+                         ids=["time", "diversity"])
+def test_criteria_met_at_start_stop_after_first_generation(engine, criteria, reason):
+    _, history = run(engine, **criteria)
+    assert history.stop_reason == reason
+    assert len(history) == history.generations == 1
@@ -0,0 +1,427 @@
+import numpy as np
+
+from checkpoints import decode_numbers, encode_numbers
+from go_knapsack import GeneticAlgorithm, population_diversity
+from history_store import HistoryRecorder
+from telemetry import PhaseProfiler
+
+
+class VectorizedGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Alternatywny silnik algorytmu genetycznego oparty na NumPy.
+    Cała populacja jest przechowywana jako jedna macierz 0/1 (uint8)
+    o wymiarach [population_size x chromosome_length], a wartości i wagi
+    przedmiotów jako tablice NumPy. Fitness całej populacji liczony jest
+    naraz jednym iloczynem macierzy populacji i macierzy przedmiotów.
+
+    Obsługuje także instancje z wieloma ograniczeniami (`KnapsackInstance.dimensions > 1`).
+
+    Interfejs jest zgodny z `GeneticAlgorithm`: `run_evolution(selection_method,
+    crossover_method)` zwraca taką samą historię najlepszego fitnessu, a punkty kontrolne
+    (`checkpoint_path`, `resume_evolution`) mają ten sam format pliku .npz.
+    """
+
+    supports_multidimensional = True
+
+    def __init__(self, data_file, population_size, crossover_prob, mutation_prob, iterations, seed=None,
+                 tournament_size=2, elitism=0, replacement="generational", steady_state_size=None,
+                 binary_cache=False):
+        # Generator `self.rng` tworzy klasa bazowa z ziarna `seed` (przed utworzeniem populacji)
+        super().__init__(data_file, population_size, crossover_prob, mutation_prob, iterations,
+                         tournament_size=tournament_size, elitism=elitism, replacement=replacement,
+                         steady_state_size=steady_state_size, seed=seed, binary_cache=binary_cache)
+        # Macierz n x (1 + m): wartości i wagi wszystkich ograniczeń (do oceny jednym iloczynem)
+        self.item_matrix = np.column_stack((self.values, self.instance.weight_matrix.T))
+        # Najlepszy wiersz całej ewolucji to kopia w `best_individual`, a jego fitness (jak w historii) tutaj
+        self.best_individual_fitness = None
+
+    def create_initial_population(self):
+        """Tworzy losową macierz populacji (każdy wiersz to genotyp jednego osobnika)."""
+        return self.rng.integers(0, 2, size=(self.population_size, self.chromosome_length), dtype=np.uint8)
+
+    def evaluate_population(self, population):
+        """
+        Oblicza fitness wszystkich osobników naraz.
+        Reguła jest identyczna jak w `Individual.calculate_fitness`:
+        poprawny plecak -> suma wartości, przeładowany -> capacity / waga.
+        Przy wielu ograniczeniach wartości i obciążenia wszystkich wymiarów daje jeden iloczyn
+        macierzy populacji przez macierz przedmiotów, a kara to najmniejszy iloraz capacity_k / obciążenie_k.
+        """
+        self.evaluations += len(population)
+        totals = population @ self.item_matrix  # Kolumny: suma wartości, obciążenia kolejnych ograniczeń
+        total_values = totals[:, 0]
+        loads = totals[:, 1:]
+
+        overweight = (loads > self.instance.capacities).any(axis=1)
+        fitness = total_values.astype(np.float64)
+        if overweight.any():
+            fitness[overweight] = (self.instance.capacities / loads[overweight]).min(axis=1)
+        return fitness
+
+    def is_feasible(self, genotype):
+        """Czy genotyp (wiersz 0/1) mieści się we wszystkich ograniczeniach (sprawdzenie wag, nie fitnessu)."""
+        return bool((genotype @ self.item_matrix[:, 1:] <= self.instance.capacities).all())
+
+    def solution(self, genotype):
+        """
+        Rozwiązanie dla wiersza macierzy populacji: krotka (lista 0/1, obciążenie, łączna wartość).
+        Obciążenie to int, a przy wielu ograniczeniach lista obciążeń kolejnych ograniczeń.
+        """
+        totals = genotype @ self.item_matrix
+        loads = totals[1:].tolist()
+        return genotype.tolist(), loads[0] if len(loads) == 1 else loads, int(totals[0])
+
+    def best_solution(self):
+        """Najlepsze rozwiązanie całej ewolucji jak w `GeneticAlgorithm.best_solution` (None przed pierwszym pokoleniem)."""
+        if self.best_individual is None:
+            return None
+        return self.solution(self.best_individual) + (self.best_individual_fitness,)
+
+    def fitness_array(self):
+        """Zwraca fitness bieżącej populacji (policzony w ostatnim `evaluate_population`)."""
+        return self.fitness
+
+    def diversity(self):
+        """Różnorodność bieżącej macierzy populacji (średnia znormalizowana odległość Hamminga)."""
+        return population_diversity(self.population)
+
+    # --- METODY SELEKCJI ---
+    # Zwracają tablicę indeksów wierszy populacji tworzących pulę rodziców.
+
+    def selection_roulette_wheel(self):
+        """Metoda selekcji kołem ruletki."""
+        total_fitness = self.fitness.sum()
+
+        if total_fitness == 0:
+            # Sytuacja awaryjna (np. cała populacja ma fitness 0)
+            return self.rng.integers(0, self.population_size, size=self.population_size)
+
+        # Prawdopodobieństwo wyboru jest proporcjonalne do fitnessu
+        return self.rng.choice(self.population_size, size=self.population_size, p=self.fitness / total_fitness)
+
+    def selection_rank(self):
+        """Metoda selekcji rankingowej."""
+        # Indeksy populacji od najgorszego do najlepszego
+        sorted_indices = np.argsort(self.fitness, kind='stable')
+
+        N = self.population_size
+        total_rank_sum = N * (N + 1) / 2  # Suma rang (1 + 2 + ... + N)
+
+        # Prawdopodobieństwo wyboru jest proporcjonalne do miejsca w rankingu
+        selection_probs = np.arange(1, N + 1) / total_rank_sum
+        return sorted_indices[self.rng.choice(N, size=N, p=selection_probs)]
+
+    def selection_stochastic_universal(self):
+        """Próbkowanie stochastyczne uniwersalne (SUS): jedno losowanie, równo rozstawione wskaźniki."""
+        cumulative = np.cumsum(self.fitness)
+        total_fitness = cumulative[-1]
+
+        if total_fitness == 0:
+            # Sytuacja awaryjna (np. cała populacja ma fitness 0)
+            return self.rng.integers(0, self.population_size, size=self.population_size)
+
+        step = total_fitness / self.population_size
+        pointers = self.rng.random() * step + step * np.arange(self.population_size)
+        return np.minimum(np.searchsorted(cumulative, pointers, side='right'), self.population_size - 1)
+
+    def selection_tournament(self):
+        """Selekcja turniejowa: najlepszy z `tournament_size` losowych osobników, dla całej puli naraz."""
+        contestants = self.rng.integers(0, self.population_size, size=(self.population_size, self.tournament_size))
+        winners = np.argmax(self.fitness[contestants], axis=1)
+        return contestants[np.arange(self.population_size), winners]
+
+    # --- METODY KRZYŻOWANIA ---
+    # Operują na całych macierzach rodziców (jeden wiersz = jedna para).
+
+    def _crossover_with_mask(self, parents1, parents2, swap_mask):
+        """Wymienia geny rodziców w miejscach wskazanych przez maskę (tylko dla par, które się krzyżują)."""
+        do_cross = self.rng.random(len(parents1)) <= self.crossover_prob
+        swap_mask &= do_cross[:, None]
+
+        children1 = np.where(swap_mask, parents2, parents1)
+        children2 = np.where(swap_mask, parents1, parents2)
+        return children1, children2
+
+    def crossover_one_point(self, parents1, parents2):
+        """Krzyżowanie jednopunktowe dla wszystkich par naraz."""
+        # Losowanie punktu cięcia (od 1 do przedostatniego bitu) dla każdej pary
+        cut_points = self.rng.integers(1, self.chromosome_length, size=len(parents1))
+
+        positions = np.arange(self.chromosome_length)
+        swap_mask = positions >= cut_points[:, None]
+        return self._crossover_with_mask(parents1, parents2, swap_mask)
+
+    def crossover_two_point(self, parents1, parents2):
+        """Krzyżowanie dwupunktowe dla wszystkich par naraz."""
+        n_pairs = len(parents1)
+
+        # Losowanie dwóch różnych punktów cięcia z zakresu [1, chromosome_length)
+        first = self.rng.integers(1, self.chromosome_length, size=n_pairs)
+        second = self.rng.integers(1, self.chromosome_length - 1, size=n_pairs)
+        second += second >= first
+        p1 = np.minimum(first, second)
+        p2 = np.maximum(first, second)
+
+        # Wymiana "środkowej" części genotypu
+        positions = np.arange(self.chromosome_length)
+        swap_mask = (positions >= p1[:, None]) & (positions < p2[:, None])
+        return self._crossover_with_mask(parents1, parents2, swap_mask)
+
+    # --- METODA MUTACJI ---
+
+    def mutate(self, population):
+        """Mutacja bit-flip całej macierzy naraz (XOR z losową maską)."""
+        flip_mask = self.rng.random(population.shape) < self.mutation_prob
+        return population ^ flip_mask.astype(np.uint8)
+
+    # --- GŁÓWNA PĘTLA EWOLUCJI ---
+
+    def attach_profiler(self):
+        """Podmienia operatory na wersje mierzące czas faz (ocena liczy nowe wiersze populacji)."""
+        profiler = PhaseProfiler()
+        self.mutate = profiler.wrap("mutation", self.mutate)
+        self.evaluate_population = profiler.wrap_evaluation(self.evaluate_population, allocated=len)
+        self.local_search = profiler.wrap("local_search", self.local_search)
+        return profiler
+
+    def replace_population(self, children, children_fitness):
+        """
+        Wstawia ocenione dzieci do populacji: w trybie "steady_state" w miejsce najgorszych wierszy
+        istniejącej macierzy, w trybie pokoleniowym jako nową macierz (poprzedzoną `elitism`
+        najlepszymi wierszami, których fitness nie jest liczony ponownie).
+        """
+        if self.replacement == "steady_state":
+            worst = np.argpartition(self.fitness, len(children) - 1)[:len(children)]
+            self.population[worst] = children
+            self.fitness[worst] = children_fitness
+        elif self.elitism:
+            elite = np.argpartition(-self.fitness, self.elitism - 1)[:self.elitism]
+            self.population = np.concatenate((self.population[elite], children))
+            self.fitness = np.concatenate((self.fitness[elite], children_fitness))
+        else:
+            self.population = children
+            self.fitness = children_fitness
+
+    # --- PRZESZUKIWANIE LOKALNE (ALGORYTM MEMETYCZNY) ---
+
+    def improve_population(self, population, fitness):
+        """
+        Zastępuje w miejscu najlepsze wiersze macierzy `population` (i ich `fitness`) wynikami
+        `local_search`. Odsetek wierszy i budżet ruchów jak w `GeneticAlgorithm.improve_population`.
+        """
+        count = max(1, int(len(population) * self.local_search_fraction))
+        budget = self.local_search_budget or 10 * self.chromosome_length
+        rows = np.argpartition(-fitness, count - 1)[:count]
+        population[rows], fitness[rows] = self.local_search(population[rows], fitness[rows], max(1, budget // count))
+
+    def local_search(self, rows, fitness, max_moves):
+        """
+        Wspinaczka 1-flip/1-swap z `GeneticAlgorithm.local_search` wykonywana naraz dla wszystkich
+        wierszy macierzy `rows` (każdy wiersz wykonuje `max_moves` ruchów). Przedmioty każdego wiersza
+        trzymane są w permutacji `order`: najpierw `inside_count` przedmiotów z plecaka, potem pozostałe,
+        więc losowanie przedmiotu z plecaka lub spoza niego i każdy ruch kosztują O(1) na wiersz.
+        Przy wielu ograniczeniach ruch musi mieścić się w zapasie każdego z nich, a zamianę o zerowym
+        zysku przyjmujemy, gdy nie zwiększa żadnego obciążenia i zmniejsza co najmniej jedno.
+        Niepoprawne wiersze pozostają bez zmian. Zwraca nowe wiersze i ich fitness.
+        """
+        n_rows, length = rows.shape
+        weights = self.item_matrix[:, 1:]
+        values = self.values
+        totals = rows @ self.item_matrix
+        total_values = totals[:, 0].copy()
+        slack = self.instance.capacities - totals[:, 1:]
+        feasible = (slack >= 0).all(axis=1)
+
+        genes = rows.copy()
+        order = np.argsort(genes == 0, axis=1, kind='stable')
+        inside_count = genes.sum(axis=1, dtype=np.int64)
+        row_index = np.arange(n_rows)
+        draws = self.rng.random((max_moves, 2, n_rows))
+        for step in range(max_moves):
+            outside_count = length - inside_count
+            can_move = feasible & (outside_count > 0)
+            if not can_move.any():
+                break
+            # Losowy przedmiot spoza plecaka `j` (pozycja `b` w `order`) i z plecaka `i` (pozycja `a`)
+            b = np.minimum(inside_count + (draws[step, 0] * outside_count).astype(np.int64), length - 1)
+            a = (draws[step, 1] * inside_count).astype(np.int64)
+            j = order[row_index, b]
+            i = order[row_index, a]
+            weight_j = weights[j]
+            value_j = values[j]
+
+            # 1-flip: dołożenie j (przenosimy go na koniec części "w plecaku")
+            flip = can_move & (weight_j <= slack).all(axis=1)
+            if flip.any():
+                f = np.flatnonzero(flip)
+                jf, first_outside = j[f], inside_count[f]
+                order[f, b[f]] = order[f, first_outside]
+                order[f, first_outside] = jf
+                slack[f] -= weight_j[f]
+                total_values[f] += value_j[f]
+                inside_count[f] += 1
+                genes[f, jf] = 1
+
+            # 1-swap: i wypada z plecaka, j do niego trafia (zamiana miejscami w `order`)
+            weight_change = weight_j - weights[i]
+            gain = value_j - values[i]
+            frees_space = (weight_change <= 0).all(axis=1) & (weight_change < 0).any(axis=1)
+            swap = (can_move & ~flip & (inside_count > 0) & (weight_change <= slack).all(axis=1)
+                    & ((gain > 0) | ((gain == 0) & frees_space)))
+            if swap.any():
+                s = np.flatnonzero(swap)
+                order[s, a[s]] = j[s]
+                order[s, b[s]] = i[s]
+                slack[s] -= weight_change[s]
+                total_values[s] += gain[s]
+                genes[s, i[s]] = 0
+                genes[s, j[s]] = 1
+
+        # Ulepszone wiersze (różne od oryginału) liczą się jako nowe oceny, jak `create_individual`
+        improved = (genes != rows).any(axis=1)
+        n_improved = int(improved.sum())
+        self.evaluations += n_improved
+        self.local_search_improvements += n_improved
+        return genes, np.where(improved, total_values, fitness)
+
+    # --- PUNKTY KONTROLNE ---
+
+    def checkpoint_population(self):
+        """
+        Macierz populacji upakowana po 8 genów na bajt (jak w `GeneticAlgorithm`), fitness wierszy
+        i najlepszy wiersz całej ewolucji.
+        """
+        arrays = {
+            "population": np.packbits(self.population, axis=1, bitorder='little'),
+            "fitness": self.fitness,
+        }
+        if self.best_individual is not None:
+            arrays["best_genotype"] = np.packbits(self.best_individual, bitorder='little')
+            arrays["best_fitness"], arrays["best_fitness_is_int"] = encode_numbers([self.best_individual_fitness])
+        return arrays
+
+    def restore_population(self, arrays):
+        """Odtwarza macierz populacji i jej fitness z tablic zapisanych przez `checkpoint_population`."""
+        self.population = np.unpackbits(arrays["population"], axis=1, count=self.chromosome_length,
+                                        bitorder='little')
+        self.fitness = arrays["fitness"].astype(np.float64)
+        self.best_individual = None
+        if "best_genotype" in arrays:
+            self.best_individual = np.unpackbits(arrays["best_genotype"], count=self.chromosome_length,
+                                                 bitorder='little')
+            self.best_individual_fitness = decode_numbers(arrays["best_fitness"], arrays["best_fitness_is_int"])[0]
+
+    def run_evolution(self, selection_method, crossover_method, checkpoint_path=None, checkpoint_interval=None):
+        """
+        Uruchamia główną pętlę algorytmu genetycznego na `iterations` pokoleń.
+        Punkt kontrolny (`checkpoint_path`) działa jak w `GeneticAlgorithm.run_evolution`.
+        """
+        print(f"Start ewolucji (NumPy): Selekcja={selection_method.__name__}, Krzyżowanie={crossover_method.__name__}")
+
+        # Resetowanie populacji na początku każdego eksperymentu
+        self.population = self.create_initial_population()
+        self.fitness = None
+        self.best_individual = None
+        self.generation = 0
+        self.evaluations = 0
+        self.local_search_improvements = 0
+        self.stopping_criteria.start()
+        if self.adaptive_control is not None:
+            self.adaptive_control.start()
+        self.stop_reason = "iterations"
+        self.reported_evaluations = 0
+        self.statistics = HistoryRecorder(self.iterations)
+
+        # Pomiar czasu faz tylko przy podłączonych hookach telemetrii
+        self.profiler = self.attach_profiler() if self.hooks else None
+        return self.evolution_loop(selection_method, crossover_method, checkpoint_path, checkpoint_interval)
+
+    def run_generations(self, selection_method, crossover_method, checkpoint_path=None, checkpoint_interval=None):
+        """Właściwa pętla pokoleń wywoływana przez `evolution_loop` (od pokolenia `self.generation`)."""
+        statistics = self.statistics
+        profiler = self.profiler
+        if profiler is not None:
+            selection_method = profiler.wrap("selection", selection_method)
+            crossover_method = profiler.wrap("crossover", crossover_method)
+        adaptive = self.adaptive_control
+        methods = self.adaptive_methods() if adaptive is not None else None
+
+        # Liczba dzieci w pokoleniu i par potrzebnych do ich utworzenia
+        n_children = self.offspring_count()
+        n_pairs = (n_children + 1) // 2
+
+        # Populacja początkowa jest oceniana raz; dalej oceniane są tylko nowe dzieci
+        # (po wznowieniu fitness pochodzi z punktu kontrolnego)
+        if self.fitness is None:
+            self.fitness = self.evaluate_population(self.population)
+
+        for i in range(self.generation, self.iterations):
+            # 1. Zapis statystyk bieżącej populacji
+            best_index = int(np.argmax(self.fitness))
+            current_fitness = self.fitness[best_index]
+            # Poprawne rozwiązania są w historii jako int (tak jak w wersji obiektowej); o poprawności decydują
+            # wagi, a nie wartość fitnessu (poprawny plecak o wartości 0 to też int)
+            feasible = self.is_feasible(self.population[best_index])
+            best_value = int(current_fitness) if feasible else float(current_fitness)
+            diversity = population_diversity(self.population)
+            statistics.record(i, current_fitness, feasible, self.fitness.mean(), diversity)
+            if self.best_individual is None or current_fitness > self.best_individual_fitness:
+                self.best_individual = self.population[best_index].copy()
+                self.best_individual_fitness = best_value
+            if profiler is not None:
+                self.report_generation(i)
+
+            # Logowanie postępów co 20 generacji
+            if (i + 1) % 20 == 0:
+                if not feasible:
+                    print(f"Iteracja {i+1}/{self.iterations}: Najlepszy Fitness = {current_fitness:.4f} (ciągle niepoprawny)")
+                else:
+                    print(f"Iteracja {i+1}/{self.iterations}: Najlepszy Fitness = {int(current_fitness)}")
+
+            # Sprawdzenie warunków wcześniejszego zakończenia
+            reason = self.stopping_criteria.check(i, best_value, self.evaluations, lambda: diversity)
+            if reason is not None:
+                self.stop_reason = reason
+                print(f"Wcześniejsze zakończenie w iteracji {i+1}: {reason}")
+                break
+
+            # 2. Selekcja -> indeksy puli rodziców (przy sterowaniu adaptacyjnym operatory wybiera bandyta)
+            if adaptive is not None:
+                selection_name, crossover_name = adaptive.choose(self.random)
+                selection_method, crossover_method = methods[selection_name], methods[crossover_name]
+                previous_fitness = self.fitness.copy()
+            parents_pool = selection_method()
+
+            # 3. Losowanie par (dwa różne miejsca w puli, jak random.sample)
+            first = self.rng.integers(0, self.population_size, size=n_pairs)
+            second = (first + self.rng.integers(1, self.population_size, size=n_pairs)) % self.population_size
+            parents1 = self.population[parents_pool[first]]
+            parents2 = self.population[parents_pool[second]]
+
+            # 4. Krzyżowanie i mutacja wszystkich par naraz (nadmiarowe drugie dziecko jest odrzucane)
+            children1, children2 = crossover_method(parents1, parents2)
+            children = np.empty((2 * n_pairs, self.chromosome_length), dtype=np.uint8)
+            children[0::2] = children1
+            children[1::2] = children2
+            children = self.mutate(children[:n_children])
+            children_fitness = self.evaluate_population(children)
+
+            # 5. Zastąpienie populacji i opcjonalne przeszukiwanie lokalne najlepszych wierszy
+            self.replace_population(children, children_fitness)
+            if self.local_search_fraction:
+                self.improve_population(self.population, self.fitness)
+            if adaptive is not None:
+                adaptive.record(self, i, previous_fitness, children_fitness)
+            self.generation = i + 1
+
+            # 6. Okresowy punkt kontrolny (stan na początku następnego pokolenia)
+            if checkpoint_path and checkpoint_interval and self.generation % checkpoint_interval == 0:
+                self.save_checkpoint(checkpoint_path, selection_method, crossover_method, checkpoint_interval)
+
+        print("Ewolucja zakończona.")
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path, selection_method, crossover_method, checkpoint_interval,
+                                 finished=True)
+        if self.local_search_fraction:
+            print(f"Przeszukiwanie lokalne: ulepszono {self.local_search_improvements} osobników")
+        return self.evolution_history()